@@ -0,0 +1,31 @@
+# File: BelnderGenAI/core/graph_layout.py
+
+"""Automatic graph layout for generated architecture diagrams.
+
+The layout engines are SceneX's ``src/scene/graph_layout.py`` (see
+``scenex.load_scenex_module``); the configs here only change defaults so
+positions come out in SVG units, with y growing downwards, and can
+replace the coordinates produced by the LLM before components are built.
+"""
+
+from dataclasses import dataclass
+from .scenex import load_scenex_module
+
+_graph_layout = load_scenex_module("scenex_graph_layout", "scene/graph_layout.py")
+
+LayeredLayout = _graph_layout.LayeredLayout
+ForceDirectedLayout = _graph_layout.ForceDirectedLayout
+
+@dataclass
+class LayeredLayoutConfig(_graph_layout.LayeredLayoutConfig):
+    """Layered layout configuration in SVG units"""
+    layer_spacing: float = 160.0
+    node_spacing: float = 140.0
+    y_down: bool = True
+
+@dataclass
+class ForceLayoutConfig(_graph_layout.ForceLayoutConfig):
+    """Force-directed layout configuration in SVG units"""
+    ideal_distance: float = 150.0
+
+__all__ = ['ForceDirectedLayout', 'ForceLayoutConfig', 'LayeredLayout', 'LayeredLayoutConfig']
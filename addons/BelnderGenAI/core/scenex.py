@@ -0,0 +1,36 @@
+# File: BelnderGenAI/core/scenex.py
+
+"""Access to SceneX's Blender-independent modules.
+
+BelnderGenAI shares SceneX's parsers and layout engines instead of
+keeping copies. Those modules are pure Python, so they are loaded
+straight from their files, found under ``SCENEX_PATH`` or in the SceneX
+addon next to this one.
+"""
+
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+def load_scenex_module(name: str, relative_path: str):
+    """Load ``<SceneX>/src/<relative_path>`` once, as module ``name``"""
+    if name in sys.modules:
+        return sys.modules[name]
+    roots = [os.getenv('SCENEX_PATH', ''), Path(__file__).resolve().parents[2] / "SceneX"]
+    for root in roots:
+        if not root:
+            continue
+        path = Path(root) / "src" / relative_path
+        if path.exists():
+            spec = importlib.util.spec_from_file_location(name, path)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[name] = module  # Dataclasses resolve their module by name
+            try:
+                spec.loader.exec_module(module)
+            except Exception:
+                del sys.modules[name]
+                raise
+            return module
+    raise ImportError(f"SceneX's src/{relative_path} not found; "
+                      "set SCENEX_PATH to the SceneX addon directory")
@@ -1,22 +1,58 @@
 import bpy
 import xml.etree.ElementTree as ET
 import math
-from typing import Dict, List, Optional, Tuple
+import numpy as np
+from dataclasses import replace
+from typing import Dict, List, Optional, Tuple, Union
 from mathutils import Vector
+from .graph_layout import (
+    ForceDirectedLayout,
+    ForceLayoutConfig,
+    LayeredLayout,
+    LayeredLayoutConfig
+)
+from .svg_path import (
+    SVGPathError,
+    SVGSubpath,
+    apply_affine,
+    flatten_subpath,
+    multiply_affine,
+    parse_path,
+    parse_transform,
+    shape_to_path
+)
+
+CONNECTION_TAGS = {'path', 'line', 'polyline'}
 
 class SVGToSceneConverter:
-    def __init__(self):
+    def __init__(self, auto_layout: bool = False,
+                 layout_config: Optional[Union[LayeredLayoutConfig, ForceLayoutConfig]] = None,
+                 layout_mode: str = 'LAYERED',
+                 animate_settle: bool = False,
+                 debug: bool = False):
         self.components = []
         self.connections = []
         self.ns = {'svg': 'http://www.w3.org/2000/svg'}
         self.scale_factor = 0.01  # Reduced scale for better sizing
         self.component_depth = 0.2
         self.connection_thickness = 0.02
+        self.flatten_tolerance = 0.5  # Max deviation of flattened curves, in SVG units
+        self.auto_layout = auto_layout  # Replace LLM coordinates with a computed layout
+        self.layout_config = layout_config
+        self.layout_mode = layout_mode  # LAYERED or FORCE
+        self.animate_settle = animate_settle  # Keyframe FORCE iterations
+        self.settle_frame_step = 2
+        self.debug = debug  # Dump the parsed SVG tree while converting
+        self._layout_edges = {}
+        self._settle_snapshots = []
+        self._materials = {}
+        self._subpaths = {}
         
-    def create_component(self, element: ET.Element) -> Optional[bpy.types.Object]:
+    def create_component(self, element: ET.Element,
+                         center: Optional[Tuple[float, float]] = None) -> Optional[bpy.types.Object]:
         try:
             rect = element.find('svg:rect', self.ns)
-            if not rect:
+            if rect is None:
                 return None
 
             # Get component info
@@ -28,35 +64,33 @@ class SVGToSceneConverter:
             y = -float(rect.get('y', 0))  # Invert Y coordinate
             width = float(rect.get('width', 64))
             height = float(rect.get('height', 64))
+            if center is not None:
+                x = center[0] - width/2
+                y = -(center[1] - height/2)
             
             # Calculate center position
             center_x = (x + width/2) * self.scale_factor
             center_y = (y - height/2) * self.scale_factor
             
-            # Create cube
-            bpy.ops.mesh.primitive_cube_add(location=(center_x, center_y, 0))
-            obj = bpy.context.active_object
-            obj.name = f"{service_type}_{component_id}"
+            # Linked duplicate of the shared cube; convert() links it to the scene
+            obj = bpy.data.objects.new(f"{service_type}_{component_id}", self._cube_mesh())
+            obj.location = (center_x, center_y, 0)
             
             # Scale to match SVG dimensions
             obj.scale = (width * self.scale_factor / 2, 
                         height * self.scale_factor / 2,
                         self.component_depth)
             
-            # Set up material
-            mat = bpy.data.materials.new(name=f"{obj.name}_material")
-            mat.use_nodes = True
-            nodes = mat.node_tree.nodes
-            principled = nodes["Principled BSDF"]
-            
             # Set color based on service type
             if service_type == "lambda":
                 color = (0.95, 0.45, 0.1, 1.0)  # Orange
             else:
                 color = (0.45, 0.2, 0.95, 1.0)  # Purple
-                
-            principled.inputs["Base Color"].default_value = color
-            obj.data.materials.append(mat)
+
+            # Material on the object slot, since the mesh is shared
+            slot = obj.material_slots[0]
+            slot.link = 'OBJECT'
+            slot.material = self._material(f"{service_type}_material", color)
             
             self.components.append(obj)
             return obj
@@ -65,52 +99,39 @@ class SVGToSceneConverter:
             print(f"Component creation error: {str(e)}")
             return None
 
-    def create_connection(self, element: ET.Element) -> Optional[bpy.types.Object]:
+    def create_connection(self, element: ET.Element,
+                          route: Optional[List[Tuple[float, float]]] = None) -> Optional[bpy.types.Object]:
         try:
-            path_data = element.get('d', '')
-            if not path_data:
-                return None
-                
-            # Parse path data
-            points = []
-            for cmd_match in path_data.split():
-                if cmd_match.startswith('M') or cmd_match.startswith('L'):
-                    coords = cmd_match[1:].split(',')
-                    if len(coords) >= 2:
-                        x = float(coords[0])
-                        y = float(coords[1])
-                        points.append((
-                            x * self.scale_factor,
-                            -y * self.scale_factor,
-                            0
-                        ))
-                        
-            if len(points) < 2:
+            # Polylines in Blender units, one spline each
+            if route is not None:
+                polylines = [np.asarray(route, dtype=np.float64) * (self.scale_factor, -self.scale_factor)]
+            else:
+                transform = multiply_affine((self.scale_factor, 0, 0, -self.scale_factor, 0, 0),
+                                            parse_transform(element.get('transform')))
+                polylines = [flatten_subpath(subpath, transform, self.flatten_tolerance)
+                             for subpath in self._connection_subpaths(element)]
+            polylines = [points for points in polylines if len(points) >= 2]
+            if not polylines:
                 return None
                 
             # Create curve object
             curve = bpy.data.curves.new('connection', 'CURVE')
             curve.dimensions = '3D'
             
-            # Create spline
-            spline = curve.splines.new('POLY')
-            spline.points.add(len(points) - 1)
-            
-            # Set points
-            for i, point in enumerate(points):
-                spline.points[i].co = (*point, 1)
+            for points in polylines:
+                # One allocation per spline, filled with foreach_set
+                spline = curve.splines.new('POLY')
+                spline.points.add(len(points) - 1)
+                co = np.zeros((len(points), 4), dtype=np.float32)
+                co[:, :2] = points
+                co[:, 3] = 1.0
+                spline.points.foreach_set("co", co.ravel())
                 
             # Create curve object
             curve_obj = bpy.data.objects.new('connection', curve)
             curve_obj.data.bevel_depth = self.connection_thickness
             
-            # Create material
-            mat = bpy.data.materials.new(name="connection_material")
-            mat.use_nodes = True
-            nodes = mat.node_tree.nodes
-            principled = nodes["Principled BSDF"]
-            principled.inputs["Base Color"].default_value = (0.1, 0.1, 0.1, 1.0)
-            curve_obj.data.materials.append(mat)
+            curve_obj.data.materials.append(self._material("connection_material", (0.1, 0.1, 0.1, 1.0)))
             
             bpy.context.scene.collection.objects.link(curve_obj)
             self.connections.append(curve_obj)
@@ -120,33 +141,73 @@ class SVGToSceneConverter:
             print(f"Connection creation error: {str(e)}")
             return None
 
+    def _connection_subpaths(self, element: ET.Element) -> List[SVGSubpath]:
+        """Parsed subpaths of a connection (path, line or polyline), in SVG units"""
+        if element not in self._subpaths:
+            tag = element.tag.rsplit('}', 1)[-1]
+            path_data = element.get('d', '') if tag == 'path' else shape_to_path(tag, element.attrib)
+            try:
+                self._subpaths[element] = parse_path(path_data or '')
+            except SVGPathError as e:
+                print(f"Connection path error: {str(e)}")
+                self._subpaths[element] = []
+        return self._subpaths[element]
+
     def convert(self, svg_content: str) -> Dict[str, List[bpy.types.Object]]:
         try:
             self.components = []
             self.connections = []
+            self._materials = {}
+            self._subpaths = {}
             
             # Parse SVG
             root = ET.fromstring(svg_content)
-            print("Parsed SVG structure:")
-            self._print_element(root)
+            if self.debug:
+                print("Parsed SVG structure:")
+                self._print_element(root)
             
             # Process components
             components = root.findall(".//svg:g[@class='component aws-component']", self.ns)
             print(f"\nFound {len(components)} component elements")
             
-            for comp in components:
-                print("\nProcessing component element:")
-                self._print_element(comp)
-                self.create_component(comp)
-                
             # Process connections
-            paths = root.findall(".//svg:path[@class='connection']", self.ns)
+            paths = [element for element in root.iter()
+                     if element.get('class') == 'connection'
+                     and element.tag.rsplit('}', 1)[-1] in CONNECTION_TAGS]
             print(f"\nFound {len(paths)} connection paths")
+
+            centers, routes = {}, {}
+            self._layout_edges, self._settle_snapshots = {}, []
+            if self.auto_layout:
+                centers, routes = self._compute_layout(components, paths)
             
+            # Layout results are keyed by component index; ids may be missing or repeated
+            objects_by_index = {}
+            for index, comp in enumerate(components):
+                if self.debug:
+                    print("\nProcessing component element:")
+                    self._print_element(comp)
+                obj = self.create_component(comp, centers.get(index))
+                if obj:
+                    objects_by_index[index] = obj
+
+            # Link all components at once rather than one operator call each
+            collection = bpy.context.scene.collection
+            for obj in self.components:
+                collection.objects.link(obj)
+
+            if self._settle_snapshots:
+                self._animate_settle(objects_by_index, self._settle_snapshots)
+                
             for path in paths:
-                print("\nProcessing connection element:")
-                self._print_element(path)
-                self.create_connection(path)
+                if self.debug:
+                    print("\nProcessing connection element:")
+                    self._print_element(path)
+                connection = self.create_connection(path, routes.get(path))
+                if connection and self._settle_snapshots and path in self._layout_edges:
+                    start, end = self._layout_edges[path]
+                    if start in objects_by_index and end in objects_by_index:
+                        self._hook_connection(connection, objects_by_index[start], objects_by_index[end])
                 
             return {
                 'components': self.components,
@@ -157,6 +218,122 @@ class SVGToSceneConverter:
             print(f"Conversion error: {str(e)}")
             return {'components': [], 'connections': []}
             
+    def _compute_layout(self, components: List[ET.Element], paths: List[ET.Element]):
+        """Layered or force-directed layout of the component graph, in SVG units.
+
+        Connections are attached to the components nearest to their end
+        points; the returned routes run between component borders. Centers
+        are keyed by the index of the component in ``components``.
+        """
+        rects = {}
+        for index, comp in enumerate(components):
+            rect = comp.find('svg:rect', self.ns)
+            if rect is None:
+                continue
+            rects[index] = (
+                float(rect.get('x', 0)), float(rect.get('y', 0)),
+                float(rect.get('width', 64)), float(rect.get('height', 64)))
+
+        index = _RectIndex(rects)
+        edges = {}
+        for path in paths:
+            subpaths = self._connection_subpaths(path)
+            if not subpaths:
+                continue
+            transform = parse_transform(path.get('transform'))
+            last_subpath = subpaths[-1]
+            first = apply_affine(transform, subpaths[0].start)
+            last = apply_affine(transform, last_subpath.segments[-1][2] if last_subpath.segments
+                                else last_subpath.start)
+            start = index.nearest(first[0], first[1])
+            end = index.nearest(last[0], last[1])
+            if start is not None and end is not None and start != end:
+                edges[path] = (start, end)
+
+        self._layout_edges = edges
+        if self.layout_mode == 'FORCE':
+            config = self.layout_config or ForceLayoutConfig()
+            if self.animate_settle and not config.record_every:
+                config = replace(config, record_every=5)
+            layout = ForceDirectedLayout(config)
+            initial = {key: (x + w/2, y + h/2) for key, (x, y, w, h) in rects.items()}
+            centers = layout.compute(rects.keys(), edges.values(), initial=initial)
+            edge_routes = {pair: [centers[pair[0]], centers[pair[1]]] for pair in edges.values()}
+            if self.animate_settle:
+                self._settle_snapshots = layout.snapshots
+            print(f"Force layout settled after {layout.iterations_run} iterations")
+        else:
+            layout = LayeredLayout(self.layout_config)
+            centers = layout.compute(rects.keys(), edges.values())
+            edge_routes = layout.edge_routes
+
+        routes = {}
+        for path, (start, end) in edges.items():
+            route = list(edge_routes[(start, end)])
+            route[0] = self._clip_to_rect(route[0], route[1], rects[start])
+            route[-1] = self._clip_to_rect(route[-1], route[-2], rects[end])
+            routes[path] = route
+        return centers, routes
+
+    def _animate_settle(self, objects_by_index: Dict[int, bpy.types.Object],
+                        snapshots: List[Dict[int, Tuple[float, float]]]):
+        """Keyframe recorded layout iterations so components settle into place"""
+        start_frame = bpy.context.scene.frame_start
+        for i, snapshot in enumerate(snapshots):
+            frame = start_frame + i * self.settle_frame_step
+            for index, obj in objects_by_index.items():
+                x, y = snapshot[index]
+                obj.location.x = x * self.scale_factor
+                obj.location.y = -y * self.scale_factor
+                obj.keyframe_insert(data_path="location", frame=frame)
+        bpy.context.view_layer.update()
+
+    def _hook_connection(self, connection: bpy.types.Object,
+                         start_obj: bpy.types.Object, end_obj: bpy.types.Object):
+        """Hook connection end points to their components so they follow the settle animation"""
+        last = len(connection.data.splines[0].points) - 1
+        for point_index, target in ((0, start_obj), (last, end_obj)):
+            hook = connection.modifiers.new(name=f"hook_{target.name}", type='HOOK')
+            hook.object = target
+            hook.vertex_indices_set([point_index])
+            hook.matrix_inverse = target.matrix_world.inverted()
+
+    def _cube_mesh(self) -> bpy.types.Mesh:
+        """Unit cube (size 2, like primitive_cube_add) shared by all components"""
+        mesh = bpy.data.meshes.get("svg_component_cube")
+        if mesh is None:
+            mesh = bpy.data.meshes.new("svg_component_cube")
+            verts = [(x, y, z) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)]
+            faces = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1),
+                     (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+            mesh.from_pydata(verts, [], faces)
+            mesh.update()
+            mesh.materials.append(None)  # Slot for the per-object service material
+        return mesh
+
+    def _material(self, name: str, color: Tuple[float, float, float, float]) -> bpy.types.Material:
+        """Material shared by every object of one service (or all connections)"""
+        mat = self._materials.get(name)
+        if mat is None:
+            mat = bpy.data.materials.new(name=name)
+            mat.use_nodes = True
+            principled = mat.node_tree.nodes["Principled BSDF"]
+            principled.inputs["Base Color"].default_value = color
+            self._materials[name] = mat
+        return mat
+
+    @staticmethod
+    def _clip_to_rect(center, toward, rect):
+        """Point where the segment center -> toward leaves a rect of the given size"""
+        dx, dy = toward[0] - center[0], toward[1] - center[1]
+        half_w, half_h = rect[2] / 2, rect[3] / 2
+        scales = [s for s in (half_w / abs(dx) if dx else None,
+                              half_h / abs(dy) if dy else None) if s is not None]
+        if not scales:
+            return center
+        t = min(1.0, min(scales))
+        return (center[0] + dx * t, center[1] + dy * t)
+
     def _print_element(self, elem: ET.Element, level: int = 0):
         indent = "  " * level
         print(f"{indent}Tag: {elem.tag}")
@@ -164,4 +341,33 @@ class SVGToSceneConverter:
         if elem.text and elem.text.strip():
             print(f"{indent}Text: {elem.text.strip()}")
         for child in elem:
-            self._print_element(child, level + 1)
\ No newline at end of file
+            self._print_element(child, level + 1)
+
+
+class _RectIndex:
+    """Uniform grid over component rects for nearest-component queries."""
+
+    def __init__(self, rects: Dict[int, Tuple[float, float, float, float]], cell: float = 128.0):
+        self.rects = rects
+        self.cell = cell
+        self.cells = {}
+        for key, (x, y, w, h) in rects.items():
+            for cx in range(int(x // cell), int((x + w) // cell) + 1):
+                for cy in range(int(y // cell), int((y + h) // cell) + 1):
+                    self.cells.setdefault((cx, cy), []).append(key)
+
+    def nearest(self, px: float, py: float) -> Optional[int]:
+        cx, cy = int(px // self.cell), int(py // self.cell)
+        candidates = {key for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+                      for key in self.cells.get((cx + dx, cy + dy), ())}
+        if not candidates:
+            candidates = self.rects.keys()
+        best, best_distance = None, float('inf')
+        for key in candidates:
+            x, y, w, h = self.rects[key]
+            dx = max(x - px, 0, px - (x + w))
+            dy = max(y - py, 0, py - (y + h))
+            distance = dx * dx + dy * dy
+            if distance < best_distance:
+                best, best_distance = key, distance
+        return best
@@ -0,0 +1,25 @@
+# File: BelnderGenAI/core/svg_path.py
+
+"""SVG path data and transform parsing for generated diagrams.
+
+Re-exports SceneX's ``src/geometry/svg_path.py`` so both addons share one
+parser (see ``scenex.load_scenex_module``).
+"""
+
+from .scenex import load_scenex_module
+
+_svg_path = load_scenex_module("scenex_svg_path", "geometry/svg_path.py")
+
+IDENTITY = _svg_path.IDENTITY
+SVGPathError = _svg_path.SVGPathError
+SVGSubpath = _svg_path.SVGSubpath
+apply_affine = _svg_path.apply_affine
+flatten_subpath = _svg_path.flatten_subpath
+multiply_affine = _svg_path.multiply_affine
+parse_path = _svg_path.parse_path
+parse_transform = _svg_path.parse_transform
+shape_to_path = _svg_path.shape_to_path
+tokenize_path = _svg_path.tokenize_path
+
+__all__ = ['IDENTITY', 'SVGPathError', 'SVGSubpath', 'apply_affine', 'flatten_subpath',
+           'multiply_affine', 'parse_path', 'parse_transform', 'shape_to_path', 'tokenize_path']
@@ -9,7 +9,7 @@ import os
 import bpy
 import anthropic
 from bpy.types import Operator, Panel
-from bpy.props import StringProperty, EnumProperty
+from bpy.props import BoolProperty, StringProperty, EnumProperty
 from ..core.svg_converter import SVGToSceneConverter
 
 
@@ -55,7 +55,16 @@ class CLAUDE_OT_GenerateSVG(Operator):
             )
 
             svg_content = response.content[0].text
-            converter = SVGToSceneConverter()
+            scene_type = context.scene.scene_type
+            if scene_type in {'NETWORK', 'AI'}:
+                # Topologies have no natural layering; let them settle by force
+                converter = SVGToSceneConverter(
+                    auto_layout=True,
+                    layout_mode='FORCE',
+                    animate_settle=context.scene.claude_animate_layout
+                )
+            else:
+                converter = SVGToSceneConverter()
             converter.convert(svg_content)
 
             self.report({'INFO'}, "Scene generated successfully")
@@ -102,6 +111,10 @@ class CLAUDE_PT_Panel(Panel):
             options={'TEXTEDIT_UPDATE'}
         )
         
+        # Force layout animation toggle
+        if context.scene.scene_type in {'NETWORK', 'AI'}:
+            layout.prop(context.scene, "claude_animate_layout")
+
         # Generate button
         layout.operator("claude.generate_svg")
 
@@ -126,6 +139,12 @@ def register():
         default='AWS'
     )
 
+    bpy.types.Scene.claude_animate_layout = BoolProperty(
+        name="Animate Layout",
+        description="Keyframe the force layout iterations so components settle into place",
+        default=False
+    )
+
     bpy.utils.register_class(CLAUDE_OT_GenerateSVG)
     bpy.utils.register_class(CLAUDE_PT_Panel)
 
@@ -136,3 +155,4 @@ def unregister():
     
     del bpy.types.Scene.claude_prompt
     del bpy.types.Scene.scene_type
+    del bpy.types.Scene.claude_animate_layout
@@ -0,0 +1,60 @@
+# File: BelnderGenAI/tests/benchmark_svg_connections.py
+
+import bpy
+import sys
+import time
+from pathlib import Path
+
+# Add the addon directory to the path
+addon_dir = Path(__file__).resolve().parent.parent
+if str(addon_dir) not in sys.path:
+    sys.path.append(str(addon_dir))
+
+from core.svg_converter import SVGToSceneConverter
+from core.svg_path import flatten_subpath, parse_path
+
+CORPUS_DIR = Path(__file__).resolve().parent / "svg_corpus"
+
+# Components and connections every corpus file must produce
+EXPECTED = {
+    "serverless_spaced.svg": (3, 2),
+    "pipeline_compact.svg": (4, 3),
+    "relative_curves.svg": (3, 3),
+    "mixed_elements.svg": (4, 4),
+    "exponent_and_implicit.svg": (3, 3),
+}
+
+def clear_scene():
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+
+def check_corpus() -> bool:
+    """Regression: every LLM-style SVG converts with all of its connections"""
+    ok = True
+    for name, (components, connections) in EXPECTED.items():
+        clear_scene()
+        result = SVGToSceneConverter().convert((CORPUS_DIR / name).read_text())
+        got = (len(result['components']), len(result['connections']))
+        status = "ok" if got == (components, connections) else "FAILED"
+        ok &= got == (components, connections)
+        print(f"{name}: {got[0]} components, {got[1]} connections [{status}]")
+    return ok
+
+def benchmark_parsing(repeat: int = 2000):
+    """Throughput of tokenizing and flattening connection path data"""
+    paths = ["M 164 132 L 300 132", "M364 232h78v-100h78", "m124 92c140 0 140 200 276 200",
+             "M124,452 a200,160 0 0,0 308,-128", "M92,124 Q 20 270 92 420"]
+    start = time.perf_counter()
+    points = 0
+    for _ in range(repeat):
+        for path_data in paths:
+            for subpath in parse_path(path_data):
+                points += len(flatten_subpath(subpath))
+    elapsed = time.perf_counter() - start
+    count = repeat * len(paths)
+    print(f"Parsed and flattened {count} connection paths ({points} points) in {elapsed:.2f}s "
+          f"({count / elapsed:.0f} paths/s)")
+
+if __name__ == "__main__":
+    print("Corpus regression passed" if check_corpus() else "Corpus regression FAILED")
+    benchmark_parsing()
@@ -0,0 +1,50 @@
+# File: BelnderGenAI/tests/benchmark_svg_converter.py
+
+import bpy
+import sys
+import time
+from pathlib import Path
+
+# Add the addon directory to the path
+addon_dir = Path(__file__).resolve().parent.parent
+if str(addon_dir) not in sys.path:
+    sys.path.append(str(addon_dir))
+
+from core.svg_converter import SVGToSceneConverter
+
+SERVICES = ["lambda", "s3", "dynamodb", "sqs", "apigateway"]
+
+def architecture_svg(component_count: int = 1000, columns: int = 40) -> str:
+    """Grid of AWS components, each connected to its right and lower neighbour"""
+    parts = ['<svg width="8000" height="8000" xmlns="http://www.w3.org/2000/svg">']
+    for i in range(component_count):
+        x, y = 100 + (i % columns) * 160, 100 + (i // columns) * 160
+        parts.append(
+            f'<g class="component aws-component" data-service="{SERVICES[i % len(SERVICES)]}" id="c{i}">'
+            f'<rect x="{x}" y="{y}" width="64" height="64" class="component"/>'
+            f'<text x="{x + 32}" y="{y + 80}">Component {i}</text></g>')
+        if i % columns != columns - 1 and i + 1 < component_count:
+            parts.append(f'<path class="connection" d="M{x + 64},{y + 32} L{x + 160},{y + 32}"/>')
+        if i + columns < component_count:
+            parts.append(f'<path class="connection" d="M{x + 32},{y + 64} L{x + 32},{y + 160}"/>')
+    parts.append('</svg>')
+    return "\n".join(parts)
+
+def benchmark_convert(component_count: int = 1000):
+    svg_content = architecture_svg(component_count)
+    converter = SVGToSceneConverter()
+
+    start = time.perf_counter()
+    result = converter.convert(svg_content)
+    elapsed = time.perf_counter() - start
+
+    materials = {slot.material for obj in result['components'] for slot in obj.material_slots}
+    meshes = {obj.data for obj in result['components']}
+    print(f"Converted {len(result['components'])} components and {len(result['connections'])} "
+          f"connections in {elapsed:.3f}s ({len(meshes)} mesh, {len(materials)} component materials)")
+    return elapsed
+
+if __name__ == "__main__":
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+    benchmark_convert()
@@ -0,0 +1,230 @@
+# SceneX/src/animation/updaters.py
+import bpy
+import heapq
+import time
+from bisect import bisect_right
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from .rate_functions import RateFunc
+from ..utils.logger import SceneXLogger
+
+class ValueTracker:
+    """A number that changes over the timeline (Manim's ValueTracker).
+
+    Segments added with ``animate_to`` are evaluated in Python for any
+    frame, so updaters reading the tracker need no depsgraph evaluation.
+    """
+    def __init__(self, value: float = 0.0):
+        self.initial = float(value)
+        self.frames: List[int] = []  # Segment end frames, sorted
+        self.segments: List[Tuple[int, int, float, float, Callable[[float], float]]] = []
+        self.frame = None
+
+    def animate_to(self, value: float, start_frame: int, end_frame: int,
+                   rate_func: Callable[[float], float] = RateFunc.smooth) -> "ValueTracker":
+        start_value = self.get_value(start_frame)
+        index = bisect_right(self.frames, end_frame)
+        self.frames.insert(index, end_frame)
+        self.segments.insert(index, (start_frame, end_frame, start_value, float(value), rate_func))
+        return self
+
+    def set_value(self, value: float) -> "ValueTracker":
+        """Constant value, dropping all animated segments"""
+        self.initial = float(value)
+        self.frames.clear()
+        self.segments.clear()
+        return self
+
+    def get_value(self, frame: Optional[float] = None) -> float:
+        if frame is None:
+            frame = self.frame if self.frame is not None else bpy.context.scene.frame_current
+        index = bisect_right(self.frames, frame)
+        if index < len(self.segments):
+            start, end, low, high, rate_func = self.segments[index]
+            if frame >= start:
+                return low + (high - low) * rate_func((frame - start) / max(end - start, 1))
+        if index:
+            return self.segments[index - 1][3]
+        return self.initial
+
+
+class Updater:
+    """One update function bound to its target"""
+    __slots__ = ("target", "function", "depends_on", "name")
+
+    def __init__(self, target: Any, function: Callable[[Any, float], None],
+                 depends_on: Sequence[Any] = (), name: Optional[str] = None):
+        self.target = target
+        self.function = function
+        self.depends_on = tuple(depends_on)
+        self.name = name or getattr(function, "__name__", "updater")
+
+
+class UpdaterGraph:
+    """Per-frame updaters evaluated in dependency order from one frame handler.
+
+    ``function(target, frame)`` runs after every updater of the targets
+    listed in ``depends_on``; ValueTrackers listed there read the
+    dispatched frame. The order is sorted topologically once per
+    change of the graph, so dispatching a frame is a flat loop; targets
+    with a ``sync`` method (Mobjects) are synced afterwards.
+    """
+    HANDLER_NAME = "scenex_updater_dispatch"
+
+    def __init__(self):
+        self.updaters: List[Updater] = []
+        self._order: Optional[List[Tuple[Callable, Any]]] = None
+        self._synced: List[Any] = []
+        self.trackers: List[ValueTracker] = []
+        self.last_dispatch = 0.0  # Seconds spent in the most recent frame
+        self.logger = SceneXLogger("Updaters")
+
+    def add_updater(self, target: Any, function: Callable[[Any, float], None],
+                    depends_on: Sequence[Any] = (), name: Optional[str] = None) -> Updater:
+        updater = Updater(target, function, depends_on, name)
+        self.updaters.append(updater)
+        self._order = None
+        return updater
+
+    def remove_updater(self, updater: Updater):
+        self.updaters.remove(updater)
+        self._order = None
+
+    def clear_updaters(self, target: Any = None):
+        """Remove the updaters of ``target``, or all of them"""
+        self.updaters = [u for u in self.updaters if target is not None and u.target is not target]
+        self._order = None
+
+    def order(self) -> List[Updater]:
+        """Updaters sorted so that dependencies run first (Kahn's algorithm)"""
+        by_target: Dict[int, List[int]] = {}
+        for i, updater in enumerate(self.updaters):
+            by_target.setdefault(id(updater.target), []).append(i)
+
+        dependents: List[List[int]] = [[] for _ in self.updaters]
+        pending = [0] * len(self.updaters)
+        for i, updater in enumerate(self.updaters):
+            for dependency in updater.depends_on:
+                for j in by_target.get(id(dependency), ()):
+                    if j != i:
+                        dependents[j].append(i)
+                        pending[i] += 1
+
+        # A heap keeps registration order among updaters that are ready together
+        ready = [i for i, count in enumerate(pending) if count == 0]
+        heapq.heapify(ready)
+        ordered = []
+        while ready:
+            i = heapq.heappop(ready)
+            ordered.append(self.updaters[i])
+            for k in dependents[i]:
+                pending[k] -= 1
+                if pending[k] == 0:
+                    heapq.heappush(ready, k)
+        if len(ordered) != len(self.updaters):
+            cycle = [u.name for i, u in enumerate(self.updaters) if pending[i]]
+            raise ValueError(f"Updater dependencies form a cycle: {cycle}")
+        return ordered
+
+    def evaluate(self, frame: float):
+        """Run every updater for ``frame`` and sync the touched mobjects"""
+        if self._order is None:
+            updaters = self.order()
+            self._order = [(u.function, u.target) for u in updaters]
+            seen = set()
+            self._synced, self.trackers = [], []
+            for u in updaters:
+                if hasattr(u.target, "sync") and id(u.target) not in seen:
+                    seen.add(id(u.target))
+                    self._synced.append(u.target)
+                for dependency in u.depends_on:
+                    if isinstance(dependency, ValueTracker) and id(dependency) not in seen:
+                        seen.add(id(dependency))
+                        self.trackers.append(dependency)
+
+        start = time.perf_counter()
+        for tracker in self.trackers:
+            tracker.frame = frame
+        for function, target in self._order:
+            function(target, frame)
+        for target in self._synced:
+            target.sync()
+        self.last_dispatch = time.perf_counter() - start
+
+    # Frame handler
+    def install(self):
+        """Register the single frame_change_pre handler (replacing a previous one)"""
+        self.uninstall()
+
+        def dispatch(scene, *args):
+            self.evaluate(scene.frame_current)
+
+        dispatch.__name__ = self.HANDLER_NAME
+        bpy.app.handlers.frame_change_pre.append(dispatch)
+
+    def uninstall(self):
+        for handler in list(bpy.app.handlers.frame_change_pre):
+            if getattr(handler, "__name__", None) == self.HANDLER_NAME:
+                bpy.app.handlers.frame_change_pre.remove(handler)
+
+    # Baking
+    def bake(self, start_frame: int, end_frame: int,
+             data_paths: Iterable[str] = ("location", "rotation_euler", "scale"),
+             uninstall: bool = True) -> int:
+        """Sample the updaters into keyframes so renders need no Python handler.
+
+        Transforms of updated Blender objects (or a Mobject's ``object``)
+        are recorded every frame and written as F-curves in one
+        ``foreach_set`` per channel. Point-level Mobject changes are not
+        baked. Returns the number of keyframes written.
+        """
+        data_paths = tuple(data_paths)
+        objects = []
+        seen = set()
+        for updater in self.updaters:
+            obj = updater.target if isinstance(updater.target, bpy.types.Object) else getattr(updater.target, "object", None)
+            if isinstance(obj, bpy.types.Object) and obj.name not in seen:
+                seen.add(obj.name)
+                objects.append(obj)
+
+        frames = list(range(start_frame, end_frame + 1))
+        samples = {(obj.name, path): [] for obj in objects for path in data_paths}
+        for frame in frames:
+            self.evaluate(frame)
+            for obj in objects:
+                for path in data_paths:
+                    samples[(obj.name, path)].append(tuple(getattr(obj, path)))
+
+        written = 0
+        for obj in objects:
+            if obj.animation_data is None:
+                obj.animation_data_create()
+            if obj.animation_data.action is None:
+                obj.animation_data.action = bpy.data.actions.new(f"{obj.name}_baked")
+            fcurves = obj.animation_data.action.fcurves
+            for path in data_paths:
+                values = samples[(obj.name, path)]
+                for index in range(len(values[0])):
+                    fcurve = fcurves.find(path, index=index)
+                    if fcurve is not None:
+                        fcurves.remove(fcurve)
+                    fcurve = fcurves.new(path, index=index)
+                    fcurve.keyframe_points.add(len(frames))
+                    co = [c for frame, value in zip(frames, values) for c in (frame, value[index])]
+                    fcurve.keyframe_points.foreach_set("co", co)
+                    fcurve.update()
+                    written += len(frames)
+
+        if uninstall:
+            self.uninstall()
+        self.logger.info(f"Baked {len(self.updaters)} updaters over {len(frames)} frames into {written} keyframes")
+        return written
+
+
+_default_graph: Optional[UpdaterGraph] = None
+
+def get_updater_graph() -> UpdaterGraph:
+    """Shared graph behind Mobject.add_updater"""
+    global _default_graph
+    if _default_graph is None:
+        _default_graph = UpdaterGraph()
+    return _default_graph
@@ -77,8 +77,11 @@ class CameraSystem:
         self.logger.info(f"Framing point: {point}")
         
         try:
-            # Move target to point
+            # An attached camera keeps its world position while the target moves
+            world = self.camera_world_location() if self.is_attached() else None
             self.target.location = point
+            if world is not None:
+                self.camera.location = self.camera_local_location(world)
             
             # Update scene
             bpy.context.view_layer.update()
@@ -94,12 +97,12 @@ class CameraSystem:
         
         try:
             # Set initial keyframe
-            self.camera.location.keyframe_insert(data_path="location", frame=start_frame)
+            self.camera.keyframe_insert(data_path="location", frame=start_frame)
             if target_rotation:
-                self.camera.rotation_euler.keyframe_insert(data_path="rotation_euler", frame=start_frame)
+                self.camera.keyframe_insert(data_path="rotation_euler", frame=start_frame)
             
-            # Set target keyframe
-            self.camera.location = target_location
+            # Set target keyframe (given in world space)
+            self.camera.location = self.camera_local_location(target_location)
             self.camera.keyframe_insert(data_path="location", frame=end_frame)
             
             if target_rotation:
@@ -116,61 +119,86 @@ class CameraSystem:
         except Exception as e:
             self.logger.error(f"Error animating camera: {str(e)}")
 
+    def is_attached(self) -> bool:
+        """Whether the camera is parented to its target (see ``attach_to_target``)"""
+        return self.target is not None and self.camera.parent == self.target
+
+    def camera_world_location(self) -> mathutils.Vector:
+        """Camera position in world space from the current (unevaluated) values"""
+        if not self.is_attached():
+            return mathutils.Vector(self.camera.location)
+        return self.target.location + self.target.rotation_euler.to_matrix() @ self.camera.location
+
+    def camera_local_location(self, world) -> mathutils.Vector:
+        """Value of ``camera.location`` that puts the camera at ``world``"""
+        world = mathutils.Vector(world)
+        if not self.is_attached():
+            return world
+        return self.target.rotation_euler.to_matrix().inverted() @ (world - self.target.location)
+
+    def attach_to_target(self):
+        """Parent the camera to its target, keeping its world position.
+
+        Rotating the target then orbits the camera around it, so orbits
+        are keyframed on one rotation instead of on every frame. Existing
+        location keyframes are converted to target space.
+        """
+        if self.target is None or self.camera.parent == self.target:
+            return
+        bpy.context.view_layer.update()
+        inverse = self.target.matrix_world.inverted()
+        world = self.camera.matrix_world.copy()
+        self.camera.parent = self.target
+        self.camera.matrix_parent_inverse.identity()
+        self.camera.matrix_world = world
+
+        action = self.camera.animation_data.action if self.camera.animation_data else None
+        curves = [action.fcurves.find("location", index=i) for i in range(3)] if action else []
+        if curves and all(curves) and len({len(fc.keyframe_points) for fc in curves}) == 1:
+            for points in zip(*(fc.keyframe_points for fc in curves)):
+                local = inverse @ mathutils.Vector([kf.co.y for kf in points])
+                for kf, value in zip(points, local):
+                    kf.co.y = value
+                    kf.handle_left.y = value
+                    kf.handle_right.y = value
+            for fc in curves:
+                fc.update()
+
     def animate_rotation_around_target(self, start_frame: int, end_frame: int, 
                                      start_angles: Tuple[float, float], 
                                      end_angles: Tuple[float, float]):
-        """Animate camera rotating around target point"""
+        """Animate camera rotating around target point.
+
+        Angles are (elevation phi, azimuth theta); the camera sits at
+        ``config.distance`` from the target, which is rotated between two
+        keyframes while the Track To constraint keeps the camera aimed.
+        """
         self.logger.info(f"Animating camera rotation from frame {start_frame} to {end_frame}")
         
         try:
-            # Temporarily clear constraints
-            constraints = self.camera.constraints.copy()
-            self.camera.constraints.clear()
-            
-            # Calculate and set start position
-            phi_start, theta_start = start_angles
-            x_start = self.config.distance * math.sin(theta_start) * math.cos(phi_start)
-            y_start = self.config.distance * math.cos(theta_start) * math.cos(phi_start)
-            z_start = self.config.distance * math.sin(phi_start)
-            
-            self.camera.location = (x_start, y_start, z_start)
+            self.attach_to_target()
+            # Local +Y rotated by (phi about X, -theta about Z) gives
+            # d * (sin(theta) cos(phi), cos(theta) cos(phi), sin(phi))
+            self.camera.location = (0, self.config.distance, 0)
             self.camera.keyframe_insert(data_path="location", frame=start_frame)
-            
-            # Calculate and set end position
+
+            phi_start, theta_start = start_angles
+            self.target.rotation_euler = (phi_start, 0, -theta_start)
+            self.target.keyframe_insert(data_path="rotation_euler", frame=start_frame)
+
             phi_end, theta_end = end_angles
-            x_end = self.config.distance * math.sin(theta_end) * math.cos(phi_end)
-            y_end = self.config.distance * math.cos(theta_end) * math.cos(phi_end)
-            z_end = self.config.distance * math.sin(phi_end)
-            
-            self.camera.location = (x_end, y_end, z_end)
-            self.camera.keyframe_insert(data_path="location", frame=end_frame)
-            
-            # Also animate rotation to keep facing center
-            for frame in range(start_frame, end_frame + 1, 10):  # Add intermediate keyframes
-                t = (frame - start_frame) / (end_frame - start_frame)
-                theta_current = theta_start + t * (theta_end - theta_start)
-                phi_current = phi_start + t * (phi_end - phi_start)
-                
-                # Update camera rotation to look at target
-                direction = -mathutils.Vector((
-                    math.sin(theta_current) * math.cos(phi_current),
-                    math.cos(theta_current) * math.cos(phi_current),
-                    math.sin(phi_current)
-                ))
-                rot_quat = direction.to_track_quat('-Z', 'Y')
-                self.camera.rotation_euler = rot_quat.to_euler()
-                self.camera.keyframe_insert(data_path="rotation_euler", frame=frame)
-            
-            # Restore constraints
-            for constraint in constraints:
-                self.camera.constraints.append(constraint)
-            
+            self.target.rotation_euler = (phi_end, 0, -theta_end)
+            self.target.keyframe_insert(data_path="rotation_euler", frame=end_frame)
+
             # Set smooth interpolation
-            if self.camera.animation_data and self.camera.animation_data.action:
-                for fc in self.camera.animation_data.action.fcurves:
+            if self.target.animation_data and self.target.animation_data.action:
+                for fc in self.target.animation_data.action.fcurves:
+                    if fc.data_path != "rotation_euler":
+                        continue
                     for kf in fc.keyframe_points:
-                        kf.interpolation = 'BEZIER'
-                        kf.easing = 'EASE_IN_OUT'
+                        if start_frame <= kf.co.x <= end_frame:
+                            kf.interpolation = 'BEZIER'
+                            kf.easing = 'EASE_IN_OUT'
                         
         except Exception as e:
             self.logger.error(f"Error animating camera rotation: {str(e)}")
@@ -180,7 +208,9 @@ class CameraSystem:
         try:
             # Adjust camera distance
             current_loc = mathutils.Vector(self.camera.location)
-            target_loc = mathutils.Vector(self.target.location)
+            # A camera attached to its target already has target-relative coordinates
+            target_loc = mathutils.Vector((0, 0, 0)) if self.is_attached() \
+                else mathutils.Vector(self.target.location)
             direction = (current_loc - target_loc).normalized()
             
             new_distance = self.config.distance * factor
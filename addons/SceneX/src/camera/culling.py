@@ -0,0 +1,176 @@
+# SceneX/src/camera/culling.py
+"""
+Pre-render frustum culling.
+Objects the camera never sees over a frame range are hidden from render
+(and optionally the viewport) by keyframing their visibility flags, so
+off-screen slides or grid regions cost nothing to render.
+"""
+
+import bpy
+import math
+import numpy as np
+from typing import Dict, Iterable, Optional
+from src.camera.framing import is_animated, local_corners, transform_corners, world_matrices
+from src.utils.logger import SceneXLogger
+
+CULLED_TAG = "scenex_culled"  # Previous flag values and the frames the culler keyed
+
+def _fcurve(obj: bpy.types.Object, path: str) -> Optional[bpy.types.FCurve]:
+    action = obj.animation_data.action if obj.animation_data else None
+    return action.fcurves.find(path) if action is not None else None
+
+def frustum_outside(points: np.ndarray, camera: bpy.types.Object, aspect: float) -> np.ndarray:
+    """For camera-space corners (n, 8, 3): whether each box lies entirely
+    outside one frustum plane (conservative: boxes near corners count as inside)"""
+    data = camera.data
+    x, y, depth = points[..., 0], points[..., 1], -points[..., 2]
+    if data.type == 'ORTHO':
+        larger = data.ortho_scale
+        half_x, half_y = (larger / 2, larger / 2 / aspect) if aspect >= 1 else (larger / 2 * aspect, larger / 2)
+        # Lens shift is a fraction of the larger frame dimension
+        x, y = x - data.shift_x * larger, y - data.shift_y * larger
+        reach_x = reach_y = 1.0
+    else:
+        larger = 2 * math.tan(data.angle / 2)
+        half_x, half_y = (larger / 2, larger / 2 / aspect) if aspect >= 1 else (larger / 2 * aspect, larger / 2)
+        x, y = x - data.shift_x * larger * depth, y - data.shift_y * larger * depth
+        reach_x = reach_y = depth
+    outside = (depth < data.clip_start).all(axis=-1) | (depth > data.clip_end).all(axis=-1)
+    outside |= (x > half_x * reach_x).all(axis=-1) | (x < -half_x * reach_x).all(axis=-1)
+    outside |= (y > half_y * reach_y).all(axis=-1) | (y < -half_y * reach_y).all(axis=-1)
+    return outside
+
+class FrustumCuller:
+    """Keyframes ``hide_render`` (and ``hide_viewport``) from the animated camera frustum.
+
+    Bounds are the objects' bound boxes under their evaluated world
+    matrices; static objects are transformed once. Visibility is tested
+    every ``step`` frames and widened by ``margin`` frames on both sides.
+    Culled objects also stop casting shadows and reflections, so keep
+    such objects out of ``objects`` when that matters. Objects whose
+    visibility is already animated are left alone; ``clear`` removes only
+    the culler's own keys and restores the previous flags.
+    """
+    def __init__(self, camera: Optional[bpy.types.Object] = None,
+                 objects: Optional[Iterable[bpy.types.Object]] = None,
+                 step: int = 1, margin: int = 2, viewport: bool = True):
+        scene = bpy.context.scene
+        self.camera = camera or scene.camera
+        if objects is None:
+            objects = [obj for obj in scene.objects
+                       if obj.type in {'MESH', 'CURVE', 'FONT', 'SURFACE', 'META'}
+                       and (not obj.hide_render or CULLED_TAG in obj)]
+        self.objects = [obj for obj in objects if obj != self.camera]
+        self.step = max(int(step), 1)
+        self.margin = margin
+        self.viewport = viewport
+        self.logger = SceneXLogger("FrustumCuller")
+
+    def visibility(self, start_frame: int, end_frame: int) -> np.ndarray:
+        """Visible flags (objects, sampled frames) before the margin is applied"""
+        scene = bpy.context.scene
+        current = scene.frame_current
+        frames = self.frames(start_frame, end_frame)
+        aspect = (scene.render.resolution_x * scene.render.pixel_aspect_x) / \
+                 (scene.render.resolution_y * scene.render.pixel_aspect_y)
+
+        corners = local_corners(self.objects)
+        animated = np.array([is_animated(obj) for obj in self.objects], dtype=bool)
+        moving = [obj for obj, flag in zip(self.objects, animated) if flag]
+        index = {obj.name: i for i, obj in enumerate(scene.objects)}
+        world = np.empty_like(corners)
+        if (~animated).any():
+            static = [obj for obj, flag in zip(self.objects, animated) if not flag]
+            world[~animated] = transform_corners(corners[~animated], world_matrices(static, index))
+
+        visible = np.empty((len(self.objects), len(frames)), dtype=bool)
+        for i, frame in enumerate(frames):
+            scene.frame_set(int(frame))
+            if moving:
+                world[animated] = transform_corners(corners[animated], world_matrices(moving, index))
+            view = np.array(self.camera.matrix_world.inverted(), dtype=np.float64)
+            points = world @ view[:3, :3].T + view[:3, 3]
+            visible[:, i] = ~frustum_outside(points, self.camera, aspect)
+        scene.frame_set(current)
+        return visible
+
+    def frames(self, start_frame: int, end_frame: int) -> np.ndarray:
+        return np.arange(start_frame, end_frame + 1, self.step)
+
+    def run(self, start_frame: Optional[int] = None, end_frame: Optional[int] = None) -> Dict[str, float]:
+        """Cull over the frame range (default: the scene range) and return statistics"""
+        scene = bpy.context.scene
+        start_frame = scene.frame_start if start_frame is None else start_frame
+        end_frame = scene.frame_end if end_frame is None else end_frame
+        self.clear()
+        if not self.objects or self.camera is None:
+            self.logger.warning("Nothing to cull")
+            return {}
+
+        frames = self.frames(start_frame, end_frame)
+        visible = self.visibility(start_frame, end_frame)
+        reach = math.ceil(self.margin / self.step)
+        if reach > 0 and visible.shape[1] > 1:
+            padded = np.pad(visible, ((0, 0), (reach, reach)), mode='edge')
+            visible = np.lib.stride_tricks.sliding_window_view(padded, 2 * reach + 1, axis=1).any(axis=-1)
+
+        paths = ["hide_render", "hide_viewport"] if self.viewport else ["hide_render"]
+        keyframes = never_visible = user_animated = 0
+        for obj, flags in zip(self.objects, visible):
+            if flags.all():
+                continue
+            if any(_fcurve(obj, path) is not None for path in paths):
+                user_animated += 1  # Keys would interleave with the user's visibility animation
+                continue
+            record = {'previous': {path: bool(getattr(obj, path)) for path in paths}}
+            if not flags.any():
+                never_visible += 1
+                for path in paths:
+                    setattr(obj, path, True)
+            else:
+                changes = np.concatenate([[0], np.flatnonzero(flags[1:] != flags[:-1]) + 1])
+                record['frames'] = [int(frames[i]) for i in changes]
+                for i in changes:
+                    for path in paths:
+                        setattr(obj, path, not flags[i])
+                        obj.keyframe_insert(data_path=path, frame=int(frames[i]))
+                        keyframes += 1
+            obj[CULLED_TAG] = record
+
+        culled = int((~visible).sum())
+        # Each sample stands for ``step`` frames
+        stats = {
+            "objects": len(self.objects),
+            "frames": int(end_frame - start_frame + 1),
+            "object_frames": int(visible.size * self.step),
+            "culled_object_frames": culled * self.step,
+            "culled_fraction": culled / visible.size if visible.size else 0.0,
+            "never_visible": never_visible,
+            "keyframes": keyframes,
+            "skipped_user_animated": user_animated,
+        }
+        self.logger.info(f"Culled {stats['culled_object_frames']} of {stats['object_frames']} object-frames "
+                         f"({stats['culled_fraction']:.0%}); {never_visible} objects never visible")
+        return stats
+
+    def clear(self):
+        """Undo a previous culling pass on these objects: delete the keys it
+        inserted (keys added since are kept) and restore the previous flags"""
+        for obj in self.objects:
+            if CULLED_TAG not in obj:
+                continue
+            record = obj[CULLED_TAG]
+            frames = set(record.get('frames', []))
+            for path, value in record.get('previous', {}).items():
+                fcurve = _fcurve(obj, path)
+                if fcurve is not None and frames:
+                    points = fcurve.keyframe_points
+                    for i in reversed(range(len(points))):
+                        if round(points[i].co.x) in frames:
+                            points.remove(points[i], fast=True)
+                    fcurve.update()
+                    if not len(points):
+                        obj.animation_data.action.fcurves.remove(fcurve)
+                if _fcurve(obj, path) is None:
+                    setattr(obj, path, bool(value))
+            del obj[CULLED_TAG]
@@ -0,0 +1,244 @@
+# SceneX/src/camera/framing.py
+"""
+Automatic framing of a set of objects across an animation.
+World bounds come from each object's cached local bound box and its
+world matrix, read in bulk only at frames where something is keyed,
+and only for objects that can move; the camera fit is smoothed and
+written as sparse keyframes.
+"""
+
+import bpy
+import math
+import numpy as np
+from typing import Iterable, List, Optional, Tuple
+from src.camera.paths import simplify, write_keyframes
+from src.utils.logger import SceneXLogger
+
+def local_corners(objects: List[bpy.types.Object]) -> np.ndarray:
+    """Bound box corners of every object in its own space, as (n, 8, 3)"""
+    return np.array([[tuple(corner) for corner in obj.bound_box] for obj in objects], dtype=np.float64).reshape(-1, 8, 3)
+
+def world_matrices(objects: List[bpy.types.Object], index: Optional[dict] = None) -> np.ndarray:
+    """Evaluated world matrices of ``objects`` as (n, 4, 4), read in one foreach_get when possible.
+
+    ``index`` maps object names to their position in the scene's objects;
+    pass it when reading the same objects repeatedly.
+    """
+    collection = bpy.context.scene.objects
+    try:
+        flat = np.empty(len(collection) * 16, dtype=np.float32)
+        collection.foreach_get("matrix_world", flat)
+        # Stored column-major
+        matrices = flat.reshape(-1, 4, 4).transpose(0, 2, 1)
+        if index is None:
+            index = {obj.name: i for i, obj in enumerate(collection)}
+        return matrices[[index[obj.name] for obj in objects]].astype(np.float64)
+    except (AttributeError, KeyError, RuntimeError, TypeError):
+        return np.array([np.array(obj.matrix_world) for obj in objects], dtype=np.float64).reshape(-1, 4, 4)
+
+def world_bounds(objects: Iterable[bpy.types.Object]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """World-space (min, max) corners of the objects at the current frame"""
+    objects = list(objects)
+    if not objects:
+        return None
+    corners = transform_corners(local_corners(objects), world_matrices(objects)).reshape(-1, 3)
+    return corners.min(axis=0), corners.max(axis=0)
+
+def transform_corners(corners: np.ndarray, matrices: np.ndarray) -> np.ndarray:
+    """Corners (n, 8, 3) mapped by per-object 4x4 matrices (n, 4, 4)"""
+    return np.einsum('nij,nkj->nki', matrices[:, :3, :3], corners) + matrices[:, None, :3, 3]
+
+TRANSFORM_PATHS = {"location", "rotation_euler", "rotation_quaternion", "rotation_axis_angle", "scale",
+                   "delta_location", "delta_rotation_euler", "delta_rotation_quaternion", "delta_scale"}
+
+def is_animated(obj: bpy.types.Object) -> bool:
+    """Whether the object's world matrix may change over time"""
+    while obj is not None:
+        data = obj.animation_data
+        if data is not None:
+            if len(data.drivers):
+                return True
+            if data.action is not None and any(fc.data_path in TRANSFORM_PATHS for fc in data.action.fcurves):
+                return True
+        if len(obj.constraints):
+            return True
+        obj = obj.parent
+    return False
+
+ROTATION_PATHS = {"rotation_euler", "rotation_quaternion", "rotation_axis_angle",
+                  "delta_rotation_euler", "delta_rotation_quaternion"}
+
+INTERIOR_SAMPLES = 3  # Extra samples inside every non-linear key span
+
+def _key_frames(obj: bpy.types.Object) -> Tuple[List[float], bool]:
+    """Frames to measure an animated object at, and whether it needs evenly spaced samples.
+
+    Keys of the object and its parents give the frames, plus interior
+    samples of spans that do not interpolate linearly (overshooting
+    easings). Between keys a box is only safe to interpolate for linear
+    translation and scale: rotation keys swing children along arcs, and
+    constraints or drivers move an object without keys, so those chains
+    ask for even sampling.
+    """
+    frames, dense = [], False
+    while obj is not None:
+        data = obj.animation_data
+        if len(obj.constraints) or (data is not None and len(data.drivers)):
+            dense = True
+        action = data.action if data is not None else None
+        if action is not None:
+            for fcurve in action.fcurves:
+                if fcurve.data_path in ROTATION_PATHS:
+                    dense = True
+                points = fcurve.keyframe_points
+                co = np.empty(len(points) * 2, dtype=np.float32)
+                points.foreach_get("co", co)
+                keys = co[0::2]
+                frames.extend(keys.tolist())
+                for i in range(len(keys) - 1):
+                    if points[i].interpolation not in {'LINEAR', 'CONSTANT'}:
+                        t = np.arange(1, INTERIOR_SAMPLES + 1) / (INTERIOR_SAMPLES + 1)
+                        frames.extend((keys[i] + t * (keys[i + 1] - keys[i])).tolist())
+        obj = obj.parent
+    return frames, dense
+
+def _upper_envelope(values: np.ndarray, window: int) -> np.ndarray:
+    """Smooth upper bound of ``values`` (n, d): a moving maximum over ``window``
+    samples each side, then a moving average, so it never drops below the data"""
+    if window <= 0 or len(values) < 3:
+        return values
+    padded = np.pad(values, ((window, window), (0, 0)), mode='edge')
+    windows = np.lib.stride_tricks.sliding_window_view(padded, 2 * window + 1, axis=0)
+    padded = np.pad(windows.max(axis=-1), ((window, window), (0, 0)), mode='edge')
+    windows = np.lib.stride_tricks.sliding_window_view(padded, 2 * window + 1, axis=0)
+    return np.maximum(windows.mean(axis=-1), values)
+
+class AutoFramer:
+    """Keeps a set of objects in shot for a camera with a fixed viewing direction.
+
+    Local bound boxes are read once per object, so deforming meshes are
+    framed by their rest bounds. Static objects are measured once;
+    animated ones at the union of their keyframe frames and points inside
+    eased key spans, topped up to ``max_samples`` with evenly spaced frames
+    when rotation keys, constraints or drivers move them (see ``_key_frames``).
+    """
+    def __init__(self, camera_system, objects: Optional[Iterable[bpy.types.Object]] = None,
+                 padding: float = 1.1, smoothing: int = 2, max_samples: int = 200):
+        self.camera_system = camera_system
+        self.camera = camera_system.camera
+        self.target = camera_system.target
+        skip = {self.camera.name, self.target.name if self.target else None}
+        if objects is None:
+            objects = [obj for obj in bpy.context.scene.objects
+                       if obj.type in {'MESH', 'CURVE', 'FONT', 'SURFACE', 'META', 'GPENCIL'}]
+        self.objects = [obj for obj in objects if obj.name not in skip]
+        self.padding = padding
+        self.smoothing = smoothing
+        self.max_samples = max_samples
+        self.logger = SceneXLogger("AutoFramer")
+        self.corners = local_corners(self.objects)
+        self.animated = np.array([is_animated(obj) for obj in self.objects], dtype=bool)
+
+    def sample_frames(self, start_frame: int, end_frame: int) -> np.ndarray:
+        """Frames within the range at which the animated objects are measured"""
+        frames = {float(start_frame), float(end_frame)}
+        dense = False
+        for obj, animated in zip(self.objects, self.animated):
+            if animated:
+                keys, needs_even = _key_frames(obj)
+                frames.update(f for f in keys if start_frame <= f <= end_frame)
+                dense = dense or needs_even
+        frames = np.array(sorted(frames))
+        if dense and len(frames) < self.max_samples:
+            # Fill the rest of the budget evenly to catch motion between keys
+            frames = np.union1d(frames, np.linspace(start_frame, end_frame, self.max_samples - len(frames) + 2))
+        if len(frames) > self.max_samples:
+            frames = frames[np.round(np.linspace(0, len(frames) - 1, self.max_samples)).astype(int)]
+        return frames
+
+    def bounds(self, frames: np.ndarray, rotation: np.ndarray) -> np.ndarray:
+        """Per frame (min, max) of all corners in the camera's axes, as (n, 2, 3)"""
+        scene = bpy.context.scene
+        current = scene.frame_current
+        moving = [obj for obj, animated in zip(self.objects, self.animated) if animated]
+        index = {obj.name: i for i, obj in enumerate(scene.objects)}
+        static = [obj for obj, animated in zip(self.objects, self.animated) if not animated]
+
+        static_box = None
+        if static:
+            corners = transform_corners(self.corners[~self.animated], world_matrices(static, index)).reshape(-1, 3) @ rotation
+            static_box = np.stack([corners.min(axis=0), corners.max(axis=0)])
+
+        result = np.empty((len(frames), 2, 3))
+        for i, frame in enumerate(frames):
+            box = static_box
+            if moving:
+                scene.frame_set(int(frame), subframe=float(frame) % 1.0)
+                corners = transform_corners(self.corners[self.animated], world_matrices(moving, index)).reshape(-1, 3) @ rotation
+                moving_box = np.stack([corners.min(axis=0), corners.max(axis=0)])
+                box = moving_box if box is None else np.stack([np.minimum(box[0], moving_box[0]),
+                                                               np.maximum(box[1], moving_box[1])])
+            result[i] = box
+        scene.frame_set(current)
+        return result
+
+    def fit(self, start_frame: int, end_frame: int, tolerance: float = 1e-3) -> int:
+        """Key the camera so the objects stay in frame; returns the number of keyframes"""
+        if not self.objects:
+            self.logger.warning("Nothing to frame")
+            return 0
+        scene = bpy.context.scene
+        camera, target = self.camera, self.target
+        bpy.context.view_layer.update()
+        camera_rotation = np.array(camera.matrix_world.to_3x3().normalized())
+
+        frames = self.sample_frames(start_frame, end_frame)
+        boxes = self.bounds(frames, camera_rotation)
+        # Smooth the box as an envelope so it always contains the raw box
+        lows = -_upper_envelope(-boxes[:, 0], self.smoothing)
+        highs = _upper_envelope(boxes[:, 1], self.smoothing)
+        centers = (lows + highs) / 2
+        extents = highs - lows
+
+        aspect = (scene.render.resolution_x * scene.render.pixel_aspect_x) / \
+                 (scene.render.resolution_y * scene.render.pixel_aspect_y)
+        width, height, depth = extents[:, 0] * self.padding, extents[:, 1] * self.padding, extents[:, 2]
+        back = camera_rotation[:, 2]  # Camera looks down its local -Z
+        world_centers = centers @ camera_rotation.T
+
+        written = 0
+        if camera.data.type == 'ORTHO':
+            scale = np.maximum(width, height * aspect) if aspect >= 1 else np.maximum(height, width / aspect)
+            kept = simplify(frames, scale[:, None], tolerance)
+            write_keyframes(camera.data, "ortho_scale", frames[kept], scale[kept, None])
+            written += len(kept)
+            distance = np.full(len(frames), np.linalg.norm(np.array(camera.matrix_world.translation) - world_centers[0]))
+            distance = np.maximum(distance, depth / 2 + camera.data.clip_start)
+        else:
+            # Half field of view along the larger render dimension; the other is scaled by the aspect
+            half = math.tan(camera.data.angle / 2)
+            tan_x, tan_y = (half, half / aspect) if aspect >= 1 else (half * aspect, half)
+            distance = np.maximum(width / 2 / tan_x, height / 2 / tan_y) + depth / 2
+
+        positions = world_centers + distance[:, None] * back
+        if target is not None and camera.parent == target:
+            kept = simplify(frames, world_centers, tolerance)
+            write_keyframes(target, "location", frames[kept], world_centers[kept])
+            target.location = world_centers[-1]
+            local = (positions - world_centers) @ np.array(target.rotation_euler.to_matrix())
+            written += len(kept) * 3
+        else:
+            local = positions
+            if target is not None:
+                kept = simplify(frames, world_centers, tolerance)
+                write_keyframes(target, "location", frames[kept], world_centers[kept])
+                target.location = world_centers[-1]
+                written += len(kept) * 3
+        kept = simplify(frames, local, tolerance)
+        write_keyframes(camera, "location", frames[kept], local[kept])
+        camera.location = local[-1]
+        written += len(kept) * 3
+
+        self.logger.info(f"Framed {len(self.objects)} objects ({int(self.animated.sum())} animated) "
+                         f"from {len(frames)} sampled frames with {written} keyframes")
+        return written
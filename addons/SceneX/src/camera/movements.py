@@ -2,92 +2,146 @@
 
 import bpy
 import math
+import numpy as np
 from mathutils import Vector, Matrix, Euler
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
+from ..animation.rate_functions import RateFunc
 from ..utils.logger import SceneXLogger
 from ..scene.groups import Group
+from .framing import AutoFramer, world_bounds
+from .paths import CameraPath
 
 class CameraMovement:
+    """Camera moves as a handful of keyframes on the timeline.
+
+    Creating a CameraMovement parents the camera to its target (see
+    ``CameraSystem.attach_to_target``; the CameraSystem methods take
+    world positions either way), so an orbit is two keyframes on the
+    target's rotation and every other move two keyframes on locations,
+    whatever the duration. Moves start at the scene's current
+    frame and follow each other; pass ``start_frame`` to place one
+    explicitly.
+    """
     def __init__(self, camera_system):
+        self.camera_system = camera_system
         self.camera = camera_system.camera
         self.target = camera_system.target
         self.logger = SceneXLogger("CameraMovement")
-
-    def dolly(self, distance: float, duration: int = 30):
+        camera_system.attach_to_target()
+        self.frame = bpy.context.scene.frame_current
+
+    def _frames(self, duration: int, start_frame: Optional[int] = None) -> Tuple[int, int]:
+        """Frame range of the next move; extends the scene to fit it"""
+        start = self.frame if start_frame is None else start_frame
+        end = start + duration
+        self.frame = end
+        scene = bpy.context.scene
+        if end > scene.frame_end:
+            scene.frame_end = end
+        return start, end
+
+    def wait(self, duration: int):
+        """Hold the camera still for ``duration`` frames before the next move"""
+        self._frames(duration)
+
+    def _to_local(self, world: Vector) -> Vector:
+        """Camera location in target space for a world position"""
+        return self.camera_system.camera_local_location(world)
+
+    def dolly(self, distance: float, duration: int = 30, start_frame: Optional[int] = None):
         """Move camera forward/backward"""
         start_loc = self.camera.location.copy()
-        direction = (self.target.location - start_loc).normalized()
-        end_loc = start_loc + direction * distance
-
-        self._animate_movement(start_loc, end_loc, duration)
-
-    def orbit(self, angle: float, axis: str = 'Z', duration: int = 30):
-        """Orbit around target"""
-        center = self.target.location
-        radius = (self.camera.location - center).length
-        start_angle = math.atan2(self.camera.location.y - center.y, 
-                               self.camera.location.x - center.x)
-
-        for frame in range(duration + 1):
-            current_angle = start_angle + (angle * frame / duration)
-            if axis == 'Z':
-                x = center.x + radius * math.cos(current_angle)
-                y = center.y + radius * math.sin(current_angle)
-                z = self.camera.location.z
-            else:  # 'Y' axis
-                x = center.x + radius * math.cos(current_angle)
-                z = center.z + radius * math.sin(current_angle)
-                y = self.camera.location.y
-
-            self.camera.location = Vector((x, y, z))
-            self.camera.keyframe_insert(data_path="location", frame=frame)
+        # The target sits at the local origin
+        end_loc = start_loc - start_loc.normalized() * distance
+
+        self._animate_movement(start_loc, end_loc, duration, start_frame)
+
+    def orbit(self, angle: float, axis: str = 'Z', duration: int = 30, start_frame: Optional[int] = None):
+        """Orbit around target at constant angular speed"""
+        start, end = self._frames(duration, start_frame)
+        index = 'XYZ'.index(axis)
+        self.target.keyframe_insert(data_path="rotation_euler", index=index, frame=start)
+        self.target.rotation_euler[index] += angle
+        self.target.keyframe_insert(data_path="rotation_euler", index=index, frame=end)
+        _set_interpolation(self.target, "rotation_euler", start, end, 'LINEAR')
+        self.logger.debug(f"Orbit {math.degrees(angle):.0f} deg about {axis}: frames {start}-{end}")
 
     def frame_object(self, obj: Union[bpy.types.Object, Group], padding: float = 1.2):
         """Frame camera to focus on object/group"""
-        if isinstance(obj, Group):
-            bounds = obj.get_bounds()
-        else:
-            bounds = [(min(v[i] for v in obj.bound_box), 
-                      max(v[i] for v in obj.bound_box)) for i in range(3)]
+        objects = obj.get_all_objects() if isinstance(obj, Group) else [obj]
+        bounds = world_bounds(objects)
+        if bounds is None:
+            return
+        low, high = bounds
 
-        center = Vector(((bounds[0][0] + bounds[0][1])/2,
-                        (bounds[1][0] + bounds[1][1])/2,
-                        (bounds[2][0] + bounds[2][1])/2))
-
-        size = max(bounds[0][1] - bounds[0][0],
-                  bounds[1][1] - bounds[1][0],
-                  bounds[2][1] - bounds[2][0])
+        center = Vector(((low + high) / 2).tolist())
+        size = float(np.max(high - low))
 
         distance = size * padding
         self.target.location = center
-        self.camera.location = center + Vector((0, -distance, distance/2))
+        self.camera.location = self._to_local(center + Vector((0, -distance, distance/2)))
+
+    def frame_all(self, objects: Optional[List[bpy.types.Object]] = None, duration: Optional[int] = None,
+                  padding: float = 1.1, start_frame: Optional[int] = None) -> int:
+        """Keep ``objects`` (default: every visible geometry object) in shot.
+
+        Covers ``duration`` frames from the move timeline, or the whole
+        scene range when no duration is given.
+        """
+        scene = bpy.context.scene
+        if duration is None:
+            start, end = scene.frame_start, scene.frame_end
+        else:
+            start, end = self._frames(duration, start_frame)
+        return AutoFramer(self.camera_system, objects, padding).fit(start, end)
 
     def fly_to(self, location: Vector, target: Optional[Vector] = None, 
-               duration: int = 30):
+               duration: int = 30, start_frame: Optional[int] = None):
         """Smoothly move camera to new position/target"""
-        start_loc = self.camera.location.copy()
-        start_target = self.target.location.copy()
-
+        start, end = self._frames(duration, start_frame)
         if target is None:
-            target = self.target.location
-
-        for frame in range(duration + 1):
-            factor = frame / duration
-            self.camera.location = start_loc.lerp(location, factor)
-            self.target.location = start_target.lerp(target, factor)
-            
-            self.camera.keyframe_insert(data_path="location", frame=frame)
-            self.target.keyframe_insert(data_path="location", frame=frame)
-
-    def _animate_movement(self, start: Vector, end: Vector, duration: int):
-        """Helper to animate camera movement"""
-        for frame in range(duration + 1):
-            factor = frame / duration
-            self.camera.location = start.lerp(end, factor)
-            self.camera.keyframe_insert(data_path="location", frame=frame)
+            target = self.target.location.copy()
+
+        self.camera.keyframe_insert(data_path="location", frame=start)
+        self.target.keyframe_insert(data_path="location", frame=start)
+        # Camera and target share their easing, so the camera's world path stays a straight line
+        self.target.location = target
+        self.camera.location = self._to_local(location)
+        self.camera.keyframe_insert(data_path="location", frame=end)
+        self.target.keyframe_insert(data_path="location", frame=end)
+
+    def fly_through(self, waypoints: List[Vector], look_at: Optional[List[Vector]] = None,
+                    duration: int = 120, rate_func=RateFunc.smooth,
+                    start_frame: Optional[int] = None) -> CameraPath:
+        """Fly along a smooth path through ``waypoints`` at a speed set by ``rate_func``"""
+        start, end = self._frames(duration, start_frame)
+        path = CameraPath(waypoints, look_at)
+        path.keyframe(self.camera_system, start, end, rate_func)
+        return path
+
+    def _animate_movement(self, start: Vector, end: Vector, duration: int,
+                          start_frame: Optional[int] = None):
+        """Helper to animate camera movement between two target-space locations"""
+        start_frame, end_frame = self._frames(duration, start_frame)
+        self.camera.location = start
+        self.camera.keyframe_insert(data_path="location", frame=start_frame)
+        self.camera.location = end
+        self.camera.keyframe_insert(data_path="location", frame=end_frame)
 
     def set_orthographic(self, orthographic: bool = True):
         """Switch between orthographic and perspective"""
         self.camera.data.type = 'ORTHO' if orthographic else 'PERSP'
         if orthographic:
-            self.camera.data.ortho_scale = 10.0
\ No newline at end of file
+            self.camera.data.ortho_scale = 10.0
+
+def _set_interpolation(obj: bpy.types.Object, data_path: str, start: float, end: float, interpolation: str):
+    """Set the interpolation of ``data_path`` keyframes within [start, end]"""
+    action = obj.animation_data.action if obj.animation_data else None
+    if action is None:
+        return
+    for fc in action.fcurves:
+        if fc.data_path != data_path:
+            continue
+        for kf in fc.keyframe_points:
+            if start <= kf.co.x <= end:
+                kf.interpolation = interpolation
@@ -0,0 +1,230 @@
+# SceneX/src/camera/paths.py
+"""
+Camera path splines through waypoints.
+The spline is sampled densely once and reparameterized by arc length
+through a cumulative-length table, so positions for any number of
+frames are a vectorized table lookup; a rate function sets the speed
+profile along the path.
+"""
+
+import bpy
+import numpy as np
+from typing import Callable, Optional, Sequence, Tuple
+from src.animation.rate_functions import RateFunc
+from src.utils.logger import SceneXLogger
+
+def catmull_rom(points: np.ndarray, samples_per_segment: int = 64, alpha: float = 0.5) -> np.ndarray:
+    """Centripetal Catmull-Rom spline through ``points`` (n, d), as (m, d) samples.
+
+    The end tangents come from mirrored end points; ``alpha`` 0.5 avoids
+    cusps and self-intersections on unevenly spaced waypoints.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if len(points) < 2:
+        return points.copy()
+    padded = np.vstack([2 * points[0] - points[1], points, 2 * points[-1] - points[-2]])
+    p0, p1, p2, p3 = padded[:-3], padded[1:-2], padded[2:-1], padded[3:]
+
+    def knot(a, b):
+        return np.maximum(np.linalg.norm(b - a, axis=1) ** alpha, 1e-9)[:, None, None]
+
+    t0 = np.zeros((len(p1), 1, 1))
+    t1 = t0 + knot(p0, p1)
+    t2 = t1 + knot(p1, p2)
+    t3 = t2 + knot(p2, p3)
+    # Samples within every segment, excluding its end (the next segment's start)
+    u = np.linspace(0, 1, samples_per_segment, endpoint=False)[None, :, None]
+    t = t1 + u * (t2 - t1)
+    p0, p1, p2, p3 = (p[:, None, :] for p in (p0, p1, p2, p3))
+
+    # Barry-Goldman pyramid, evaluated for all segments and samples at once
+    a1 = ((t1 - t) * p0 + (t - t0) * p1) / (t1 - t0)
+    a2 = ((t2 - t) * p1 + (t - t1) * p2) / (t2 - t1)
+    a3 = ((t3 - t) * p2 + (t - t2) * p3) / (t3 - t2)
+    b1 = ((t2 - t) * a1 + (t - t0) * a2) / (t2 - t0)
+    b2 = ((t3 - t) * a2 + (t - t1) * a3) / (t3 - t1)
+    curve = ((t2 - t) * b1 + (t - t1) * b2) / (t2 - t1)
+    return np.vstack([curve.reshape(-1, points.shape[1]), points[-1:]])
+
+def apply_rate(rate_func: Callable[[float], float], t: np.ndarray) -> np.ndarray:
+    """Rate function over an array; scalar-only functions are mapped element-wise"""
+    try:
+        values = np.asarray(rate_func(t), dtype=np.float64)
+        if values.shape == t.shape:
+            return values
+    except (TypeError, ValueError):
+        pass
+    return np.fromiter((rate_func(float(x)) for x in t), dtype=np.float64, count=len(t))
+
+def simplify(frames: np.ndarray, values: np.ndarray, tolerance: float) -> np.ndarray:
+    """Indices of the samples to keep so linear interpolation between them
+    stays within ``tolerance`` of ``values`` (n, d) at every frame"""
+    keep = np.zeros(len(frames), dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, len(frames) - 1)]
+    while stack:
+        i, j = stack.pop()
+        if j - i < 2:
+            continue
+        w = ((frames[i + 1:j] - frames[i]) / (frames[j] - frames[i]))[:, None]
+        chord = values[i] + w * (values[j] - values[i])
+        error = np.linalg.norm(values[i + 1:j] - chord, axis=1)
+        k = int(np.argmax(error))
+        if error[k] > tolerance:
+            k += i + 1
+            keep[k] = True
+            stack.append((i, k))
+            stack.append((k, j))
+    return np.flatnonzero(keep)
+
+def write_keyframes(obj: bpy.types.ID, data_path: str, frames: np.ndarray, values: np.ndarray):
+    """Replace the ``data_path`` F-curves of ``obj`` with LINEAR keys at ``frames``"""
+    if obj.animation_data is None:
+        obj.animation_data_create()
+    if obj.animation_data.action is None:
+        obj.animation_data.action = bpy.data.actions.new(f"{obj.name}_path")
+    fcurves = obj.animation_data.action.fcurves
+    for index in range(values.shape[1]):
+        fcurve = fcurves.find(data_path, index=index)
+        if fcurve is not None:
+            # Keep keys outside the new range
+            for kf in [kf for kf in fcurve.keyframe_points if frames[0] <= kf.co.x <= frames[-1]][::-1]:
+                fcurve.keyframe_points.remove(kf, fast=True)
+        else:
+            fcurve = fcurves.new(data_path, index=index)
+        offset = len(fcurve.keyframe_points)
+        fcurve.keyframe_points.add(len(frames))
+        for kf, frame, value in zip(list(fcurve.keyframe_points)[offset:], frames, values[:, index]):
+            kf.co = (float(frame), float(value))
+            kf.interpolation = 'LINEAR'
+        fcurve.keyframe_points.sort()
+        fcurve.update()
+
+class CameraPath:
+    """Smooth camera path through waypoints, traversed by arc length.
+
+    ``look_at`` optionally gives one target point per waypoint; the
+    target then follows its own spline in step with the camera.
+    """
+    def __init__(self, waypoints: Sequence[Sequence[float]], look_at: Optional[Sequence[Sequence[float]]] = None,
+                 samples_per_segment: int = 64, alpha: float = 0.5):
+        self.waypoints = np.asarray(waypoints, dtype=np.float64)
+        if len(self.waypoints) < 2:
+            raise ValueError("A camera path needs at least two waypoints")
+        self.look_at = None if look_at is None else np.asarray(look_at, dtype=np.float64)
+        if self.look_at is not None and self.look_at.shape != self.waypoints.shape:
+            raise ValueError("look_at needs one point per waypoint")
+        self.logger = SceneXLogger("CameraPath")
+
+        self.points = catmull_rom(self.waypoints, samples_per_segment, alpha)
+        self.targets = None if self.look_at is None else catmull_rom(self.look_at, samples_per_segment, alpha)
+        # Cumulative arc length at every dense sample
+        steps = np.linalg.norm(np.diff(self.points, axis=0), axis=1)
+        self.lengths = np.concatenate([[0.0], np.cumsum(steps)])
+
+    @property
+    def length(self) -> float:
+        return float(self.lengths[-1])
+
+    def _lookup(self, table: np.ndarray, fractions: np.ndarray) -> np.ndarray:
+        distance = np.clip(fractions, 0.0, 1.0) * self.lengths[-1]
+        return np.column_stack([np.interp(distance, self.lengths, table[:, axis])
+                                for axis in range(table.shape[1])])
+
+    def point_at(self, fractions: np.ndarray) -> np.ndarray:
+        """Positions at fractions of the path length"""
+        return self._lookup(self.points, np.atleast_1d(np.asarray(fractions, dtype=np.float64)))
+
+    def target_at(self, fractions: np.ndarray) -> Optional[np.ndarray]:
+        """Look-at points matching ``point_at``, or None without look-at targets"""
+        if self.targets is None:
+            return None
+        return self._lookup(self.targets, np.atleast_1d(np.asarray(fractions, dtype=np.float64)))
+
+    def sample(self, count: int, rate_func: Callable[[float], float] = RateFunc.linear
+               ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Camera (and look-at) positions at ``count`` evenly spaced times"""
+        fractions = apply_rate(rate_func, np.linspace(0.0, 1.0, count))
+        return self.point_at(fractions), self.target_at(fractions)
+
+    def keyframe(self, camera_system, start_frame: int, end_frame: int,
+                 rate_func: Callable[[float], float] = RateFunc.linear, tolerance: float = 1e-3) -> int:
+        """Key the camera (and target) along the path with as few LINEAR keys as
+        keep every frame within ``tolerance``. Returns the number of keys."""
+        frames = np.arange(start_frame, end_frame + 1, dtype=np.float64)
+        positions, targets = self.sample(len(frames), rate_func)
+        camera, target = camera_system.camera, camera_system.target
+
+        written = 0
+        if targets is not None and target is not None:
+            kept = simplify(frames, targets, tolerance)
+            write_keyframes(target, "location", frames[kept], targets[kept])
+            target.location = targets[-1]
+            written += len(kept) * 3
+        if camera.parent is not None and camera.parent == target:
+            # Attached camera: keys are in target space
+            rotation = np.array(target.rotation_euler.to_matrix())
+            anchors = targets if targets is not None else np.array(target.location)[None, :]
+            positions = (positions - anchors) @ rotation
+        kept = simplify(frames, positions, tolerance)
+        write_keyframes(camera, "location", frames[kept], positions[kept])
+        camera.location = positions[-1]  # Later moves continue from the end of the path
+        written += len(kept) * 3
+        self.logger.info(f"Path of length {self.length:.2f} keyed over {len(frames)} frames "
+                         f"with {written} keyframes")
+        return written
+
+    def follow_path(self, camera_system, start_frame: int, end_frame: int,
+                    rate_func: Callable[[float], float] = RateFunc.linear, resolution: int = 512,
+                    tolerance: float = 1e-4) -> bpy.types.Object:
+        """Drive the camera with a Follow Path constraint on a generated curve.
+
+        The curve's points are spaced evenly by arc length, so the
+        constraint's offset factor is the traveled fraction; the rate
+        function is keyed on that single value.
+        """
+        camera, target = camera_system.camera, camera_system.target
+        fractions = np.linspace(0.0, 1.0, resolution)
+        co = np.ones((resolution, 4), dtype=np.float32)
+        co[:, :3] = self.point_at(fractions)
+        curve = bpy.data.curves.new("camera_path", 'CURVE')
+        curve.dimensions = '3D'
+        spline = curve.splines.new('POLY')
+        spline.points.add(resolution - 1)
+        spline.points.foreach_set("co", co.ravel())
+        path = bpy.data.objects.new("camera_path", curve)
+        bpy.context.scene.collection.objects.link(path)
+
+        # The constraint places the camera in world space
+        if camera.parent is not None:
+            world = camera.matrix_world.copy()
+            camera.parent = None
+            camera.matrix_world = world
+        # Follow Path offsets by the object's location: drop location keys and zero it
+        action = camera.animation_data.action if camera.animation_data else None
+        if action is not None:
+            for fcurve in [fc for fc in action.fcurves if fc.data_path == "location"]:
+                action.fcurves.remove(fcurve)
+        camera.location = (0, 0, 0)
+        follow = camera.constraints.new(type='FOLLOW_PATH')
+        follow.target = path
+        follow.use_fixed_location = True
+        # Evaluate the path before the Track To constraint aims the camera
+        camera.constraints.move(len(camera.constraints) - 1, 0)
+
+        frames = np.arange(start_frame, end_frame + 1, dtype=np.float64)
+        offsets = apply_rate(rate_func, np.linspace(0.0, 1.0, len(frames)))[:, None]
+        kept = simplify(frames, offsets, tolerance)
+        for frame, value in zip(frames[kept], offsets[kept, 0]):
+            follow.offset_factor = float(value)
+            camera.keyframe_insert(data_path=f'constraints["{follow.name}"].offset_factor', frame=float(frame))
+        for fc in camera.animation_data.action.fcurves:
+            if fc.data_path.endswith(".offset_factor"):
+                for kf in fc.keyframe_points:
+                    kf.interpolation = 'LINEAR'
+
+        if self.targets is not None and target is not None:
+            targets = self.target_at(apply_rate(rate_func, np.linspace(0.0, 1.0, len(frames))))
+            kept = simplify(frames, targets, tolerance)
+            write_keyframes(target, "location", frames[kept], targets[kept])
+        return path
@@ -3,7 +3,7 @@ import bpy
 import mathutils
 from src.utils.logger import SceneXLogger
 from dataclasses import dataclass
-from typing import Optional, Tuple, List, Dict
+from typing import Callable, Optional, Tuple, List, Dict
 
 @dataclass
 class GridConfig:
@@ -18,6 +18,7 @@ class GridConfig:
     axes_color: Tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0)
     show_numbers: bool = True
     number_scale: float = 0.3
+    number_format: Optional[Callable[[str, int], Optional[str]]] = None  # (axis, grid index) -> label or None
 
 class CoordinateSystem:
     """Manim-style coordinate system"""
@@ -49,13 +50,13 @@ class CoordinateSystem:
         self.logger.info("Creating axes")
         
         # Create X axis
-        x_start = mathutils.Vector((config.x_range[0], 0, 0)) * self.scale
-        x_end = mathutils.Vector((config.x_range[1], 0, 0)) * self.scale
+        x_start = mathutils.Vector((config.x_range[0], 0, 0)) * self.scale + self.origin
+        x_end = mathutils.Vector((config.x_range[1], 0, 0)) * self.scale + self.origin
         self.axes['x'] = self._create_line(x_start, x_end, config.axes_color, config.line_thickness * 2)
         
         # Create Y axis
-        y_start = mathutils.Vector((0, config.y_range[0], 0)) * self.scale
-        y_end = mathutils.Vector((0, config.y_range[1], 0)) * self.scale
+        y_start = mathutils.Vector((0, config.y_range[0], 0)) * self.scale + self.origin
+        y_end = mathutils.Vector((0, config.y_range[1], 0)) * self.scale + self.origin
         self.axes['y'] = self._create_line(y_start, y_end, config.axes_color, config.line_thickness * 2)
 
     def _create_grid_lines(self, config: GridConfig):
@@ -66,8 +67,8 @@ class CoordinateSystem:
         for x in range(int(config.x_range[0]), int(config.x_range[1]) + 1):
             if x == 0:  # Skip zero as it's the axis
                 continue
-            start = mathutils.Vector((x, config.y_range[0], 0)) * self.scale
-            end = mathutils.Vector((x, config.y_range[1], 0)) * self.scale
+            start = mathutils.Vector((x, config.y_range[0], 0)) * self.scale + self.origin
+            end = mathutils.Vector((x, config.y_range[1], 0)) * self.scale + self.origin
             line = self._create_line(start, end, config.color, config.line_thickness)
             self.grid_lines.append(line)
 
@@ -75,8 +76,8 @@ class CoordinateSystem:
         for y in range(int(config.y_range[0]), int(config.y_range[1]) + 1):
             if y == 0:  # Skip zero as it's the axis
                 continue
-            start = mathutils.Vector((config.x_range[0], y, 0)) * self.scale
-            end = mathutils.Vector((config.x_range[1], y, 0)) * self.scale
+            start = mathutils.Vector((config.x_range[0], y, 0)) * self.scale + self.origin
+            end = mathutils.Vector((config.x_range[1], y, 0)) * self.scale + self.origin
             line = self._create_line(start, end, config.color, config.line_thickness)
             self.grid_lines.append(line)
 
@@ -116,19 +117,23 @@ class CoordinateSystem:
         """Create number labels for axes"""
         self.logger.info("Creating number labels")
         
+        label = config.number_format or (lambda axis, value: str(value))
+
         # Create x axis numbers
         for x in range(int(config.x_range[0]), int(config.x_range[1]) + 1):
-            if x == 0:
+            text = label('x', x)
+            if x == 0 or text is None:
                 continue
-            pos = mathutils.Vector((x, -0.3, 0)) * self.scale
-            self._create_number_text(str(x), pos, config.number_scale)
+            pos = mathutils.Vector((x, -0.3, 0)) * self.scale + self.origin
+            self._create_number_text(text, pos, config.number_scale)
 
         # Create y axis numbers
         for y in range(int(config.y_range[0]), int(config.y_range[1]) + 1):
-            if y == 0:
+            text = label('y', y)
+            if y == 0 or text is None:
                 continue
-            pos = mathutils.Vector((-0.3, y, 0)) * self.scale
-            self._create_number_text(str(y), pos, config.number_scale)
+            pos = mathutils.Vector((-0.3, y, 0)) * self.scale + self.origin
+            self._create_number_text(text, pos, config.number_scale)
 
     def _create_number_text(self, text: str, location: mathutils.Vector, scale: float):
         """Create a number text object"""
@@ -138,8 +143,14 @@ class CoordinateSystem:
         text_obj.scale = (scale, scale, scale)
         self.numbers.append(text_obj)
 
-    def place_object(self, obj: bpy.types.Object, position: mathutils.Vector):
-        """Place object using Manim-style coordinates"""
+    def place_object(self, obj: bpy.types.Object, position: mathutils.Vector, apply_scale: bool = False):
+        """Place object using Manim-style coordinates.
+
+        With apply_scale the object is also scaled by the coordinate scale,
+        for geometry built in math units such as plotted graphs.
+        """
         world_pos = self.origin + position * self.scale
         obj.location = world_pos
+        if apply_scale:
+            obj.scale = (self.scale, self.scale, self.scale)
         self.logger.debug(f"Placed object at world position: {world_pos}")
\ No newline at end of file
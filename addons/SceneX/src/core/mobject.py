@@ -1,18 +1,271 @@
 import bpy
 import mathutils
-from typing import List, Optional
+import numpy as np
+from typing import Callable, List, Optional, Sequence
+from ..animation.updaters import Updater, UpdaterGraph, get_updater_graph
 from ..utils.logger import SceneXLogger
 
+OUT = np.array([0.0, 0.0, 1.0])
+
 class Mobject:
-    """Base class for mobile objects with Manim-style functionality"""
-    def __init__(self):
+    """Base class for mobile objects with Manim-style functionality.
+
+    ``points`` is one contiguous (N, 3) float array in the local space of
+    ``object``; every transform is a single NumPy operation per family
+    member and only flags the member dirty. ``sync`` then writes dirty
+    points to Blender with ``foreach_set``. The base class maps points to
+    mesh vertices; VMobject maps them to Bezier curves.
+    """
+    def __init__(self, points: Optional[np.ndarray] = None):
         self.object = None
-        self.points = []
-        self.submobjects = []
+        self.points = np.zeros((0, 3)) if points is None else np.array(points, dtype=np.float64).reshape(-1, 3)
+        self.submobjects: List["Mobject"] = []
+        self.parents: List["Mobject"] = []
+        self.dirty = True
+        self._family: Optional[List["Mobject"]] = None
         self.logger = SceneXLogger("Mobject")
-        
-    def add(self, *mobjects):
+
+    # Hierarchy
+    def add(self, *mobjects: "Mobject") -> "Mobject":
         """Add submobjects (Manim-style)"""
-        
-    def shift(self, vector):
-        """Move by vector (Manim-style)"""
\ No newline at end of file
+        for mobject in mobjects:
+            if mobject is self:
+                raise ValueError("Mobject cannot contain itself")
+            if mobject not in self.submobjects:
+                self.submobjects.append(mobject)
+                mobject.parents.append(self)
+        self._invalidate_family()
+        return self
+
+    def remove(self, *mobjects: "Mobject") -> "Mobject":
+        for mobject in mobjects:
+            if mobject in self.submobjects:
+                self.submobjects.remove(mobject)
+                mobject.parents.remove(self)
+        self._invalidate_family()
+        return self
+
+    def get_family(self) -> List["Mobject"]:
+        """Self and all descendants, flattened once and cached until the tree changes"""
+        if self._family is None:
+            family, seen = [], set()
+            stack = [self]
+            while stack:
+                mobject = stack.pop()
+                if id(mobject) in seen:
+                    continue
+                seen.add(id(mobject))
+                family.append(mobject)
+                stack.extend(reversed(mobject.submobjects))
+            self._family = family
+        return self._family
+
+    def _invalidate_family(self):
+        # Ancestors may hold a cached family even when this one does not
+        stack, seen = [self], set()
+        while stack:
+            mobject = stack.pop()
+            if id(mobject) in seen:
+                continue
+            seen.add(id(mobject))
+            mobject._family = None
+            stack.extend(mobject.parents)
+
+    # Geometry queries
+    def get_all_points(self) -> np.ndarray:
+        arrays = [m.points for m in self.get_family() if len(m.points)]
+        return np.vstack(arrays) if arrays else np.zeros((0, 3))
+
+    def get_bounding_box(self) -> np.ndarray:
+        """[[min x, y, z], [max x, y, z]] over the family"""
+        boxes = [(m.points.min(axis=0), m.points.max(axis=0)) for m in self.get_family() if len(m.points)]
+        if not boxes:
+            return np.zeros((2, 3))
+        lows, highs = zip(*boxes)
+        return np.array([np.min(lows, axis=0), np.max(highs, axis=0)])
+
+    def get_center(self) -> np.ndarray:
+        return self.get_bounding_box().mean(axis=0)
+
+    # Transforms
+    def apply_points_function(self, function: Callable[[np.ndarray], np.ndarray],
+                              about_point: Optional[Sequence[float]] = None) -> "Mobject":
+        """Apply ``function`` to every (N, 3) point array of the family, relative to ``about_point``"""
+        about = np.zeros(3) if about_point is None else np.asarray(about_point, dtype=np.float64)
+        for mobject in self.get_family():
+            if not len(mobject.points):
+                continue
+            if about_point is None:
+                mobject.points = function(mobject.points)
+            else:
+                mobject.points = function(mobject.points - about) + about
+            mobject.dirty = True
+        return self
+
+    def apply_function(self, function: Callable[[np.ndarray], np.ndarray]) -> "Mobject":
+        """Map points through a vectorized function of an (N, 3) array"""
+        return self.apply_points_function(function)
+
+    def apply_matrix(self, matrix, about_point: Optional[Sequence[float]] = None) -> "Mobject":
+        matrix = np.asarray(matrix, dtype=np.float64)[:3, :3]
+        if about_point is None:
+            about_point = self.get_center()
+        return self.apply_points_function(lambda points: points @ matrix.T, about_point)
+
+    def shift(self, vector) -> "Mobject":
+        """Move by vector (Manim-style)"""
+        offset = np.asarray(vector, dtype=np.float64)
+        for mobject in self.get_family():
+            if len(mobject.points):
+                mobject.points += offset
+                mobject.dirty = True
+        return self
+
+    def scale(self, factor, about_point: Optional[Sequence[float]] = None) -> "Mobject":
+        """Scale uniformly or per axis about ``about_point`` (default: center)"""
+        factor = np.broadcast_to(np.asarray(factor, dtype=np.float64), (3,))
+        if about_point is None:
+            about_point = self.get_center()
+        return self.apply_points_function(lambda points: points * factor, about_point)
+
+    def rotate(self, angle: float, axis=OUT, about_point: Optional[Sequence[float]] = None) -> "Mobject":
+        rotation = np.array(mathutils.Matrix.Rotation(angle, 3, mathutils.Vector(axis)))
+        return self.apply_matrix(rotation, about_point)
+
+    def move_to(self, point) -> "Mobject":
+        return self.shift(np.asarray(point, dtype=np.float64) - self.get_center())
+
+    # Updaters
+    def add_updater(self, function: Callable[["Mobject", float], None], depends_on: Sequence = (),
+                    graph: Optional[UpdaterGraph] = None) -> Updater:
+        """Run ``function(self, frame)`` every frame, after the updaters of ``depends_on``"""
+        return (graph or get_updater_graph()).add_updater(self, function, depends_on)
+
+    def clear_updaters(self, graph: Optional[UpdaterGraph] = None) -> "Mobject":
+        (graph or get_updater_graph()).clear_updaters(self)
+        return self
+
+    # Blender sync
+    def create(self) -> bpy.types.Object:
+        """Point cloud mesh holding ``points`` as vertices"""
+        mesh = bpy.data.meshes.new("Mobject")
+        self.object = bpy.data.objects.new("Mobject", mesh)
+        bpy.context.collection.objects.link(self.object)
+        self.dirty = True
+        self._push()
+        return self.object
+
+    def sync(self) -> int:
+        """Write dirty point arrays of the family to Blender; returns how many were written"""
+        written = 0
+        for mobject in self.get_family():
+            if mobject.dirty and mobject.object is not None:
+                mobject._push()
+                written += 1
+        return written
+
+    def _push(self):
+        mesh = self.object.data
+        if len(mesh.vertices) != len(self.points):
+            mesh.clear_geometry()
+            mesh.vertices.add(len(self.points))
+        mesh.vertices.foreach_set("co", self.points.astype(np.float32).ravel())
+        mesh.update()
+        self.dirty = False
+
+
+class VMobject(Mobject):
+    """Vectorized mobject: cubic Bezier splines in one contiguous point array.
+
+    Every Bezier control point takes three rows of ``points`` in Blender's
+    order (handle_left, anchor, handle_right), so anchors and handles are
+    strided views of the same array and transforms stay a single NumPy
+    operation. ``spline_sizes`` holds the control point count of each
+    spline and ``cyclic`` whether it is closed.
+    """
+    def __init__(self, stroke_width: float = 0.02, resolution: int = 12):
+        super().__init__()
+        self.spline_sizes: List[int] = []
+        self.cyclic: List[bool] = []
+        self.stroke_width = stroke_width
+        self.resolution = resolution
+        self._topology = None  # Spline layout last written to Blender
+
+    @property
+    def anchors(self) -> np.ndarray:
+        return self.points[1::3]
+
+    @property
+    def handles_left(self) -> np.ndarray:
+        return self.points[0::3]
+
+    @property
+    def handles_right(self) -> np.ndarray:
+        return self.points[2::3]
+
+    def set_anchors_and_handles(self, anchors, handles_left, handles_right,
+                                spline_sizes: Optional[Sequence[int]] = None,
+                                cyclic: Optional[Sequence[bool]] = None) -> "VMobject":
+        anchors = np.asarray(anchors, dtype=np.float64).reshape(-1, 3)
+        points = np.empty((len(anchors) * 3, 3))
+        points[0::3] = np.asarray(handles_left, dtype=np.float64).reshape(-1, 3)
+        points[1::3] = anchors
+        points[2::3] = np.asarray(handles_right, dtype=np.float64).reshape(-1, 3)
+        self.points = points
+        self.spline_sizes = list(spline_sizes) if spline_sizes is not None else [len(anchors)]
+        self.cyclic = list(cyclic) if cyclic is not None else [False] * len(self.spline_sizes)
+        if sum(self.spline_sizes) != len(anchors):
+            raise ValueError("spline_sizes must add up to the number of anchors")
+        self.dirty = True
+        return self
+
+    def set_points_as_corners(self, anchors, closed: bool = False) -> "VMobject":
+        """Straight segments through ``anchors`` (handles on the anchors)"""
+        anchors = np.asarray(anchors, dtype=np.float64).reshape(-1, 3)
+        return self.set_anchors_and_handles(anchors, anchors, anchors, cyclic=[closed])
+
+    def set_points_smoothly(self, anchors, closed: bool = False) -> "VMobject":
+        """Smooth curve through ``anchors`` with Catmull-Rom tangents"""
+        anchors = np.asarray(anchors, dtype=np.float64).reshape(-1, 3)
+        if closed:
+            tangents = (np.roll(anchors, -1, axis=0) - np.roll(anchors, 1, axis=0)) / 6
+        else:
+            padded = np.vstack([2 * anchors[:1] - anchors[1:2], anchors, 2 * anchors[-1:] - anchors[-2:-1]])
+            tangents = (padded[2:] - padded[:-2]) / 6
+        return self.set_anchors_and_handles(anchors, anchors - tangents, anchors + tangents, cyclic=[closed])
+
+    def create(self) -> bpy.types.Object:
+        curve = bpy.data.curves.new("VMobject", 'CURVE')
+        curve.dimensions = '3D'
+        curve.bevel_depth = self.stroke_width
+        curve.resolution_u = self.resolution
+        self.object = bpy.data.objects.new("VMobject", curve)
+        bpy.context.collection.objects.link(self.object)
+        self.dirty = True
+        self._push()
+        return self.object
+
+    def _push(self):
+        curve = self.object.data
+        topology = (tuple(self.spline_sizes), tuple(self.cyclic))
+        if topology != self._topology:
+            # Spline layout changed: rebuild splines, then only coordinates are written
+            curve.splines.clear()
+            for size, cyclic in zip(self.spline_sizes, self.cyclic):
+                spline = curve.splines.new('BEZIER')
+                spline.bezier_points.add(size - 1)
+                spline.use_cyclic_u = cyclic
+                for point in spline.bezier_points:
+                    point.handle_left_type = point.handle_right_type = 'FREE'
+            self._topology = topology
+
+        points = self.points.astype(np.float32)
+        start = 0
+        for spline, size in zip(curve.splines, self.spline_sizes):
+            block = points[start * 3:(start + size) * 3]
+            spline.bezier_points.foreach_set("co", block[1::3].ravel())
+            spline.bezier_points.foreach_set("handle_left", block[0::3].ravel())
+            spline.bezier_points.foreach_set("handle_right", block[2::3].ravel())
+            start += size
+        curve.update_tag()
+        self.dirty = False
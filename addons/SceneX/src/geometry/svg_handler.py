@@ -1,149 +1,171 @@
 # SceneX/src/geometry/svg_handler.py
 
 import bpy
-import xml.etree.ElementTree as ET
-import math
-from pathlib import Path
-from mathutils import Vector, Matrix
+import os
+import time
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+from typing import Dict, List, Optional, Sequence
 from ..utils.logger import SceneXLogger
+from ..utils.process_pool import map_in_workers
+from .svg_path import (
+    IDENTITY,
+    Affine,
+    SVGCurveBuffers,
+    bezier_arrays,
+    iter_svg_paths,
+    multiply_affine,
+    parse_path,
+    parse_svg_file
+)
 
 class SVGHandler:
     def __init__(self):
         self.logger = SceneXLogger("SVGHandler")
         self.scale = 1.0
-        self.commands = {
-            'M': self._move_to,
-            'L': self._line_to,
-            'H': self._horizontal_line_to,
-            'V': self._vertical_line_to,
-            'C': self._cubic_bezier,
-            'S': self._smooth_cubic_bezier,
-            'Q': self._quadratic_bezier,
-            'T': self._smooth_quadratic_bezier,
-            'A': self._arc,
-            'Z': self._close_path
-        }
+        self.flip_y = True  # SVG y axis points down, Blender's points up
+        self.last_timings: Dict[str, float] = {}  # Stage timings of the last batch import
+
+    def import_svg(self, filepath: str) -> bpy.types.Collection:
+        """Import SVG file and convert to Blender curves.
 
-    def import_svg(self, filepath: str) -> bpy.types.Object:
-        """Import SVG file and convert to Blender curves"""
+        The document is streamed with ``iterparse`` so large files are
+        processed with bounded memory; each shape becomes one curve object
+        with a spline per subpath.
+        """
         try:
-            tree = ET.parse(filepath)
-            root = tree.getroot()
-            
             # Create empty collection for SVG parts
             collection = bpy.data.collections.new("SVG_Parts")
             bpy.context.scene.collection.children.link(collection)
             
             # Process SVG elements
-            self._process_element(root, collection)
-            
+            count = 0
+            for path_data, transform, attrib in iter_svg_paths(filepath):
+                curve = self._create_curve_from_path(path_data, transform, attrib.get('id', 'path'))
+                if curve:
+                    collection.objects.link(curve)
+                    count += 1
+
+            self.logger.info(f"Imported {count} SVG shapes from {filepath}")
             return collection
             
         except Exception as e:
             self.logger.error(f"Error importing SVG: {str(e)}")
             return None
 
-    def _process_element(self, element: ET.Element, collection: bpy.types.Collection):
-        """Process SVG element and its children"""
-        if element.tag.endswith('path'):
-            path_data = element.get('d')
-            if path_data:
-                curve = self._create_curve_from_path(path_data)
-                if curve:
-                    collection.objects.link(curve)
-                    
-        for child in element:
-            self._process_element(child, collection)
+    def import_svg_files(self, filepaths: Sequence[str],
+                         workers: Optional[int] = None) -> Dict[str, bpy.types.Collection]:
+        """Import many SVG files, parsing them in parallel worker processes.
+
+        XML parsing, path tokenizing and bezier conversion run in a process
+        pool and return packed NumPy buffers (see ``parse_svg_file``); all
+        datablocks are then created here on the main thread in one pass.
+        Returns one collection per file, keyed by file path. Stage timings
+        are logged and kept in ``last_timings``.
+        """
+        filepaths = [str(path) for path in filepaths]
+        workers = workers or os.cpu_count() or 1
+
+        start = time.perf_counter()
+        buffers = self._parse_files(filepaths, workers)
+        parse_wall = time.perf_counter() - start
 
-    def _create_curve_from_path(self, path_data: str) -> bpy.types.Object:
+        start = time.perf_counter()
+        root = bpy.data.collections.new("SVG_Batch")
+        collections = {}
+        for item in buffers:
+            collection = bpy.data.collections.new(os.path.splitext(os.path.basename(item.source))[0])
+            for obj in self._create_curves(item):
+                collection.objects.link(obj)
+            root.children.link(collection)
+            collections[item.source] = collection
+        bpy.context.scene.collection.children.link(root)
+        build = time.perf_counter() - start
+
+        worker_parse = sum(item.timings['parse'] for item in buffers)
+        worker_pack = sum(item.timings['pack'] for item in buffers)
+        self.last_timings = {
+            'workers': workers,
+            'parse': worker_parse,
+            'pack': worker_pack,
+            'parallel_wall': parse_wall,
+            'build': build,
+            # Worker CPU time over wall time, not a speedup over one worker
+            'busy_cores': (worker_parse + worker_pack) / parse_wall if parse_wall else 0.0,
+        }
+        shapes = sum(item.shape_count for item in buffers)
+        self.logger.info(
+            f"Imported {shapes} SVG shapes from {len(buffers)} files: "
+            f"parse {worker_parse:.2f}s + pack {worker_pack:.2f}s on {workers} workers "
+            f"in {parse_wall:.2f}s ({self.last_timings['busy_cores']:.1f} of {os.cpu_count()} cores busy), "
+            f"build {build:.2f}s")
+        return collections
+
+    def _parse_files(self, filepaths: List[str], workers: int) -> List[SVGCurveBuffers]:
+        """Run ``parse_svg_file`` over all files, in a process pool when workers > 1"""
+        transform = self._base_transform()
+        if workers > 1 and len(filepaths) > 1:
+            chunksize = max(1, len(filepaths) // (workers * 4))
+            try:
+                results = map_in_workers("parse_svg_file", filepaths, repeat(transform),
+                                         workers=workers, chunksize=chunksize)
+                return [SVGCurveBuffers(**result) for result in results]
+            except (BrokenProcessPool, OSError) as e:
+                self.logger.warning(f"Process pool unavailable, parsing on main thread: {str(e)}")
+        return [parse_svg_file(path, transform) for path in filepaths]
+
+    def _create_curves(self, buffers: SVGCurveBuffers) -> List[bpy.types.Object]:
+        """Create one curve object per shape from packed buffers"""
+        objects = []
+        splines = buffers.spline_offsets
+        for shape, name in enumerate(buffers.names):
+            curve_data = bpy.data.curves.new(name, 'CURVE')
+            curve_data.dimensions = '3D'
+            for i in range(buffers.shape_offsets[shape], buffers.shape_offsets[shape + 1]):
+                points = slice(splines[i], splines[i + 1])
+                self._build_spline(curve_data, buffers.co[points], buffers.handle_left[points],
+                                   buffers.handle_right[points], bool(buffers.cyclic[i]))
+            objects.append(bpy.data.objects.new(name, curve_data))
+        return objects
+
+    def _create_curve_from_path(self, path_data: str, transform: Affine = IDENTITY,
+                                name: str = 'path') -> bpy.types.Object:
         """Convert SVG path data to Blender curve"""
         try:
-            curve_data = bpy.data.curves.new('path', 'CURVE')
+            subpaths = parse_path(path_data)
+            if not subpaths:
+                return None
+
+            matrix = multiply_affine(self._base_transform(), transform)
+            curve_data = bpy.data.curves.new(name, 'CURVE')
             curve_data.dimensions = '3D'
             
-            spline = curve_data.splines.new('BEZIER')
-            commands = self._parse_path_data(path_data)
-            
-            current_point = Vector((0, 0, 0))
-            for cmd, params in commands:
-                if cmd in self.commands:
-                    current_point = self.commands[cmd](spline, current_point, params)
+            for subpath in subpaths:
+                co, handle_left, handle_right = bezier_arrays(subpath, matrix)
+                self._build_spline(curve_data, co, handle_left, handle_right, subpath.closed)
             
-            curve_obj = bpy.data.objects.new('path', curve_data)
+            curve_obj = bpy.data.objects.new(name, curve_data)
             return curve_obj
             
         except Exception as e:
             self.logger.error(f"Error creating curve: {str(e)}")
             return None
 
-    def _parse_path_data(self, path_data: str) -> list:
-        """Parse SVG path data into command list"""
-        commands = []
-        current_cmd = None
-        current_params = []
-        
-        # Split path data into tokens
-        tokens = path_data.replace(',', ' ').split()
-        
-        for token in tokens:
-            if token[0].isalpha():
-                if current_cmd:
-                    commands.append((current_cmd, current_params))
-                current_cmd = token
-                current_params = []
-            else:
-                current_params.append(float(token))
-                
-        if current_cmd:
-            commands.append((current_cmd, current_params))
-            
-        return commands
-
-    # Path command implementations
-    def _move_to(self, spline, current, params):
-        point = Vector((params[0], params[1], 0)) * self.scale
-        return point
-
-    def _line_to(self, spline, current, params):
-        point = Vector((params[0], params[1], 0)) * self.scale
-        self._add_line_point(spline, current, point)
-        return point
-
-    def _horizontal_line_to(self, spline, current, params):
-        point = Vector((params[0], current.y, 0)) * self.scale
-        self._add_line_point(spline, current, point)
-        return point
-
-    def _vertical_line_to(self, spline, current, params):
-        point = Vector((current.x, params[0], 0)) * self.scale
-        self._add_line_point(spline, current, point)
-        return point
-
-    def _cubic_bezier(self, spline, current, params):
-        c1 = Vector((params[0], params[1], 0)) * self.scale
-        c2 = Vector((params[2], params[3], 0)) * self.scale
-        end = Vector((params[4], params[5], 0)) * self.scale
-        self._add_bezier_point(spline, current, c1, c2, end)
-        return end
-
-    def _add_line_point(self, spline, start, end):
-        """Add line segment to spline"""
-        spline.bezier_points.add(1)
-        point = spline.bezier_points[-1]
-        point.co = end
-        point.handle_left = start
-        point.handle_right = end
-
-    def _add_bezier_point(self, spline, start, c1, c2, end):
-        """Add bezier curve segment to spline"""
-        spline.bezier_points.add(1)
-        point = spline.bezier_points[-1]
-        point.co = end
-        point.handle_left = c1
-        point.handle_right = c2
-
-    def _close_path(self, spline, current, params):
-        """Close the current path"""
-        if len(spline.bezier_points) > 0:
-            spline.use_cyclic_u = True
-        return current
\ No newline at end of file
+    def _base_transform(self) -> Affine:
+        """Scale (and y flip) applied on top of the document transforms"""
+        return (self.scale, 0.0, 0.0, -self.scale if self.flip_y else self.scale, 0.0, 0.0)
+
+    def _build_spline(self, curve_data, co, handle_left, handle_right, cyclic: bool):
+        """Create a bezier spline in one allocation and fill it with foreach_set.
+
+        Points added through the API start with FREE handles, so the handle
+        positions written here are kept as is.
+        """
+        spline = curve_data.splines.new('BEZIER')
+        spline.bezier_points.add(len(co) - 1)
+        points = spline.bezier_points
+        points.foreach_set("co", co.ravel())
+        points.foreach_set("handle_left", handle_left.ravel())
+        points.foreach_set("handle_right", handle_right.ravel())
+        spline.use_cyclic_u = cyclic
+        return spline
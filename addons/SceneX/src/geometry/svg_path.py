@@ -0,0 +1,524 @@
+# SceneX/src/geometry/svg_path.py
+"""
+SVG path data, transform and document parsing, and polyline flattening.
+Pure Python (no bpy) so it can be used outside Blender, in worker processes
+and by other addons (BelnderGenAI loads this file for its connections).
+"""
+
+import logging
+import math
+import re
+import time
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Tuple
+import numpy as np
+
+Point = Tuple[float, float]
+Affine = Tuple[float, float, float, float, float, float]  # a b c d e f (SVG matrix order)
+
+IDENTITY: Affine = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+# Plain logging (no SceneXLogger) keeps the module free of SceneX imports
+logger = logging.getLogger("SVGPath")
+
+COMMAND_RE = re.compile(r'([MmZzLlHhVvCcSsQqTtAa])([^MmZzLlHhVvCcSsQqTtAa]*)')
+NUMBER_RE = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+SEPARATOR_RE = re.compile(r'[\s,]*')
+TRANSFORM_RE = re.compile(r'(matrix|translate|scale|rotate|skewX|skewY)\s*\(([^)]*)\)')
+
+# Number of arguments consumed by one repetition of each command
+ARG_COUNTS = {'M': 2, 'L': 2, 'H': 1, 'V': 1, 'C': 6, 'S': 4,
+              'Q': 4, 'T': 2, 'A': 7, 'Z': 0}
+
+@dataclass
+class SVGSubpath:
+    """One continuous subpath as cubic bezier segments in absolute coordinates"""
+    start: Point
+    segments: List[Tuple[Point, Point, Point]] = field(default_factory=list)  # (c1, c2, end)
+    closed: bool = False
+
+class SVGPathError(ValueError):
+    """Raised for malformed path data"""
+
+def tokenize_path(path_data: str) -> Iterator[Tuple[str, List[float]]]:
+    """Split path data into (command, arguments) pairs.
+
+    Handles compact forms such as ``M10-5L20,30`` or ``.5.5`` and the
+    single-character arc flags allowed by the grammar (``a1 1 0 0010 10``).
+    """
+    for match in COMMAND_RE.finditer(path_data):
+        command, arguments = match.group(1), match.group(2)
+        if command in 'Aa':
+            yield command, _scan_arc_arguments(arguments)
+        else:
+            yield command, [float(n) for n in NUMBER_RE.findall(arguments)]
+
+def _scan_arc_arguments(text: str) -> List[float]:
+    values = []
+    position = 0
+    length = len(text)
+    while True:
+        position = SEPARATOR_RE.match(text, position).end()
+        if position >= length:
+            break
+        slot = len(values) % 7
+        if slot in (3, 4):
+            flag = text[position]
+            if flag not in '01':
+                raise SVGPathError(f"Invalid arc flag {flag!r} in {text!r}")
+            values.append(float(flag))
+            position += 1
+            continue
+        number = NUMBER_RE.match(text, position)
+        if not number:
+            raise SVGPathError(f"Unexpected character {text[position]!r} in {text!r}")
+        values.append(float(number.group()))
+        position = number.end()
+    return values
+
+def parse_path(path_data: str, transform: Affine = IDENTITY) -> List[SVGSubpath]:
+    """Parse path data into subpaths of absolute cubic segments.
+
+    Relative commands, implicit command repetition (including the implicit
+    lineto after a moveto), smooth curve reflection, quadratics and
+    elliptical arcs are all normalised to cubic beziers. ``transform`` is
+    applied to every output point.
+
+    As in browsers, malformed data (``M 0 0 L``, a bad arc flag) ends the
+    path: the segments before the error are returned and a warning logged.
+    """
+    subpaths: List[SVGSubpath] = []
+    current: Optional[SVGSubpath] = None
+    x = y = 0.0
+    start_x = start_y = 0.0
+    last_control = None  # Reflection point for S/s
+    last_quad = None  # Reflection point for T/t
+
+    def emit(c1, c2, end):
+        nonlocal current
+        if current is None:
+            current = SVGSubpath(start=(x, y))
+            subpaths.append(current)
+        current.segments.append((c1, c2, end))
+
+    tokens = tokenize_path(path_data)
+    while True:
+        try:
+            command, args = next(tokens, (None, None))
+        except SVGPathError as e:
+            logger.warning(f"{e}; path {path_data[:60]!r} truncated there")
+            break
+        if command is None:
+            break
+        upper = command.upper()
+        relative = command != upper
+        count = ARG_COUNTS[upper]
+
+        if upper == 'Z':
+            if current is not None:
+                if (x, y) != (start_x, start_y):
+                    emit((x, y), (start_x, start_y), (start_x, start_y))
+                current.closed = True
+                current = None
+            x, y = start_x, start_y
+            last_control = last_quad = None
+            continue
+
+        error = None
+        if len(args) < count or len(args) % count:
+            error = f"Command {command} expects multiples of {count} arguments, got {len(args)}"
+            args = args[:len(args) - len(args) % count]  # Keep the complete repetitions
+
+        for i in range(0, len(args), count):
+            values = args[i:i + count]
+            if upper == 'M' and i > 0:
+                upper = 'L'  # Extra moveto pairs are implicit linetos
+            ox, oy = (x, y) if relative else (0.0, 0.0)
+
+            if upper == 'M':
+                x, y = values[0] + ox, values[1] + oy
+                start_x, start_y = x, y
+                current = None
+                last_control = last_quad = None
+            elif upper in 'LHV':
+                if upper == 'L':
+                    nx, ny = values[0] + ox, values[1] + oy
+                elif upper == 'H':
+                    nx, ny = values[0] + ox, y
+                else:
+                    nx, ny = x, values[0] + oy
+                emit((x, y), (nx, ny), (nx, ny))
+                x, y = nx, ny
+                last_control = last_quad = None
+            elif upper in 'CS':
+                if upper == 'C':
+                    c1 = (values[0] + ox, values[1] + oy)
+                    rest = values[2:]
+                else:
+                    reflect = last_control or (x, y)
+                    c1 = (2 * x - reflect[0], 2 * y - reflect[1])
+                    rest = values
+                c2 = (rest[0] + ox, rest[1] + oy)
+                end = (rest[2] + ox, rest[3] + oy)
+                emit(c1, c2, end)
+                x, y = end
+                last_control, last_quad = c2, None
+            elif upper in 'QT':
+                if upper == 'Q':
+                    q = (values[0] + ox, values[1] + oy)
+                    end = (values[2] + ox, values[3] + oy)
+                else:
+                    reflect = last_quad or (x, y)
+                    q = (2 * x - reflect[0], 2 * y - reflect[1])
+                    end = (values[0] + ox, values[1] + oy)
+                c1 = (x + 2 / 3 * (q[0] - x), y + 2 / 3 * (q[1] - y))
+                c2 = (end[0] + 2 / 3 * (q[0] - end[0]), end[1] + 2 / 3 * (q[1] - end[1]))
+                emit(c1, c2, end)
+                x, y = end
+                last_control, last_quad = None, q
+            elif upper == 'A':
+                end = (values[5] + ox, values[6] + oy)
+                for c1, c2, point in arc_to_cubics((x, y), values[0], values[1], values[2],
+                                                   bool(values[3]), bool(values[4]), end):
+                    emit(c1, c2, point)
+                x, y = end
+                last_control = last_quad = None
+
+        if error is not None:
+            logger.warning(f"{error}; path {path_data[:60]!r} truncated there")
+            break
+
+    if transform != IDENTITY:
+        for subpath in subpaths:
+            subpath.start = apply_affine(transform, subpath.start)
+            subpath.segments = [tuple(apply_affine(transform, p) for p in segment)
+                                for segment in subpath.segments]
+    return subpaths
+
+def bezier_arrays(subpath: SVGSubpath, transform: Affine = IDENTITY):
+    """Anchors and handles of a subpath as (n, 3) float32 arrays.
+
+    Returns ``(co, handle_left, handle_right)`` laid out for Blender bezier
+    points. For closed subpaths whose last segment ends on the start point,
+    that end anchor is folded into the first one so the cyclic spline does
+    not contain a duplicate point.
+    """
+    start = np.asarray(subpath.start, dtype=np.float64)
+    if subpath.segments:
+        segments = np.asarray(subpath.segments, dtype=np.float64)  # (m, 3, 2): c1, c2, end
+    else:
+        segments = np.empty((0, 3, 2))
+
+    co = np.vstack([start[None], segments[:, 2]])
+    handle_left = np.vstack([start[None], segments[:, 1]])
+    handle_right = np.vstack([segments[:, 0], co[-1:]])
+
+    if subpath.closed and len(segments) and np.array_equal(segments[-1, 2], start):
+        handle_left[0] = segments[-1, 1]
+        handle_right[-2] = segments[-1, 0]
+        co, handle_left, handle_right = co[:-1], handle_left[:-1], handle_right[:-1]
+
+    result = []
+    a, b, c, d, e, f = transform
+    for points in (co, handle_left, handle_right):
+        out = np.zeros((len(points), 3), dtype=np.float32)
+        out[:, 0] = a * points[:, 0] + c * points[:, 1] + e
+        out[:, 1] = b * points[:, 0] + d * points[:, 1] + f
+        result.append(out)
+    return tuple(result)
+
+def flatten_subpath(subpath: SVGSubpath, transform: Affine = IDENTITY,
+                    tolerance: float = 0.5) -> np.ndarray:
+    """Polyline through a subpath as an (n, 2) float64 array.
+
+    Each cubic is split into just enough pieces to stay within
+    ``tolerance`` (in path units) of the curve: segments whose control
+    points lie on their chord stay single lines, curved ones are sampled
+    per Wang's bound on the second differences.
+    """
+    start = np.asarray(subpath.start, dtype=np.float64)
+    if not subpath.segments:
+        points = start[None]
+    else:
+        segments = np.asarray(subpath.segments, dtype=np.float64)  # (m, 3, 2): c1, c2, end
+        p0 = np.vstack([start[None], segments[:-1, 2]])
+        p1, p2, p3 = segments[:, 0], segments[:, 1], segments[:, 2]
+
+        chord = p3 - p0
+        length = np.maximum(np.hypot(chord[:, 0], chord[:, 1]), 1e-12)
+        offset = np.maximum(np.abs(_cross2(p1 - p0, chord)), np.abs(_cross2(p2 - p0, chord))) / length
+        second = np.maximum(np.hypot(*(p0 - 2 * p1 + p2).T), np.hypot(*(p1 - 2 * p2 + p3).T))
+        counts = np.where(offset <= tolerance, 1,
+                          np.ceil(np.sqrt(0.75 * second / tolerance))).astype(np.int64)
+        counts = np.clip(counts, 1, 256)
+
+        # Sample t = 1/n .. 1 on every segment in one pass
+        segment = np.repeat(np.arange(len(counts)), counts)
+        first = np.repeat(np.cumsum(counts) - counts, counts)
+        t = ((np.arange(counts.sum()) - first + 1) / counts[segment])[:, None]
+        u = 1 - t
+        samples = (u ** 3 * p0[segment] + 3 * u * u * t * p1[segment]
+                   + 3 * u * t * t * p2[segment] + t ** 3 * p3[segment])
+        points = np.vstack([start[None], samples])
+
+    a, b, c, d, e, f = transform
+    return np.column_stack([a * points[:, 0] + c * points[:, 1] + e,
+                            b * points[:, 0] + d * points[:, 1] + f])
+
+def _cross2(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    return u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0]
+
+def arc_to_cubics(start: Point, rx: float, ry: float, rotation: float,
+                  large_arc: bool, sweep: bool, end: Point) -> List[Tuple[Point, Point, Point]]:
+    """Convert an SVG elliptical arc to cubic segments of at most 90 degrees"""
+    x1, y1 = start
+    x2, y2 = end
+    if (x1, y1) == (x2, y2):
+        return []
+    rx, ry = abs(rx), abs(ry)
+    if rx == 0 or ry == 0:
+        return [((x1, y1), (x2, y2), (x2, y2))]
+
+    phi = math.radians(rotation)
+    cos_phi, sin_phi = math.cos(phi), math.sin(phi)
+    dx, dy = (x1 - x2) / 2, (y1 - y2) / 2
+    x1p = cos_phi * dx + sin_phi * dy
+    y1p = -sin_phi * dx + cos_phi * dy
+
+    # Scale radii up if the end point is out of reach
+    radii_check = (x1p * x1p) / (rx * rx) + (y1p * y1p) / (ry * ry)
+    if radii_check > 1:
+        scale = math.sqrt(radii_check)
+        rx, ry = rx * scale, ry * scale
+
+    numerator = rx * rx * ry * ry - rx * rx * y1p * y1p - ry * ry * x1p * x1p
+    denominator = rx * rx * y1p * y1p + ry * ry * x1p * x1p
+    factor = math.sqrt(max(0.0, numerator / denominator)) if denominator else 0.0
+    if large_arc == sweep:
+        factor = -factor
+    cxp = factor * rx * y1p / ry
+    cyp = -factor * ry * x1p / rx
+    cx = cos_phi * cxp - sin_phi * cyp + (x1 + x2) / 2
+    cy = sin_phi * cxp + cos_phi * cyp + (y1 + y2) / 2
+
+    def angle(ux, uy, vx, vy):
+        return math.atan2(ux * vy - uy * vx, ux * vx + uy * vy)
+
+    theta1 = angle(1, 0, (x1p - cxp) / rx, (y1p - cyp) / ry)
+    delta = angle((x1p - cxp) / rx, (y1p - cyp) / ry, (-x1p - cxp) / rx, (-y1p - cyp) / ry)
+    if not sweep and delta > 0:
+        delta -= 2 * math.pi
+    elif sweep and delta < 0:
+        delta += 2 * math.pi
+
+    pieces = max(1, math.ceil(abs(delta) / (math.pi / 2) - 1e-9))
+    step = delta / pieces
+    alpha = 4 / 3 * math.tan(step / 4)
+
+    def point(t):
+        ct, st = math.cos(t), math.sin(t)
+        return (cx + rx * ct * cos_phi - ry * st * sin_phi,
+                cy + rx * ct * sin_phi + ry * st * cos_phi)
+
+    def derivative(t):
+        ct, st = math.cos(t), math.sin(t)
+        return (-rx * st * cos_phi - ry * ct * sin_phi,
+                -rx * st * sin_phi + ry * ct * cos_phi)
+
+    segments = []
+    t = theta1
+    p0 = (x1, y1)
+    for i in range(pieces):
+        t_next = t + step
+        p3 = point(t_next) if i < pieces - 1 else (x2, y2)
+        d0, d3 = derivative(t), derivative(t_next)
+        c1 = (p0[0] + alpha * d0[0], p0[1] + alpha * d0[1])
+        c2 = (p3[0] - alpha * d3[0], p3[1] - alpha * d3[1])
+        segments.append((c1, c2, p3))
+        p0, t = p3, t_next
+    return segments
+
+def parse_transform(text: Optional[str]) -> Affine:
+    """Parse an SVG transform attribute into an affine matrix"""
+    result = IDENTITY
+    if not text:
+        return result
+    for name, arguments in TRANSFORM_RE.findall(text):
+        values = [float(n) for n in NUMBER_RE.findall(arguments)]
+        if name == 'matrix' and len(values) == 6:
+            matrix = tuple(values)
+        elif name == 'translate' and values:
+            matrix = (1, 0, 0, 1, values[0], values[1] if len(values) > 1 else 0)
+        elif name == 'scale' and values:
+            matrix = (values[0], 0, 0, values[1] if len(values) > 1 else values[0], 0, 0)
+        elif name == 'rotate' and values:
+            a = math.radians(values[0])
+            rotate = (math.cos(a), math.sin(a), -math.sin(a), math.cos(a), 0, 0)
+            if len(values) == 3:
+                cx, cy = values[1], values[2]
+                matrix = multiply_affine(multiply_affine((1, 0, 0, 1, cx, cy), rotate),
+                                         (1, 0, 0, 1, -cx, -cy))
+            else:
+                matrix = rotate
+        elif name == 'skewX' and values:
+            matrix = (1, 0, math.tan(math.radians(values[0])), 1, 0, 0)
+        elif name == 'skewY' and values:
+            matrix = (1, math.tan(math.radians(values[0])), 0, 1, 0, 0)
+        else:
+            continue
+        result = multiply_affine(result, matrix)
+    return result
+
+def multiply_affine(m: Affine, n: Affine) -> Affine:
+    """Return m @ n (apply n first, then m)"""
+    a, b, c, d, e, f = m
+    a2, b2, c2, d2, e2, f2 = n
+    return (a * a2 + c * b2, b * a2 + d * b2,
+            a * c2 + c * d2, b * c2 + d * d2,
+            a * e2 + c * f2 + e, b * e2 + d * f2 + f)
+
+def apply_affine(m: Affine, p: Point) -> Point:
+    a, b, c, d, e, f = m
+    return (a * p[0] + c * p[1] + e, b * p[0] + d * p[1] + f)
+
+def shape_to_path(tag: str, attrib: dict) -> Optional[str]:
+    """Path data for SVG basic shapes (rect, circle, ellipse, line, polyline, polygon)"""
+    def number(name, default=0.0):
+        value = NUMBER_RE.match(attrib.get(name, '') or '')
+        return float(value.group()) if value else default
+
+    if tag == 'rect':
+        x, y, w, h = number('x'), number('y'), number('width'), number('height')
+        if w <= 0 or h <= 0:
+            return None
+        return f"M{x},{y}H{x + w}V{y + h}H{x}Z"
+    if tag in ('circle', 'ellipse'):
+        cx, cy = number('cx'), number('cy')
+        rx = number('r') if tag == 'circle' else number('rx')
+        ry = number('r') if tag == 'circle' else number('ry')
+        if rx <= 0 or ry <= 0:
+            return None
+        return (f"M{cx - rx},{cy}A{rx},{ry} 0 1 0 {cx + rx},{cy}"
+                f"A{rx},{ry} 0 1 0 {cx - rx},{cy}Z")
+    if tag == 'line':
+        return f"M{number('x1')},{number('y1')}L{number('x2')},{number('y2')}"
+    if tag in ('polyline', 'polygon'):
+        points = attrib.get('points', '').strip()
+        if not points:
+            return None
+        return f"M{points}" + ('Z' if tag == 'polygon' else '')
+    return None
+
+SHAPE_TAGS = {'path', 'rect', 'circle', 'ellipse', 'line', 'polyline', 'polygon'}
+# Containers whose content is only referenced, never drawn directly
+HIDDEN_TAGS = {'defs', 'clipPath', 'mask', 'symbol', 'pattern', 'marker'}
+
+def iter_svg_paths(source) -> Iterator[Tuple[str, Affine, dict]]:
+    """Stream (path data, accumulated transform, attributes) for every shape.
+
+    Uses ``ET.iterparse`` and discards elements once processed, so memory
+    stays bounded by document depth rather than document size.
+    """
+    transforms = [IDENTITY]
+    parents = []  # [element, number of leading children already processed]
+    hidden = 0
+    for event, element in ET.iterparse(source, events=('start', 'end')):
+        tag = element.tag.rsplit('}', 1)[-1]
+        if event == 'start':
+            transforms.append(multiply_affine(transforms[-1], parse_transform(element.get('transform'))))
+            parents.append([element, 0])
+            hidden += tag in HIDDEN_TAGS
+            continue
+
+        transform = transforms.pop()
+        parents.pop()
+        if tag in HIDDEN_TAGS:
+            hidden -= 1
+        elif tag in SHAPE_TAGS and not hidden:
+            path_data = element.get('d') if tag == 'path' else shape_to_path(tag, element.attrib)
+            if path_data:
+                yield path_data, transform, dict(element.attrib)
+
+        element.clear()
+        if parents:
+            # The parser reads ahead, so finished children form a prefix of the parent
+            parent = parents[-1]
+            parent[1] += 1
+            if parent[1] >= 64:
+                del parent[0][:parent[1]]
+                parent[1] = 0
+
+@dataclass
+class SVGCurveBuffers:
+    """Bezier control points of every shape in one SVG file, packed into flat arrays.
+
+    Spline ``i`` covers points ``spline_offsets[i]:spline_offsets[i + 1]``
+    and shape ``j`` covers splines ``shape_offsets[j]:shape_offsets[j + 1]``.
+    Being plain NumPy arrays, buffers pickle compactly between processes.
+    """
+    source: str
+    names: List[str]
+    shape_offsets: np.ndarray  # (shapes + 1,) int64
+    spline_offsets: np.ndarray  # (splines + 1,) int64
+    cyclic: np.ndarray  # (splines,) bool
+    co: np.ndarray  # (points, 3) float32
+    handle_left: np.ndarray
+    handle_right: np.ndarray
+    timings: dict = field(default_factory=dict)  # CPU seconds per stage
+
+    @property
+    def shape_count(self) -> int:
+        return len(self.names)
+
+def parse_svg_file(source: str, transform: Affine = IDENTITY) -> SVGCurveBuffers:
+    """Parse one SVG document into packed control-point buffers.
+
+    ``transform`` is applied on top of each shape's document transform.
+    Module level and bpy free so it can run in a worker process.
+    """
+    names, shape_offsets, spline_offsets, cyclic = [], [0], [0], []
+    co, handle_left, handle_right = [], [], []
+    parse_time = pack_time = 0.0
+
+    shapes = iter_svg_paths(source)
+    while True:
+        start = time.process_time()
+        item = next(shapes, None)
+        if item is None:
+            parse_time += time.process_time() - start
+            break
+        path_data, shape_transform, attrib = item
+        try:
+            subpaths = parse_path(path_data)
+        except SVGPathError:
+            subpaths = []
+        split = time.process_time()
+        parse_time += split - start
+
+        matrix = multiply_affine(transform, shape_transform)
+        for subpath in subpaths:
+            points = bezier_arrays(subpath, matrix)
+            co.append(points[0])
+            handle_left.append(points[1])
+            handle_right.append(points[2])
+            spline_offsets.append(spline_offsets[-1] + len(points[0]))
+            cyclic.append(subpath.closed)
+        if subpaths:
+            names.append(attrib.get('id', 'path'))
+            shape_offsets.append(len(cyclic))
+        pack_time += time.process_time() - split
+
+    start = time.process_time()
+    empty = np.empty((0, 3), dtype=np.float32)
+    buffers = SVGCurveBuffers(
+        source=str(source),
+        names=names,
+        shape_offsets=np.asarray(shape_offsets, dtype=np.int64),
+        spline_offsets=np.asarray(spline_offsets, dtype=np.int64),
+        cyclic=np.asarray(cyclic, dtype=bool),
+        co=np.concatenate(co) if co else empty,
+        handle_left=np.concatenate(handle_left) if handle_left else empty,
+        handle_right=np.concatenate(handle_right) if handle_right else empty)
+    buffers.timings = {'parse': parse_time, 'pack': pack_time + time.process_time() - start}
+    return buffers
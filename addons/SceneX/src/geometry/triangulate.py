@@ -0,0 +1,272 @@
+# SceneX/src/geometry/triangulate.py
+"""
+Polygon triangulation for filled 2D shapes.
+Pure NumPy (no bpy): even-odd nesting of outlines, hole bridging and
+batched ear clipping. Inside Blender, large outlines go to mathutils'
+scanline fill instead.
+"""
+
+from typing import List, Sequence, Tuple
+import numpy as np
+try:
+    from mathutils.geometry import tessellate_polygon
+except ImportError:  # Outside Blender
+    tessellate_polygon = None
+
+EPSILON = 1e-12
+EAR_CLIP_LIMIT = 4096  # Outline points (with holes) above which the scanline fill is used
+
+def signed_area(polygon: np.ndarray) -> float:
+    """Shoelace area; positive for counter-clockwise polygons"""
+    x, y = polygon[:, 0], polygon[:, 1]
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+
+def points_in_polygon(points: np.ndarray, polygon: np.ndarray) -> np.ndarray:
+    """Even-odd containment test of many points against one polygon"""
+    x, y = points[:, 0:1], points[:, 1:2]
+    x0, y0 = polygon[:, 0], polygon[:, 1]
+    x1, y1 = np.roll(x0, -1), np.roll(y0, -1)
+    crosses = (y0 > y) != (y1 > y)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_at = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
+    return np.count_nonzero(crosses & (x < x_at), axis=1) % 2 == 1
+
+def group_outlines(polygons: Sequence[np.ndarray]) -> List[Tuple[int, List[int]]]:
+    """Group closed outlines into (outer, holes) by even-odd nesting depth.
+
+    An outline inside an odd number of others is a hole of the innermost
+    outline containing it.
+    """
+    count = len(polygons)
+    areas = np.array([abs(signed_area(p)) for p in polygons])
+    contains = np.zeros((count, count), dtype=bool)  # contains[i, j]: j inside i
+    probes = np.array([p[0] for p in polygons])
+    for i, polygon in enumerate(polygons):
+        contains[i] = points_in_polygon(probes, polygon)
+        contains[i, i] = False
+    depth = contains.sum(axis=0)
+
+    groups = {i: [] for i in range(count) if depth[i] % 2 == 0}
+    for j in range(count):
+        if depth[j] % 2 == 1:
+            parents = np.flatnonzero(contains[:, j] & (depth == depth[j] - 1))
+            if len(parents):
+                groups[int(parents[np.argmin(areas[parents])])].append(j)
+    return list(groups.items())
+
+def bridge_holes(outer: np.ndarray, holes: Sequence[np.ndarray]) -> np.ndarray:
+    """Splice holes into the outer outline through zero-width bridges.
+
+    Returns an index array into ``np.vstack([outer, *holes])`` describing a
+    single (weakly simple) polygon. ``outer`` must be counter-clockwise and
+    holes clockwise.
+    """
+    points = [outer, *holes]
+    offsets = np.cumsum([0] + [len(p) for p in points])
+    ring = np.arange(len(outer))
+    coords = np.vstack(points)
+
+    # Rightmost holes first; unmerged holes block bridges like the outline does
+    order = sorted(range(len(holes)), key=lambda h: -holes[h][:, 0].max())
+    pending = set(range(len(holes)))
+    for h in order:
+        hole = holes[h]
+        m = int(np.argmax(hole[:, 0]))
+        hole_ring = offsets[h + 1] + np.roll(np.arange(len(hole)), -m)
+        pending.discard(h)
+        blockers = [np.roll(coords[hole_ring], -1, axis=0)[:-1]]  # Own edges not touching M
+        blockers += [holes[k] for k in pending]
+        target = _visible_vertex(coords, ring, coords[hole_ring[0]], blockers)
+        ring = np.concatenate([ring[:target + 1], hole_ring, hole_ring[:1], ring[target:]])
+    return ring
+
+def _visible_vertex(coords: np.ndarray, ring: np.ndarray, point: np.ndarray,
+                    blockers: Sequence[np.ndarray]) -> int:
+    """Position in ``ring`` of the nearest vertex reachable from ``point`` through the interior.
+
+    ``blockers`` are open polylines (vertex runs) whose edges and vertices
+    may not be crossed either: the rest of the bridged hole and the holes
+    not merged yet.
+    """
+    block_a = np.vstack([line[:-1] for line in blockers] + [np.empty((0, 2))])
+    block_b = np.vstack([line[1:] for line in blockers] + [np.empty((0, 2))])
+    closing = [line for line in blockers[1:]]  # Pending holes are closed loops
+    block_a = np.vstack([block_a] + [line[-1:] for line in closing])
+    block_b = np.vstack([block_b] + [line[:1] for line in closing])
+    block_vertices = np.vstack(list(blockers) + [np.empty((0, 2))])
+
+    a = coords[ring]
+    b = np.roll(a, -1, axis=0)
+    before = np.roll(a, 1, axis=0)
+    positions = np.arange(len(ring))
+    distance = np.einsum('ij,ij->i', a - point, a - point)
+    for candidate in np.argsort(distance, kind='stable'):
+        q = a[candidate]
+        if not _in_wedge(before[candidate], q, b[candidate], point):
+            continue
+        # Edges touching the candidate vertex (or its duplicates) cannot block it
+        others = ~np.all(a == q, axis=1) & ~np.all(b == q, axis=1)
+        if (_segment_hits(point, q, a[others], b[others]).any()
+                or _segment_hits(point, q, block_a, block_b).any()):
+            continue
+        if _touches(point, q, np.vstack([a[others & (positions != candidate)], block_vertices])):
+            continue
+        return int(candidate)
+    return int(np.argmin(distance))
+
+def _cross(o, u, v):
+    return (u[..., 0] - o[..., 0]) * (v[..., 1] - o[..., 1]) - (u[..., 1] - o[..., 1]) * (v[..., 0] - o[..., 0])
+
+def _in_wedge(before: np.ndarray, q: np.ndarray, after: np.ndarray, point: np.ndarray) -> bool:
+    """Whether ``point`` lies in the interior angle at ``q`` of a counter-clockwise outline"""
+    left_of_in = _cross(before, q, point) > EPSILON
+    left_of_out = _cross(q, after, point) > EPSILON
+    if _cross(before, q, after) > 0:  # Convex corner
+        return bool(left_of_in and left_of_out)
+    return bool(left_of_in or left_of_out)
+
+def _touches(p: np.ndarray, q: np.ndarray, vertices: np.ndarray) -> bool:
+    """Whether any vertex lies on the open segment p-q"""
+    if not len(vertices):
+        return False
+    d = q - p
+    length = float(np.dot(d, d))
+    t = (vertices - p) @ d / length
+    collinear = np.abs(_cross(p, q, vertices)) <= 1e-9 * length
+    return bool(np.any(collinear & (t > 1e-9) & (t < 1 - 1e-9)))
+
+def _segment_hits(p: np.ndarray, q: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Proper intersections of segment p-q with segments a-b"""
+    return ((_cross(a, b, p) * _cross(a, b, q) < -EPSILON)
+            & (_cross(p, q, a) * _cross(p, q, b) < -EPSILON))
+
+def ear_clip(coords: np.ndarray, ring: np.ndarray) -> np.ndarray:
+    """Triangulate the counter-clockwise polygon ``coords[ring]``.
+
+    Each round tests every vertex for being an ear at once (convex, with no
+    reflex vertex inside or on its triangle) and clips a set of
+    non-adjacent ears together. Shapes with many ears (glyphs, convex runs)
+    finish in a few rounds, but a wavy outline only offers ears at its
+    crests, so rounds grow linearly and the cost quadratically with the
+    vertex count (seconds at 20k points); ``triangulate_outlines`` hands such
+    outlines to Blender's fill when it can. Returns (n, 3) indices into
+    ``coords``, without zero-area triangles.
+    """
+    ring = np.asarray(ring)
+    triangles = []
+    while len(ring) > 3:
+        n = len(ring)
+        prev, nxt = np.roll(ring, 1), np.roll(ring, -1)
+        a, b, c = coords[prev], coords[ring], coords[nxt]
+        turn = (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])
+        convex = turn > EPSILON
+        ears = convex & ~_contains_reflex(coords, ring, a, b, c, ~convex)
+        ears |= np.abs(turn) <= EPSILON  # Collinear and spike vertices are dropped freely
+
+        chosen = ears & (np.arange(n) % 2 == 0)
+        if n % 2 and chosen[0]:
+            chosen[-1] = False
+        if not chosen.any():
+            chosen = ears & (np.arange(n) % 2 == 1)
+        if not chosen.any():
+            # Numerically stuck (self-touching input): clip the most convex vertex
+            chosen = np.zeros(n, dtype=bool)
+            chosen[np.argmax(turn)] = True
+
+        keep = chosen & (turn > EPSILON)
+        triangles.append(np.stack([prev[keep], ring[keep], nxt[keep]], axis=1))
+        ring = ring[~chosen]
+    if len(ring) == 3:
+        triangles.append(ring[None])
+    if not triangles:
+        return np.empty((0, 3), dtype=np.int64)
+    return _drop_degenerate(coords, np.concatenate(triangles).astype(np.int64))
+
+def _drop_degenerate(coords: np.ndarray, triangles: np.ndarray) -> np.ndarray:
+    """Triangles with non-zero area (collinear input leaves slivers)"""
+    return triangles[np.abs(_cross(coords[triangles[:, 0]], coords[triangles[:, 1]],
+                                   coords[triangles[:, 2]])) > EPSILON]
+
+def _scanline_fill(vertices: np.ndarray, rings: Sequence[np.ndarray]) -> np.ndarray:
+    """Blender's scanline fill of an outline and its holes (rows of ``vertices``),
+    counter-clockwise like ``ear_clip``"""
+    index = np.concatenate(rings)
+    loops = [[(float(x), float(y), 0.0) for x, y in vertices[ring]] for ring in rings]
+    triangles = index[np.array(tessellate_polygon(loops), dtype=np.int64).reshape(-1, 3)]
+    a, b, c = vertices[triangles[:, 0]], vertices[triangles[:, 1]], vertices[triangles[:, 2]]
+    clockwise = _cross(a, b, c) < 0
+    triangles[clockwise] = triangles[clockwise][:, ::-1]
+    return _drop_degenerate(vertices, triangles)
+
+def _contains_reflex(coords, ring, a, b, c, reflex, chunk=1 << 20):
+    """For each triangle (a, b, c), whether a reflex vertex lies inside it or on its border.
+
+    Probes are sorted by x so each triangle is only tested against the
+    probes within its x extent. Probes coinciding with a corner (bridge
+    duplicates) do not count.
+    """
+    blocked = np.zeros(len(ring), dtype=bool)
+    probes = coords[ring[reflex]]
+    if not len(probes):
+        return blocked
+    probes = probes[np.argsort(probes[:, 0], kind='stable')]
+    xs = np.stack([a[:, 0], b[:, 0], c[:, 0]])
+    lo = np.searchsorted(probes[:, 0], xs.min(axis=0), side='left')
+    hi = np.searchsorted(probes[:, 0], xs.max(axis=0), side='right')
+    counts = hi - lo
+    ends = np.cumsum(counts)
+
+    # Expand (triangle, probe) pairs in slices that bound temporary memory
+    start = 0
+    while start < len(ring):
+        stop = int(np.searchsorted(ends, ends[start] - counts[start] + chunk, side='right'))
+        stop = max(stop, start + 1)
+        triangles = np.arange(start, stop)
+        pair_triangle = np.repeat(triangles, counts[start:stop])
+        # Pair k of triangle t tests probe lo[t] + (k - first pair of t)
+        first_pair = ends[triangles] - counts[triangles]
+        pair_probe = (np.arange(first_pair[0], ends[stop - 1])
+                      - np.repeat(first_pair - lo[triangles], counts[triangles]))
+        p = probes[pair_probe]
+        ta, tb, tc = a[pair_triangle], b[pair_triangle], c[pair_triangle]
+        inside = ((_cross(ta, tb, p) >= -EPSILON) & (_cross(tb, tc, p) >= -EPSILON)
+                  & (_cross(tc, ta, p) >= -EPSILON))
+        corner = np.all(p == ta, axis=1) | np.all(p == tb, axis=1) | np.all(p == tc, axis=1)
+        hits = pair_triangle[inside & ~corner]
+        blocked[hits] = True
+        start = stop
+    return blocked
+
+def triangulate_outlines(polygons: Sequence[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """Triangulate closed 2D outlines with even-odd fill.
+
+    Returns ``(vertices, triangles)``: the stacked outline points (n, 2) and
+    (m, 3) vertex indices. Groups of more than ``EAR_CLIP_LIMIT`` points
+    use Blender's scanline fill when mathutils is available.
+    """
+    polygons = [np.asarray(p, dtype=np.float64)[:, :2] for p in polygons if len(p) >= 3]
+    if not polygons:
+        return np.empty((0, 2)), np.empty((0, 3), dtype=np.int64)
+
+    vertices = np.vstack(polygons)
+    offsets = np.cumsum([0] + [len(p) for p in polygons])
+    triangles = []
+    for outer, holes in group_outlines(polygons):
+        parts = [outer, *holes]
+        if tessellate_polygon is not None and sum(len(polygons[i]) for i in parts) > EAR_CLIP_LIMIT:
+            triangles.append(_scanline_fill(vertices, [offsets[i] + np.arange(len(polygons[i])) for i in parts]))
+            continue
+        oriented = []
+        for k, index in enumerate(parts):
+            polygon = polygons[index]
+            ccw = signed_area(polygon) > 0
+            # Outer counter-clockwise, holes clockwise
+            flip = ccw if k else not ccw
+            oriented.append(np.arange(len(polygon))[::-1] if flip else np.arange(len(polygon)))
+
+        local = [polygons[index][o] for index, o in zip(parts, oriented)]
+        ring = bridge_holes(local[0], local[1:])
+        # Map ring indices back to rows of ``vertices``
+        global_index = np.concatenate([offsets[index] + o for index, o in zip(parts, oriented)])
+        triangles.append(ear_clip(vertices, global_index[ring]))
+    return vertices, np.concatenate(triangles)
@@ -0,0 +1,224 @@
+# SceneX/src/graphics/charts.py
+import bpy
+import csv
+import math
+import numpy as np
+from mathutils import Vector
+from typing import Dict, Optional, Sequence, Tuple, Union
+from src.core.coordinate_system import CoordinateSystem, GridConfig
+from src.graphics.fields import ScatterPlot
+from src.graphics.graphs import build_polyline_curve
+from src.utils.logger import SceneXLogger
+
+def load_csv(path: str) -> Dict[str, np.ndarray]:
+    """Columns of a CSV file with a header row; numeric columns become float arrays"""
+    with open(path, newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows = [row for row in reader if row]
+    columns = {}
+    for name, values in zip(header, zip(*rows)):
+        try:
+            columns[name] = np.array(values, dtype=np.float64)
+        except ValueError:
+            columns[name] = np.array(values)
+    return columns
+
+def nice_step(span: float, count: float) -> float:
+    """1, 2 or 5 times a power of ten, giving about ``count`` ticks over ``span``"""
+    raw = max(span, 1e-12) / max(count, 1)
+    power = 10 ** math.floor(math.log10(raw))
+    for factor in (1, 2, 5, 10):
+        if factor * power >= raw:
+            return factor * power
+    return 10 * power
+
+def _format_tick(value: float, step: float) -> str:
+    decimals = max(0, -int(math.floor(math.log10(step)))) if step < 1 else 0
+    return f"{value:.{decimals}f}"
+
+def _chart_material() -> bpy.types.Material:
+    """Material reading the per-element ``color`` attribute"""
+    mat = bpy.data.materials.get("SceneX_ChartColor")
+    if mat is not None:
+        return mat
+    mat = bpy.data.materials.new("SceneX_ChartColor")
+    mat.use_nodes = True
+    attribute = mat.node_tree.nodes.new('ShaderNodeAttribute')
+    attribute.attribute_name = "color"
+    principled = mat.node_tree.nodes["Principled BSDF"]
+    mat.node_tree.links.new(attribute.outputs['Color'], principled.inputs['Base Color'])
+    return mat
+
+def build_quad_mesh(name: str, corners: np.ndarray) -> bpy.types.Mesh:
+    """Mesh of independent quads from (n, 4, 3) corner coordinates"""
+    count = len(corners)
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(count * 4)
+    mesh.loops.add(count * 4)
+    mesh.polygons.add(count)
+    mesh.vertices.foreach_set("co", corners.astype(np.float32).ravel())
+    mesh.loops.foreach_set("vertex_index", np.arange(count * 4, dtype=np.int32))
+    mesh.polygons.foreach_set("loop_start", np.arange(0, count * 4, 4, dtype=np.int32))
+    try:
+        mesh.polygons.foreach_set("loop_total", np.full(count, 4, dtype=np.int32))
+    except (AttributeError, TypeError):
+        pass  # Read-only since Blender 4.0, derived from loop_start
+    mesh.update(calc_edges=True)
+    return mesh
+
+class Chart:
+    """Bar, line or scatter chart of columnar data.
+
+    ``data`` is a CSV path, a dict of columns or an (x, y) pair of arrays.
+    Data is mapped to grid units (one tick step per unit) so the axes,
+    grid and tick labels come from a CoordinateSystem; all elements of a
+    series are one datablock: a quad mesh for bars, a curve for lines and
+    an instanced point mesh for scatter plots.
+    """
+    def __init__(self, data: Union[str, Dict[str, np.ndarray], Tuple[Sequence, Sequence]],
+                 x: Optional[str] = None, y: Optional[str] = None, kind: str = 'bar',
+                 size: Tuple[float, float] = (8.0, 4.0), color=(0.2, 0.6, 1.0, 1.0),
+                 colors: Optional[np.ndarray] = None, bar_width: float = 0.8,
+                 origin=(0, 0, 0)):
+        if isinstance(data, str):
+            data = load_csv(data)
+        if isinstance(data, dict):
+            names = list(data)
+            x_values = data[x or names[0]]
+            y_values = data[y or names[1]]
+        else:
+            x_values, y_values = data
+        self.x = np.asarray(x_values)
+        self.y = np.asarray(y_values, dtype=np.float64)
+        self.kind = kind
+        self.size = size
+        self.color = color
+        self.colors = colors
+        self.bar_width = bar_width
+        self.origin = origin
+        self.object = None
+        self.logger = SceneXLogger("Chart")
+        self._layout()
+
+    def _layout(self):
+        """Tick steps, grid ranges and data-to-grid mapping"""
+        width, height = self.size
+        self.categorical = self.kind == 'bar' or not np.issubdtype(self.x.dtype, np.number)
+        if self.categorical:
+            # Row i sits at x = i + 1 in data units; long series get one tick every x_step rows
+            self.x_step, self.x0 = float(max(1, round(nice_step(len(self.x) + 1, 8)))), 0.0
+            self.x_units = max(1, math.ceil((len(self.x) + 1) / self.x_step))
+            self.gx = np.arange(1, len(self.x) + 1, dtype=np.float64) / self.x_step
+        else:
+            xs = self.x.astype(np.float64)
+            self.x_step = nice_step(float(np.ptp(xs)), 8)
+            self.x0 = math.floor(xs.min() / self.x_step) * self.x_step
+            self.x_units = max(1, math.ceil((xs.max() - self.x0) / self.x_step))
+            self.gx = (xs - self.x0) / self.x_step
+
+        # One grid unit has the same length on both axes
+        unit = width / self.x_units
+        low = min(0.0, float(np.nanmin(self.y))) if self.kind == 'bar' else float(np.nanmin(self.y))
+        high = max(0.0, float(np.nanmax(self.y))) if self.kind == 'bar' else float(np.nanmax(self.y))
+        self.y_step = nice_step(high - low, height / unit)
+        self.y0 = math.floor(low / self.y_step) * self.y_step
+        self.y_units = max(1, math.ceil((high - self.y0) / self.y_step))
+        self.gy = (self.y - self.y0) / self.y_step
+        self.baseline = (max(self.y0, 0.0) - self.y0) / self.y_step
+        self.coordinate_system = CoordinateSystem(origin=self.origin, scale=unit)
+
+    def _tick_label(self, axis: str, index: int) -> Optional[str]:
+        if axis == 'x':
+            if self.categorical:
+                row = int(round(index * self.x_step))
+                return str(self.x[row - 1]) if 1 <= row <= len(self.x) else None
+            return _format_tick(self.x0 + index * self.x_step, self.x_step)
+        return _format_tick(self.y0 + index * self.y_step, self.y_step)
+
+    def create(self, show_axes: bool = True) -> bpy.types.Object:
+        if show_axes:
+            self.coordinate_system.create_grid(GridConfig(
+                x_range=(0, self.x_units), y_range=(0, self.y_units), number_scale=0.25,
+                number_format=self._tick_label))
+
+        if self.kind == 'bar':
+            self.object = self._create_bars()
+        elif self.kind == 'line':
+            points = np.column_stack([self.gx, self.gy, np.zeros(len(self.gy))])
+            self.object = build_polyline_curve("line_chart", [points], stroke_width=0.03)
+            self.object.data.bevel_factor_mapping_end = 'SPLINE'
+            self._line_material()
+        elif self.kind == 'scatter':
+            points = np.column_stack([self.gx, self.gy, np.zeros(len(self.gy))])
+            self.object = ScatterPlot(points, sizes=0.08, colors=self._element_colors()).create()
+        else:
+            raise ValueError(f"Unknown chart kind: {self.kind}")
+        self.coordinate_system.place_object(self.object, Vector((0, 0, 0)), apply_scale=True)
+        self.logger.info(f"Built {self.kind} chart of {len(self.y)} rows")
+        return self.object
+
+    def _element_colors(self) -> np.ndarray:
+        if self.colors is not None:
+            return np.asarray(self.colors, dtype=np.float32).reshape(len(self.y), -1)
+        return np.broadcast_to(np.asarray(self.color, dtype=np.float32), (len(self.y), 4))
+
+    def _bar_corners(self, heights: np.ndarray) -> np.ndarray:
+        half = self.bar_width / 2 / self.x_step
+        corners = np.zeros((len(heights), 4, 3))
+        corners[:, [0, 3], 0] = (self.gx - half)[:, None]
+        corners[:, [1, 2], 0] = (self.gx + half)[:, None]
+        corners[:, [0, 1], 1] = self.baseline
+        corners[:, [2, 3], 1] = heights[:, None]
+        return corners
+
+    def _create_bars(self) -> bpy.types.Object:
+        mesh = build_quad_mesh("bar_chart", self._bar_corners(self.gy))
+        # Per-bar attributes for materials and Geometry Nodes
+        mesh.attributes.new("value", 'FLOAT', 'FACE').data.foreach_set("value", self.y.astype(np.float32))
+        colors = self._element_colors()
+        if colors.shape[1] == 3:
+            colors = np.column_stack([colors, np.ones(len(colors), dtype=np.float32)])
+        mesh.attributes.new("color", 'FLOAT_COLOR', 'FACE').data.foreach_set(
+            "color", np.ascontiguousarray(colors, dtype=np.float32).ravel())
+        mesh.materials.append(_chart_material())
+        obj = bpy.data.objects.new("bar_chart", mesh)
+        bpy.context.scene.collection.objects.link(obj)
+        return obj
+
+    def _line_material(self):
+        """Curves carry no color attribute; the line uses the chart color directly"""
+        mat = bpy.data.materials.new("line_chart_material")
+        mat.use_nodes = True
+        mat.node_tree.nodes["Principled BSDF"].inputs["Base Color"].default_value = self.color
+        self.object.data.materials.append(mat)
+
+    def animate_growth(self, start_frame: int, end_frame: int):
+        """Grow the chart from its baseline with one keyframed value.
+
+        Bars and scatter points rise through a single shape key; a line
+        is drawn from left to right through its bevel end factor.
+        """
+        obj = self.object
+        if self.kind == 'line':
+            obj.data.bevel_factor_end = 0.0
+            obj.data.keyframe_insert(data_path="bevel_factor_end", frame=start_frame)
+            obj.data.bevel_factor_end = 1.0
+            obj.data.keyframe_insert(data_path="bevel_factor_end", frame=end_frame)
+            return
+
+        mesh = obj.data
+        full = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", full)
+        flat = full.reshape(-1, 3).copy()
+        flat[:, 1] = self.baseline
+        mesh.vertices.foreach_set("co", flat.ravel())
+        obj.shape_key_add(name="Basis", from_mix=False)
+        grow = obj.shape_key_add(name="grow", from_mix=False)
+        grow.data.foreach_set("co", full)
+        mesh.update()
+
+        grow.value = 0.0
+        grow.keyframe_insert(data_path="value", frame=start_frame)
+        grow.value = 1.0
+        grow.keyframe_insert(data_path="value", frame=end_frame)
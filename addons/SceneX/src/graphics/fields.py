@@ -0,0 +1,219 @@
+# SceneX/src/graphics/fields.py
+import bpy
+import numpy as np
+from typing import Callable, Optional, Tuple
+from src.geometry.base import Geometry
+from src.utils.logger import SceneXLogger
+
+def _add_socket(group: bpy.types.NodeTree, name: str, in_out: str, socket_type: str):
+    if hasattr(group, "interface"):  # Blender 4.0+
+        group.interface.new_socket(name, in_out=in_out, socket_type=socket_type)
+    elif in_out == 'INPUT':
+        group.inputs.new(socket_type, name)
+    else:
+        group.outputs.new(socket_type, name)
+
+def _instance_material() -> bpy.types.Material:
+    """Material coloring every instance by its point's ``color`` attribute"""
+    mat = bpy.data.materials.get("SceneX_InstanceColor")
+    if mat is not None:
+        return mat
+    mat = bpy.data.materials.new("SceneX_InstanceColor")
+    mat.use_nodes = True
+    nodes = mat.node_tree.nodes
+    attribute = nodes.new('ShaderNodeAttribute')
+    attribute.attribute_type = 'INSTANCER'
+    attribute.attribute_name = "color"
+    principled = nodes["Principled BSDF"]
+    mat.node_tree.links.new(attribute.outputs['Color'], principled.inputs['Base Color'])
+    return mat
+
+def _instancing_group(kind: str) -> bpy.types.NodeTree:
+    """Shared node group instancing arrows ('ARROW') or spheres ('MARKER') on mesh vertices.
+
+    Arrows point along the ``direction`` attribute and are scaled by
+    ``magnitude``; markers are scaled by ``size``. Instances keep the
+    point attributes, so the material reads ``color`` per instance.
+    """
+    name = f"SceneX_{kind.title()}Instances"
+    group = bpy.data.node_groups.get(name)
+    if group is not None:
+        return group
+
+    group = bpy.data.node_groups.new(name, 'GeometryNodeTree')
+    _add_socket(group, "Geometry", 'INPUT', 'NodeSocketGeometry')
+    _add_socket(group, "Geometry", 'OUTPUT', 'NodeSocketGeometry')
+    nodes, links = group.nodes, group.links
+    group_in = nodes.new('NodeGroupInput')
+    group_out = nodes.new('NodeGroupOutput')
+    instance_on_points = nodes.new('GeometryNodeInstanceOnPoints')
+    links.new(group_in.outputs[0], instance_on_points.inputs['Points'])
+
+    scale = nodes.new('GeometryNodeInputNamedAttribute')
+    scale.data_type = 'FLOAT'
+    if kind == 'ARROW':
+        scale.inputs['Name'].default_value = "magnitude"
+        direction = nodes.new('GeometryNodeInputNamedAttribute')
+        direction.data_type = 'FLOAT_VECTOR'
+        direction.inputs['Name'].default_value = "direction"
+        align = nodes.new('FunctionNodeAlignEulerToVector')
+        align.axis = 'Z'
+        links.new(direction.outputs['Attribute'], align.inputs['Vector'])
+        links.new(align.outputs['Rotation'], instance_on_points.inputs['Rotation'])
+
+        # Unit arrow along +Z: shaft and head
+        shaft = nodes.new('GeometryNodeMeshCylinder')
+        shaft.inputs['Vertices'].default_value = 8
+        shaft.inputs['Radius'].default_value = 0.02
+        shaft.inputs['Depth'].default_value = 0.8
+        shaft_move = nodes.new('GeometryNodeTransform')
+        shaft_move.inputs['Translation'].default_value = (0, 0, 0.4)
+        head = nodes.new('GeometryNodeMeshCone')
+        head.inputs['Vertices'].default_value = 8
+        head.inputs['Radius Bottom'].default_value = 0.06
+        head.inputs['Depth'].default_value = 0.2
+        head_move = nodes.new('GeometryNodeTransform')
+        head_move.inputs['Translation'].default_value = (0, 0, 0.9)
+        join = nodes.new('GeometryNodeJoinGeometry')
+        links.new(shaft.outputs['Mesh'], shaft_move.inputs['Geometry'])
+        links.new(head.outputs['Mesh'], head_move.inputs['Geometry'])
+        links.new(shaft_move.outputs['Geometry'], join.inputs['Geometry'])
+        links.new(head_move.outputs['Geometry'], join.inputs['Geometry'])
+        links.new(join.outputs['Geometry'], instance_on_points.inputs['Instance'])
+    else:
+        scale.inputs['Name'].default_value = "size"
+        marker = nodes.new('GeometryNodeMeshIcoSphere')
+        marker.inputs['Radius'].default_value = 1.0
+        marker.inputs['Subdivisions'].default_value = 1
+        links.new(marker.outputs['Mesh'], instance_on_points.inputs['Instance'])
+    links.new(scale.outputs['Attribute'], instance_on_points.inputs['Scale'])
+
+    set_material = nodes.new('GeometryNodeSetMaterial')
+    set_material.inputs['Material'].default_value = _instance_material()
+    links.new(instance_on_points.outputs['Instances'], set_material.inputs['Geometry'])
+    links.new(set_material.outputs['Geometry'], group_out.inputs[0])
+    return group
+
+class InstancedPoints(Geometry):
+    """Point mesh whose per-point attributes drive Geometry Nodes instances.
+
+    All data lives in NumPy arrays written with ``foreach_set``; one mesh,
+    one object and one shared material serve any number of points, and
+    ``update`` rewrites only the arrays passed to it.
+    """
+    kind = 'MARKER'
+    name = "points"
+
+    def __init__(self, positions: np.ndarray, colors: Optional[np.ndarray] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.positions = np.asarray(positions, dtype=np.float32).reshape(-1, 3)
+        count = len(self.positions)
+        if colors is None:
+            colors = np.broadcast_to(np.asarray(self.color, dtype=np.float32), (count, 4))
+        self.colors = np.asarray(colors, dtype=np.float32).reshape(count, -1)
+        self.logger = SceneXLogger("InstancedPoints")
+
+    def _attributes(self) -> dict:
+        """Per-point attributes: name -> (data type, array)"""
+        colors = self.colors
+        if colors.shape[1] == 3:
+            colors = np.column_stack([colors, np.ones(len(colors), dtype=np.float32)])
+        return {"color": ('FLOAT_COLOR', colors)}
+
+    def create(self) -> bpy.types.Object:
+        try:
+            mesh = bpy.data.meshes.new(self.name)
+            mesh.vertices.add(len(self.positions))
+            mesh.vertices.foreach_set("co", self.positions.ravel())
+            for name, (data_type, values) in self._attributes().items():
+                mesh.attributes.new(name, data_type, 'POINT')
+            self.object = bpy.data.objects.new(self.name, mesh)
+            bpy.context.scene.collection.objects.link(self.object)
+            self._write(self._attributes())
+
+            modifier = self.object.modifiers.new("Instances", 'NODES')
+            modifier.node_group = _instancing_group(self.kind)
+            return self.object
+        except Exception as e:
+            self.logger.error(f"Error creating {self.name}: {str(e)}")
+            return None
+
+    def _write(self, attributes: dict):
+        mesh = self.object.data
+        for name, (data_type, values) in attributes.items():
+            field = {'FLOAT': "value", 'FLOAT_VECTOR': "vector", 'FLOAT_COLOR': "color"}[data_type]
+            mesh.attributes[name].data.foreach_set(field, np.ascontiguousarray(values, dtype=np.float32).ravel())
+        mesh.update()
+
+    def update(self, positions: Optional[np.ndarray] = None, colors: Optional[np.ndarray] = None):
+        """Rewrite positions and/or colors (same point count) into the mesh"""
+        if positions is not None:
+            self.positions = np.asarray(positions, dtype=np.float32).reshape(-1, 3)
+            self.object.data.vertices.foreach_set("co", self.positions.ravel())
+        names = set()
+        if colors is not None:
+            self.colors = np.asarray(colors, dtype=np.float32).reshape(len(self.positions), -1)
+            names.add("color")
+        self._write_only(names)
+
+    def _write_only(self, names):
+        self._write({name: value for name, value in self._attributes().items() if name in names})
+
+class ScatterPlot(InstancedPoints):
+    """Spheres of per-point size and color"""
+    kind = 'MARKER'
+    name = "scatter"
+
+    def __init__(self, positions: np.ndarray, sizes=0.05, colors: Optional[np.ndarray] = None, **kwargs):
+        super().__init__(positions, colors, **kwargs)
+        self.sizes = np.broadcast_to(np.asarray(sizes, dtype=np.float32), (len(self.positions),))
+
+    def _attributes(self) -> dict:
+        attributes = super()._attributes()
+        attributes["size"] = ('FLOAT', self.sizes)
+        return attributes
+
+    def update(self, positions: Optional[np.ndarray] = None, colors: Optional[np.ndarray] = None,
+               sizes: Optional[np.ndarray] = None):
+        super().update(positions, colors)
+        if sizes is not None:
+            self.sizes = np.broadcast_to(np.asarray(sizes, dtype=np.float32), (len(self.positions),))
+            self._write_only({"size"})
+
+class VectorField(InstancedPoints):
+    """Arrows at ``positions`` along ``directions``, length = |direction| * scale"""
+    kind = 'ARROW'
+    name = "vector_field"
+
+    def __init__(self, positions: np.ndarray, directions: np.ndarray, scale: float = 1.0,
+                 colors: Optional[np.ndarray] = None, **kwargs):
+        super().__init__(positions, colors, **kwargs)
+        self.directions = np.asarray(directions, dtype=np.float32).reshape(-1, 3)
+        self.scale = scale
+
+    @classmethod
+    def from_function(cls, func: Callable[[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]],
+                      x_range: Tuple[float, float] = (-5, 5), y_range: Tuple[float, float] = (-5, 5),
+                      step: float = 0.5, **kwargs) -> "VectorField":
+        """Field (u, v) = func(x, y) sampled on a grid in the z = 0 plane"""
+        x, y = np.meshgrid(np.arange(x_range[0], x_range[1] + step / 2, step),
+                           np.arange(y_range[0], y_range[1] + step / 2, step))
+        u, v = func(x, y)
+        positions = np.column_stack([x.ravel(), y.ravel(), np.zeros(x.size)])
+        directions = np.column_stack([np.broadcast_to(u, x.shape).ravel(),
+                                      np.broadcast_to(v, x.shape).ravel(), np.zeros(x.size)])
+        return cls(positions, directions, **kwargs)
+
+    def _attributes(self) -> dict:
+        attributes = super()._attributes()
+        attributes["direction"] = ('FLOAT_VECTOR', self.directions)
+        attributes["magnitude"] = ('FLOAT', np.linalg.norm(self.directions, axis=1) * self.scale)
+        return attributes
+
+    def update(self, positions: Optional[np.ndarray] = None, colors: Optional[np.ndarray] = None,
+               directions: Optional[np.ndarray] = None):
+        """Rewrite positions, colors and/or directions (magnitude follows directions)"""
+        super().update(positions, colors)
+        if directions is not None:
+            self.directions = np.asarray(directions, dtype=np.float32).reshape(-1, 3)
+            self._write_only({"direction", "magnitude"})
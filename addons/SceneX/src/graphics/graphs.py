@@ -0,0 +1,104 @@
+# SceneX/src/graphics/graphs.py
+import bpy
+import numpy as np
+from typing import Callable, List, Optional, Sequence, Tuple
+from src.geometry.base import Geometry
+from src.graphics.sampling import marching_squares, sample_function, sample_parametric
+from src.utils.logger import SceneXLogger
+
+def build_polyline_curve(name: str, polylines: Sequence[np.ndarray], stroke_width: float = 0.02,
+                         resolution: int = 2) -> bpy.types.Object:
+    """One curve object with a POLY spline per polyline, filled with foreach_set.
+
+    Polylines ending on their first point become cyclic splines.
+    """
+    curve = bpy.data.curves.new(name, 'CURVE')
+    curve.dimensions = '3D'
+    curve.bevel_depth = stroke_width
+    curve.resolution_u = resolution
+    for line in polylines:
+        line = np.asarray(line, dtype=np.float64)
+        closed = len(line) > 3 and np.allclose(line[0], line[-1])
+        if closed:
+            line = line[:-1]
+        co = np.zeros((len(line), 4), dtype=np.float32)
+        co[:, :line.shape[1]] = line
+        co[:, 3] = 1.0
+        spline = curve.splines.new('POLY')
+        spline.points.add(len(line) - 1)
+        spline.points.foreach_set("co", co.ravel())
+        spline.use_cyclic_u = closed
+    obj = bpy.data.objects.new(name, curve)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+class PlotCurve(Geometry):
+    """Curve plotted in math coordinates; subclasses return the sampled polylines"""
+    name = "plot"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.logger = SceneXLogger("Graph")
+
+    def polylines(self) -> List[np.ndarray]:
+        raise NotImplementedError
+
+    def create(self) -> bpy.types.Object:
+        try:
+            polylines = self.polylines()
+            if not polylines:
+                self.logger.warning(f"Nothing to plot for {self.name}")
+                return None
+            self.object = build_polyline_curve(self.name, polylines, self.stroke_width)
+            self._setup_material()
+            self.logger.debug(f"Plotted {self.name}: {sum(len(p) for p in polylines)} points "
+                              f"in {len(polylines)} pieces")
+            return self.object
+        except Exception as e:
+            self.logger.error(f"Error creating {self.name}: {str(e)}")
+            return None
+
+class FunctionGraph(PlotCurve):
+    """y = func(x) with adaptive sampling; jumps and asymptotes split the curve"""
+    name = "graph"
+
+    def __init__(self, func: Callable[[np.ndarray], np.ndarray], x_range: Tuple[float, float] = (-5, 5),
+                 y_range: Optional[Tuple[float, float]] = None, samples: int = 1000, **kwargs):
+        super().__init__(**kwargs)
+        self.func = func
+        self.x_range = x_range
+        self.y_range = y_range
+        self.samples = samples
+
+    def polylines(self) -> List[np.ndarray]:
+        return sample_function(self.func, self.x_range, self.samples, self.y_range)
+
+class ParametricCurve(PlotCurve):
+    """(x(t), y(t)[, z(t)]) with adaptive sampling"""
+    name = "parametric_curve"
+
+    def __init__(self, func: Callable[[np.ndarray], Tuple[np.ndarray, ...]],
+                 t_range: Tuple[float, float] = (0, 1), samples: int = 1000, **kwargs):
+        super().__init__(**kwargs)
+        self.func = func
+        self.t_range = t_range
+        self.samples = samples
+
+    def polylines(self) -> List[np.ndarray]:
+        return sample_parametric(self.func, self.t_range, self.samples)
+
+class ImplicitCurve(PlotCurve):
+    """func(x, y) = 0 traced with marching squares"""
+    name = "implicit_curve"
+
+    def __init__(self, func: Callable[[np.ndarray, np.ndarray], np.ndarray],
+                 x_range: Tuple[float, float] = (-5, 5), y_range: Tuple[float, float] = (-5, 5),
+                 resolution: int = 200, **kwargs):
+        super().__init__(**kwargs)
+        self.func = func
+        self.x_range = x_range
+        self.y_range = y_range
+        self.resolution = resolution
+
+    def polylines(self) -> List[np.ndarray]:
+        return marching_squares(self.func, self.x_range, self.y_range, self.resolution)
@@ -0,0 +1,233 @@
+# SceneX/src/graphics/sampling.py
+"""
+Vectorized sampling of plots (pure NumPy, no bpy).
+Functions and parametric curves are refined adaptively where the curve
+bends and split at discontinuities; implicit curves are traced with
+marching squares.
+"""
+
+from typing import Callable, List, Optional, Tuple
+import numpy as np
+
+def sample_function(func: Callable[[np.ndarray], np.ndarray], x_range: Tuple[float, float],
+                    samples: int = 1000, y_range: Optional[Tuple[float, float]] = None,
+                    tolerance: float = 1e-3, max_depth: int = 8, jump: float = 0.05) -> List[np.ndarray]:
+    """Polylines (n, 2) of y = func(x), with ``func`` vectorized over an array of x.
+
+    Values outside ``y_range`` (padded by half its span) are dropped so
+    asymptotes do not blow up the plot.
+    """
+    def evaluate(x):
+        return np.column_stack([x, np.broadcast_to(func(x), x.shape)])
+
+    window = None
+    if y_range is not None:
+        low, high = y_range
+        pad = (high - low) / 2
+        window = (low - pad, high + pad)
+    return _sample(evaluate, x_range, samples, tolerance, max_depth, jump, window)
+
+def sample_parametric(func: Callable[[np.ndarray], Tuple[np.ndarray, ...]], t_range: Tuple[float, float],
+                      samples: int = 1000, tolerance: float = 1e-3, max_depth: int = 8,
+                      jump: float = 0.05) -> List[np.ndarray]:
+    """Polylines (n, 2 or 3) of (x(t), y(t)[, z(t)]) with ``func`` vectorized over t"""
+    def evaluate(t):
+        return np.column_stack([np.broadcast_to(c, t.shape) for c in func(t)])
+
+    return _sample(evaluate, t_range, samples, tolerance, max_depth, jump, None)
+
+def _sample(evaluate, t_range, samples, tolerance, max_depth, jump, window) -> List[np.ndarray]:
+    t = np.linspace(t_range[0], t_range[1], max(int(samples), 2))
+    with np.errstate(all='ignore'):
+        values = np.asarray(evaluate(t), dtype=np.float64)
+        if window is not None:
+            outside = (values[:, 1] < window[0]) | (values[:, 1] > window[1])
+            values[outside] = np.nan
+        finite = np.all(np.isfinite(values), axis=1)
+        if not finite.any():
+            return []
+        extent = float(np.max(np.ptp(values[finite], axis=0))) or 1.0
+
+        t, values = _refine(evaluate, t, values, tolerance * extent, max_depth, window)
+        return _split(evaluate, t, values, jump * extent, window)
+
+def _masked(evaluate, t, window):
+    values = np.asarray(evaluate(t), dtype=np.float64)
+    if window is not None:
+        outside = (values[:, 1] < window[0]) | (values[:, 1] > window[1])
+        values[outside] = np.nan
+    return values
+
+def _refine(evaluate, t, values, tolerance, max_depth, window):
+    """Insert midpoints where the chord misses the curve by more than ``tolerance``.
+
+    Each round evaluates the midpoints of all still-flagged intervals at
+    once; only intervals that were split stay flagged.
+    """
+    flagged = np.ones(len(t) - 1, dtype=bool)
+    for _ in range(max_depth):
+        intervals = np.flatnonzero(flagged)
+        if not len(intervals):
+            break
+        mid_t = (t[intervals] + t[intervals + 1]) / 2
+        mid = _masked(evaluate, mid_t, window)
+        chord = (values[intervals] + values[intervals + 1]) / 2
+        error = np.linalg.norm(mid - chord, axis=1)
+        ends_finite = np.isfinite(values[intervals]).all(axis=1) | np.isfinite(values[intervals + 1]).all(axis=1)
+        # Intervals touching a gap are refined to pin down where the curve stops
+        split = ends_finite & ~(error <= tolerance)
+
+        chosen = intervals[split]
+        t = np.insert(t, chosen + 1, mid_t[split])
+        values = np.insert(values, chosen + 1, mid[split], axis=0)
+
+        # Both halves of a split interval are checked again in the next round
+        new_flags = np.zeros(len(t) - 1, dtype=bool)
+        shifted = chosen + np.arange(len(chosen))  # Index of the left half after insertion
+        new_flags[shifted] = True
+        new_flags[shifted + 1] = True
+        flagged = new_flags
+    return t, values
+
+def _split(evaluate, t, values, jump, window, steps: int = 30) -> List[np.ndarray]:
+    """Cut the samples at gaps and jumps into separate polylines.
+
+    Intervals with a large step are bisected towards the bigger half; a
+    continuous curve's step shrinks to nothing, a jump keeps its size.
+    """
+    finite = np.all(np.isfinite(values), axis=1)
+    step = np.linalg.norm(np.diff(values, axis=0), axis=1)
+    candidates = np.flatnonzero(finite[:-1] & finite[1:] & (step > jump))
+
+    breaks = np.zeros(len(t) - 1, dtype=bool)
+    breaks[~(finite[:-1] & finite[1:])] = True
+    left_ends, right_ends = {}, {}
+    if len(candidates):
+        a, b = t[candidates].copy(), t[candidates + 1].copy()
+        va, vb = values[candidates].copy(), values[candidates + 1].copy()
+        for _ in range(steps):
+            m = (a + b) / 2
+            vm = _masked(evaluate, m, window)
+            left = np.linalg.norm(vm - va, axis=1)
+            right = np.linalg.norm(vb - vm, axis=1)
+            go_left = ~(right > left)  # NaN midpoints keep the left half
+            b = np.where(go_left, m, b)
+            vb = np.where(go_left[:, None], vm, vb)
+            a = np.where(go_left, a, m)
+            va = np.where(go_left[:, None], va, vm)
+        remaining = np.linalg.norm(vb - va, axis=1)
+        is_jump = ~(remaining <= jump / 2)
+        breaks[candidates[is_jump]] = True
+        for index, pa, pb in zip(candidates[is_jump], va[is_jump], vb[is_jump]):
+            # Extend both sides up to the located jump
+            if np.all(np.isfinite(pa)):
+                left_ends[index] = pa
+            if np.all(np.isfinite(pb)):
+                right_ends[index] = pb
+
+    polylines = []
+    starts = np.concatenate([[0], np.flatnonzero(breaks) + 1])
+    stops = np.concatenate([np.flatnonzero(breaks) + 1, [len(t)]])
+    for start, stop in zip(starts, stops):
+        piece = values[start:stop]
+        piece = piece[np.all(np.isfinite(piece), axis=1)]
+        if start - 1 in right_ends:
+            piece = np.vstack([right_ends[start - 1], piece])
+        if stop - 1 in left_ends:
+            piece = np.vstack([piece, left_ends[stop - 1]])
+        if len(piece) >= 2 and np.ptp(piece, axis=0).any():
+            polylines.append(piece)
+    return polylines
+
+# Marching squares: corner bits v0 (bottom left) = 1, v1 (bottom right) = 2,
+# v2 (top right) = 4, v3 (top left) = 8; edges 0 bottom, 1 right, 2 top, 3 left.
+_SEGMENTS = np.full((16, 2, 2), -1, dtype=np.int64)
+for _case, _pairs in {1: [(3, 0)], 2: [(0, 1)], 3: [(3, 1)], 4: [(1, 2)], 5: [(3, 0), (1, 2)],
+                      6: [(0, 2)], 7: [(3, 2)], 8: [(2, 3)], 9: [(0, 2)], 10: [(0, 1), (2, 3)],
+                      11: [(1, 2)], 12: [(1, 3)], 13: [(0, 1)], 14: [(3, 0)]}.items():
+    _SEGMENTS[_case, :len(_pairs)] = _pairs
+
+def marching_squares(func: Callable[[np.ndarray, np.ndarray], np.ndarray], x_range: Tuple[float, float],
+                     y_range: Tuple[float, float], resolution: int = 200) -> List[np.ndarray]:
+    """Polylines (n, 2) of the curve func(x, y) = 0, with ``func`` vectorized over grids"""
+    xs = np.linspace(x_range[0], x_range[1], resolution + 1)
+    ys = np.linspace(y_range[0], y_range[1], resolution + 1)
+    X, Y = np.meshgrid(xs, ys)
+    with np.errstate(all='ignore'):
+        F = np.asarray(func(X, Y), dtype=np.float64)
+    F = np.where(np.isfinite(F), F, 0.0)
+    ny, nx = F.shape
+
+    inside = F > 0
+    v0, v1, v2, v3 = inside[:-1, :-1], inside[:-1, 1:], inside[1:, 1:], inside[1:, :-1]
+    case = v0 * 1 + v1 * 2 + v2 * 4 + v3 * 8
+    segments = _SEGMENTS[case].copy()  # (ny-1, nx-1, 2 segments, 2 edges)
+
+    # Saddles: a connected center swaps which corners are cut off
+    center = (F[:-1, :-1] + F[:-1, 1:] + F[1:, 1:] + F[1:, :-1]) > 0
+    segments[(case == 5) & center] = [(0, 1), (2, 3)]
+    segments[(case == 10) & center] = [(3, 0), (1, 2)]
+
+    # Global edge ids: horizontal edges first, then vertical ones
+    horizontal = np.arange(ny * (nx - 1)).reshape(ny, nx - 1)
+    vertical = ny * (nx - 1) + np.arange((ny - 1) * nx).reshape(ny - 1, nx)
+    cell_edges = np.stack([horizontal[:-1], vertical[:, 1:], horizontal[1:], vertical[:, :-1]], axis=-1)
+
+    rows, cols, slots = np.nonzero(segments[..., 0] >= 0)
+    local = segments[rows, cols, slots]  # (m, 2)
+    pairs = cell_edges[rows[:, None], cols[:, None], local]
+    if not len(pairs):
+        return []
+
+    # Crossing point on every used edge
+    edge_ids = np.unique(pairs)
+    is_vertical = edge_ids >= ny * (nx - 1)
+    h_row, h_col = np.divmod(np.where(is_vertical, 0, edge_ids), nx - 1)
+    v_row, v_col = np.divmod(np.where(is_vertical, edge_ids - ny * (nx - 1), 0), nx)
+    r0 = np.where(is_vertical, v_row, h_row)
+    c0 = np.where(is_vertical, v_col, h_col)
+    r1 = r0 + is_vertical
+    c1 = c0 + ~is_vertical
+    f0, f1 = F[r0, c0], F[r1, c1]
+    t = f0 / (f0 - f1)
+    points = np.column_stack([xs[c0] + t * (xs[c1] - xs[c0]), ys[r0] + t * (ys[r1] - ys[r0])])
+
+    chains = _chain(np.searchsorted(edge_ids, pairs))
+    return [points[chain] for chain in chains if len(chain) >= 2]
+
+def _chain(pairs: np.ndarray) -> List[List[int]]:
+    """Link segments sharing endpoints into vertex chains (closed chains repeat their start)"""
+    count = int(pairs.max()) + 1
+    # Every vertex joins at most two segments
+    first = np.full(count, -1)
+    second = np.full(count, -1)
+    flat = pairs.ravel()
+    order = np.argsort(flat, kind='stable')
+    sorted_vertices = flat[order]
+    is_first = np.ones(len(flat), dtype=bool)
+    is_first[1:] = sorted_vertices[1:] != sorted_vertices[:-1]
+    first[sorted_vertices[is_first]] = order[is_first] // 2
+    second[sorted_vertices[~is_first]] = order[~is_first] // 2
+
+    first, second, pairs = first.tolist(), second.tolist(), pairs.tolist()
+    used = [False] * len(pairs)
+    chains = []
+
+    def walk(segment, vertex):
+        chain = [vertex]
+        while segment != -1 and not used[segment]:
+            used[segment] = True
+            a, b = pairs[segment]
+            vertex = b if a == vertex else a
+            chain.append(vertex)
+            segment = second[vertex] if first[vertex] == segment else first[vertex]
+        return chain
+
+    # Open chains start at vertices used by a single segment
+    for vertex in range(count):
+        if first[vertex] != -1 and second[vertex] == -1 and not used[first[vertex]]:
+            chains.append(walk(first[vertex], vertex))
+    for segment in range(len(pairs)):
+        if not used[segment]:
+            chains.append(walk(segment, pairs[segment][0]))
+    return chains
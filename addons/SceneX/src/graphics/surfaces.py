@@ -0,0 +1,141 @@
+# SceneX/src/graphics/surfaces.py
+import bpy
+import inspect
+import numpy as np
+from typing import Callable, Optional, Tuple
+from src.geometry.base import Geometry
+from src.animation.updaters import UpdaterGraph, get_updater_graph
+from src.utils.logger import SceneXLogger
+
+def grid_quads(rows: int, cols: int) -> np.ndarray:
+    """(rows - 1) * (cols - 1) quads over a row-major vertex grid, as (n, 4) int32"""
+    corner = (np.arange(rows - 1)[:, None] * cols + np.arange(cols - 1)[None, :]).ravel().astype(np.int32)
+    return np.stack([corner, corner + 1, corner + cols + 1, corner + cols], axis=1)
+
+def build_grid_mesh(name: str, rows: int, cols: int) -> bpy.types.Mesh:
+    """Preallocated quad grid mesh; vertex positions are written separately"""
+    quads = grid_quads(rows, cols)
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(rows * cols)
+    mesh.loops.add(quads.size)
+    mesh.polygons.add(len(quads))
+    mesh.loops.foreach_set("vertex_index", quads.ravel())
+    mesh.polygons.foreach_set("loop_start", np.arange(0, quads.size, 4, dtype=np.int32))
+    try:
+        mesh.polygons.foreach_set("loop_total", np.full(len(quads), 4, dtype=np.int32))
+    except (AttributeError, TypeError):
+        pass  # Read-only since Blender 4.0, derived from loop_start
+    mesh.polygons.foreach_set("use_smooth", np.ones(len(quads), dtype=bool))
+    return mesh
+
+class Surface(Geometry):
+    """Parametric surface (x, y, z) = func(u, v[, t]) on a resolution grid.
+
+    ``func`` is evaluated once on the whole (u, v) grid. Functions taking a
+    third argument are animated through ``t``: ``update`` rewrites the
+    vertex positions in place, ``animate`` either registers that as a
+    per-frame updater or bakes sampled times into shape keys.
+    """
+    name = "surface"
+
+    def __init__(self, func: Callable, u_range: Tuple[float, float] = (0, 1),
+                 v_range: Tuple[float, float] = (0, 1), resolution: Tuple[int, int] = (100, 100),
+                 t: float = 0.0, **kwargs):
+        super().__init__(**kwargs)
+        self.func = func
+        self.u_range = u_range
+        self.v_range = v_range
+        self.resolution = resolution
+        self.t = t
+        self.time_dependent = len(inspect.signature(func).parameters) >= 3
+        self.logger = SceneXLogger("Surface")
+
+    def _grid(self):
+        rows, cols = self.resolution
+        u = np.linspace(*self.u_range, cols, dtype=np.float64)
+        v = np.linspace(*self.v_range, rows, dtype=np.float64)
+        return np.meshgrid(u, v)
+
+    def evaluate(self, t: Optional[float] = None) -> np.ndarray:
+        """Vertex positions (rows * cols, 3) as float32"""
+        u, v = self._grid()
+        t = self.t if t is None else t
+        with np.errstate(all='ignore'):
+            values = self.func(u, v, t) if self.time_dependent else self.func(u, v)
+        points = np.empty((u.size, 3), dtype=np.float32)
+        for axis, value in enumerate(values):
+            points[:, axis] = np.broadcast_to(value, u.shape).ravel()
+        np.nan_to_num(points, copy=False)
+        return points
+
+    def create(self) -> bpy.types.Object:
+        try:
+            rows, cols = self.resolution
+            mesh = build_grid_mesh(self.name, rows, cols)
+            mesh.vertices.foreach_set("co", self.evaluate().ravel())
+            mesh.update(calc_edges=True)
+            self.object = bpy.data.objects.new(self.name, mesh)
+            bpy.context.scene.collection.objects.link(self.object)
+            self._setup_material()
+            return self.object
+        except Exception as e:
+            self.logger.error(f"Error creating {self.name}: {str(e)}")
+            return None
+
+    def update(self, t: float):
+        """Move the vertices to the function at time ``t`` without touching topology"""
+        self.t = t
+        mesh = self.object.data
+        mesh.vertices.foreach_set("co", self.evaluate(t).ravel())
+        mesh.update()
+
+    def animate(self, start_frame: int, end_frame: int, t_range: Tuple[float, float] = (0, 1),
+                shape_keys: Optional[int] = None, graph: Optional[UpdaterGraph] = None):
+        """Animate ``t`` over the frame range.
+
+        Without ``shape_keys`` an updater rewrites the vertices every frame
+        (exact, needs the frame handler). With ``shape_keys=n`` the function
+        is sampled at n times and blended by keyframed shape key values,
+        which render without Python at the cost of n vertex arrays.
+        """
+        if not self.time_dependent:
+            raise ValueError("Surface function takes no time parameter")
+        t0, t1 = t_range
+        span = max(end_frame - start_frame, 1)
+
+        if shape_keys is None:
+            def update(surface, frame):
+                progress = min(max((frame - start_frame) / span, 0.0), 1.0)
+                surface.update(t0 + (t1 - t0) * progress)
+            return (graph or get_updater_graph()).add_updater(self, update)
+
+        obj = self.object
+        if obj.data.shape_keys is None:
+            obj.shape_key_add(name="Basis", from_mix=False)
+        frames = np.linspace(start_frame, end_frame, shape_keys)
+        keys = []
+        for i, time in enumerate(np.linspace(t0, t1, shape_keys)):
+            key = obj.shape_key_add(name=f"t_{i}", from_mix=False)
+            key.data.foreach_set("co", self.evaluate(float(time)).ravel())
+            keys.append(key)
+        # Each key peaks at its own frame and fades linearly into its neighbours
+        for i, key in enumerate(keys):
+            for j, frame in enumerate(frames):
+                if abs(i - j) <= 1:
+                    key.value = 1.0 if i == j else 0.0
+                    key.keyframe_insert(data_path="value", frame=float(frame))
+        obj.data.update()
+        return keys
+
+class HeightField(Surface):
+    """Graph z = func(x, y[, t]) over a rectangular domain"""
+    name = "heightfield"
+
+    def __init__(self, func: Callable, x_range: Tuple[float, float] = (-5, 5),
+                 y_range: Tuple[float, float] = (-5, 5), resolution: Tuple[int, int] = (100, 100), **kwargs):
+        self.height = func
+        if len(inspect.signature(func).parameters) >= 3:
+            surface = lambda x, y, t: (x, y, func(x, y, t))
+        else:
+            surface = lambda x, y: (x, y, func(x, y))
+        super().__init__(surface, x_range, y_range, resolution, **kwargs)
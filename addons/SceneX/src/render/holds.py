@@ -0,0 +1,236 @@
+# SceneX/src/render/holds.py
+"""
+Rendering with static-hold detection.
+Every frame of the range gets a signature of the state that decides what
+the camera sees (see ``HoldRenderer`` for what is covered); consecutive frames with equal signatures form a
+hold, which is rendered once and then duplicated on disk or stretched
+in an ffmpeg concat list.
+"""
+
+import bpy
+import hashlib
+import os
+import shutil
+import time
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from src.camera.framing import world_matrices
+from src.utils.logger import SceneXLogger
+
+# Modifiers whose result can change with the frame without any keyframe
+TIME_DEPENDENT_MODIFIERS = {'NODES', 'PARTICLE_SYSTEM', 'FLUID', 'CLOTH', 'SOFT_BODY', 'DYNAMIC_PAINT',
+                            'OCEAN', 'MESH_SEQUENCE_CACHE', 'COLLISION', 'EXPLODE', 'WAVE', 'BUILD'}
+
+def hold_runs(signatures: List[bytes]) -> List[Tuple[int, int]]:
+    """(first index, length) of every run of equal consecutive signatures"""
+    runs = []
+    for i, signature in enumerate(signatures):
+        if runs and signatures[runs[-1][0]] == signature:
+            runs[-1] = (runs[-1][0], runs[-1][1] + 1)
+        else:
+            runs.append((i, 1))
+    return runs
+
+def _animated_ids(scene: bpy.types.Scene) -> List[bpy.types.ID]:
+    """Datablocks with an action or drivers: the objects themselves, their
+    data, shape keys, materials and node trees, the world and the scene"""
+    ids = [scene, scene.world] if scene.world else [scene]
+    for obj in scene.objects:
+        ids.extend([obj, obj.data])
+        shape_keys = getattr(obj.data, "shape_keys", None)
+        ids.append(shape_keys)
+        for slot in obj.material_slots:
+            if slot.material is not None:
+                ids.extend([slot.material, slot.material.node_tree])
+    seen, result = set(), []
+    for id_block in ids:
+        data = getattr(id_block, "animation_data", None) if id_block is not None else None
+        if data is None or (data.action is None and not len(data.drivers)):
+            continue
+        key = (type(id_block).__name__, id_block.name)
+        if key not in seen:
+            seen.add(key)
+            result.append(id_block)
+    return result
+
+def _driven_value(id_block: bpy.types.ID, data_path: str, index: int) -> str:
+    """Current value of a driven property, as text for hashing"""
+    try:
+        value = id_block.path_resolve(data_path)
+        if index >= 0 and not isinstance(value, str) and hasattr(value, "__getitem__"):
+            value = value[index]
+        return repr(value)
+    except (ValueError, IndexError, TypeError):
+        return ""
+
+def _shading_sockets(objects: List[bpy.types.Object]) -> List[bpy.types.NodeSocket]:
+    """Node inputs with a default value in the materials of ``objects``, each material once"""
+    materials = {slot.material.name: slot.material for obj in objects
+                 for slot in obj.material_slots if slot.material is not None}
+    return [socket for material in materials.values() if material.node_tree
+            for node in material.node_tree.nodes for socket in node.inputs
+            if hasattr(socket, "default_value")]
+
+def _socket_values(sockets: List[bpy.types.NodeSocket]) -> np.ndarray:
+    """Current default values of ``sockets`` flattened to floats (strings and IDs skipped)"""
+    values = []
+    for socket in sockets:
+        value = socket.default_value
+        if isinstance(value, (bool, int, float)):
+            values.append(float(value))
+        elif not isinstance(value, str):
+            try:
+                values.extend(float(v) for v in value)
+            except TypeError:
+                pass
+    return np.array(values, dtype=np.float32)
+
+class HoldRenderer:
+    """Renders a frame range once per distinct state.
+
+    A frame's signature hashes the evaluated world matrices and render
+    visibility of all scene objects, the camera settings, every F-curve
+    of every action (objects, materials, shape keys, world...) at that
+    frame, the values of all driven properties, and for objects that can
+    change without keyframes (those with time-dependent modifiers, or
+    every mesh, curve and text object while frame-change handlers such as
+    the updater graph or ``Write`` are installed) their evaluated
+    geometry, object color and material node input values.
+
+    Other properties a handler sets without keyframes (world or light
+    settings, render settings, node links) are not hashed; frames that
+    differ only there are merged into a hold.
+
+    ``mode`` 'copy' writes every frame file (holds are copied from their
+    first frame); 'concat' writes only the distinct frames plus an
+    ffmpeg concat list timing them.
+    """
+    def __init__(self, output: Optional[str] = None, mode: str = 'copy'):
+        if mode not in ('copy', 'concat'):
+            raise ValueError(f"Unknown mode: {mode}")
+        self.scene = bpy.context.scene
+        self.output = output
+        self.mode = mode
+        self.logger = SceneXLogger("HoldRenderer")
+
+    def _volatile_objects(self) -> List[bpy.types.Object]:
+        handlers = len(bpy.app.handlers.frame_change_pre) + len(bpy.app.handlers.frame_change_post)
+        return [obj for obj in self.scene.objects if obj.type in {'MESH', 'CURVE', 'FONT'} and
+                (handlers or any(mod.type in TIME_DEPENDENT_MODIFIERS for mod in obj.modifiers))]
+
+    @staticmethod
+    def _hash_geometry(digest, obj: bpy.types.Object, depsgraph):
+        """Evaluated vertices of a mesh, curve or text object (and a text's body)"""
+        evaluated = obj.evaluated_get(depsgraph)
+        if obj.type == 'MESH':
+            mesh = evaluated.data
+        else:
+            if obj.type == 'FONT':
+                digest.update(obj.data.body.encode())
+            mesh = evaluated.to_mesh()
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        digest.update(co.tobytes())
+        if obj.type != 'MESH':
+            evaluated.to_mesh_clear()
+
+    def signatures(self, start_frame: int, end_frame: int) -> List[bytes]:
+        """Signature of every frame in the range"""
+        scene = self.scene
+        current = scene.frame_current
+        objects = list(scene.objects)
+        index = {obj.name: i for i, obj in enumerate(objects)}
+        animated = _animated_ids(scene)
+        fcurves = [fc for id_block in animated if id_block.animation_data.action
+                   for fc in id_block.animation_data.action.fcurves]
+        drivers = [(id_block, fc.data_path, fc.array_index) for id_block in animated
+                   for fc in id_block.animation_data.drivers]
+        volatile = self._volatile_objects()
+        sockets = _shading_sockets(volatile)
+        camera = scene.camera
+
+        signatures = []
+        for frame in range(start_frame, end_frame + 1):
+            scene.frame_set(frame)
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(world_matrices(objects, index).astype(np.float32).tobytes())
+            digest.update(bytes(obj.hide_render for obj in objects))
+            if camera is not None:
+                data = camera.data
+                digest.update(np.array([data.lens, data.ortho_scale, data.shift_x, data.shift_y,
+                                        data.clip_start, data.clip_end], dtype=np.float32).tobytes())
+            digest.update(np.array([fc.evaluate(frame) for fc in fcurves], dtype=np.float32).tobytes())
+            if drivers:
+                digest.update("\0".join(_driven_value(*driver) for driver in drivers).encode())
+            if volatile:
+                depsgraph = bpy.context.evaluated_depsgraph_get()
+                for obj in volatile:
+                    self._hash_geometry(digest, obj, depsgraph)
+                digest.update(np.array([c for obj in volatile for c in obj.color], dtype=np.float32).tobytes())
+                digest.update(_socket_values(sockets).tobytes())
+            signatures.append(digest.digest())
+        scene.frame_set(current)
+        return signatures
+
+    def render(self, start_frame: Optional[int] = None, end_frame: Optional[int] = None) -> Dict[str, float]:
+        """Render the range (default: the scene range) and return statistics"""
+        scene = self.scene
+        start_frame = scene.frame_start if start_frame is None else start_frame
+        end_frame = scene.frame_end if end_frame is None else end_frame
+        original_path = scene.render.filepath
+        if self.output is not None:
+            scene.render.filepath = self.output
+
+        started = time.perf_counter()
+        runs = hold_runs(self.signatures(start_frame, end_frame))
+        analysis = time.perf_counter() - started
+
+        current = scene.frame_current
+        paths = []
+        try:
+            for first, length in runs:
+                frame = start_frame + first
+                scene.frame_set(frame)
+                path = bpy.path.abspath(scene.render.frame_path(frame=frame))
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                bpy.ops.render.render()
+                bpy.data.images['Render Result'].save_render(path, scene=scene)
+                paths.append(path)
+                if self.mode == 'copy':
+                    for repeat in range(frame + 1, frame + length):
+                        shutil.copyfile(path, bpy.path.abspath(scene.render.frame_path(frame=repeat)))
+        finally:
+            scene.render.filepath = original_path
+            scene.frame_set(current)
+
+        concat = None
+        if self.mode == 'concat' and paths:
+            concat = self._write_concat(paths, [length for _, length in runs])
+
+        frames = end_frame - start_frame + 1
+        stats = {
+            "frames": frames,
+            "rendered": len(runs),
+            "skipped": frames - len(runs),
+            "skipped_fraction": (frames - len(runs)) / frames if frames else 0.0,
+            "analysis_seconds": analysis,
+            "total_seconds": time.perf_counter() - started,
+        }
+        if concat:
+            stats["concat_list"] = concat
+        self.logger.info(f"Rendered {stats['rendered']} of {frames} frames "
+                         f"({stats['skipped_fraction']:.0%} skipped as holds)")
+        return stats
+
+    def _write_concat(self, paths: List[str], lengths: List[int]) -> str:
+        """ffmpeg concat list holding each image for its run of frames"""
+        fps = self.scene.render.fps / self.scene.render.fps_base
+        list_path = os.path.join(os.path.dirname(paths[0]), "frames.ffconcat")
+        with open(list_path, "w") as f:
+            f.write("ffconcat version 1.0\n")
+            for path, length in zip(paths, lengths):
+                f.write(f"file '{os.path.basename(path)}'\nduration {length / fps:.6f}\n")
+            # The demuxer ignores the last duration unless the final file is repeated
+            f.write(f"file '{os.path.basename(paths[-1])}'\n")
+        self.logger.info(f"ffmpeg -f concat -i {list_path} -vsync vfr ... to encode")
+        return list_path
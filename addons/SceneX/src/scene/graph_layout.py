@@ -0,0 +1,405 @@
+# SceneX/src/scene/graph_layout.py
+"""
+Automatic graph layout: layered (Sugiyama) and force-directed (Barnes-Hut).
+Free of bpy; BelnderGenAI loads this file for its SVG diagrams.
+"""
+
+import math
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+import numpy as np
+try:
+    from ..utils.logger import SceneXLogger
+except ImportError:  # Loaded from its file, outside the SceneX package
+    from logging import getLogger as SceneXLogger
+
+@dataclass
+class LayeredLayoutConfig:
+    """Configuration for layered (Sugiyama) graph layout"""
+    layer_spacing: float = 2.0  # Distance between consecutive layers
+    node_spacing: float = 1.5  # Minimum distance between nodes in a layer
+    direction: str = 'TB'  # TB (top to bottom) or LR (left to right)
+    sweeps: int = 4  # Barycenter sweeps (down + up) for crossing reduction
+    align_passes: int = 2  # Coordinate refinement passes
+    y_down: bool = False  # Place later layers at larger y, as in SVG coordinates
+
+class LayeredLayout:
+    """Layered graph layout (cycle removal, layering, barycenter ordering,
+    coordinate assignment).
+
+    Nodes can be any hashable value (Blender objects, ids, names). Edges
+    spanning several layers are split with dummy nodes so that their bend
+    points are available in ``edge_routes`` after ``compute``.
+    """
+    def __init__(self, config: Optional[LayeredLayoutConfig] = None):
+        self.config = config or LayeredLayoutConfig()
+        self.edge_routes: Dict[Tuple[Hashable, Hashable], List[Tuple[float, float]]] = {}
+        self.logger = SceneXLogger("LayeredLayout")
+
+    def compute(self, nodes: Iterable[Hashable],
+                edges: Iterable[Tuple[Hashable, Hashable]]) -> Dict[Hashable, Tuple[float, float]]:
+        """Return 2D positions for every node"""
+        nodes = list(dict.fromkeys(nodes))
+        index = {node: i for i, node in enumerate(nodes)}
+        edge_list = [(index[a], index[b]) for a, b in edges
+                     if a in index and b in index and a != b]
+        self.edge_routes = {}
+        if not nodes:
+            return {}
+
+        dag_edges, reversed_flags = self._remove_cycles(len(nodes), edge_list)
+        layer_of = self._assign_layers(len(nodes), dag_edges)
+        layers, succ, pred, chains = self._insert_dummies(len(nodes), dag_edges, layer_of)
+        order = self._reduce_crossings(layers, succ, pred)
+        coords = self._assign_coordinates(order, succ, pred)
+
+        positions = {node: self._to_xy(coords[index[node]], layer_of[index[node]])
+                     for node in nodes}
+
+        for (a, b), chain, flipped in zip(edge_list, chains, reversed_flags):
+            route = [self._to_xy(coords[v], self._layer(v, layer_of)) for v in chain]
+            if flipped:
+                route.reverse()
+            self.edge_routes[(nodes[a], nodes[b])] = route
+
+        self.logger.info(f"Layered layout: {len(nodes)} nodes, {len(edge_list)} edges, "
+                         f"{len(order)} layers")
+        return positions
+
+    def _remove_cycles(self, count: int, edges: List[Tuple[int, int]]):
+        """Reverse DFS back edges to obtain a DAG"""
+        adjacency = defaultdict(list)
+        for i, (a, b) in enumerate(edges):
+            adjacency[a].append((b, i))
+
+        state = [0] * count  # 0 = unvisited, 1 = on stack, 2 = done
+        back_edges = set()
+        for root in range(count):
+            if state[root]:
+                continue
+            state[root] = 1
+            stack = [(root, iter(adjacency[root]))]
+            while stack:
+                node, neighbours = stack[-1]
+                for target, edge_index in neighbours:
+                    if state[target] == 1:
+                        back_edges.add(edge_index)
+                    elif state[target] == 0:
+                        state[target] = 1
+                        stack.append((target, iter(adjacency[target])))
+                        break
+                else:
+                    state[node] = 2
+                    stack.pop()
+
+        dag_edges = []
+        flags = []
+        for i, (a, b) in enumerate(edges):
+            flipped = i in back_edges
+            dag_edges.append((b, a) if flipped else (a, b))
+            flags.append(flipped)
+        return dag_edges, flags
+
+    def _assign_layers(self, count: int, edges: List[Tuple[int, int]]) -> List[int]:
+        """Longest-path layering via Kahn's topological sort"""
+        succ = defaultdict(list)
+        indegree = [0] * count
+        for a, b in edges:
+            succ[a].append(b)
+            indegree[b] += 1
+
+        layer = [0] * count
+        queue = deque(i for i in range(count) if indegree[i] == 0)
+        while queue:
+            node = queue.popleft()
+            for target in succ[node]:
+                layer[target] = max(layer[target], layer[node] + 1)
+                indegree[target] -= 1
+                if indegree[target] == 0:
+                    queue.append(target)
+        return layer
+
+    def _insert_dummies(self, count: int, edges: List[Tuple[int, int]], layer_of: List[int]):
+        """Split long edges so every edge connects adjacent layers"""
+        succ = defaultdict(list)
+        pred = defaultdict(list)
+        dummy_layer = {}
+        chains = []
+        next_id = count
+
+        for a, b in edges:
+            chain = [a]
+            previous = a
+            for layer in range(layer_of[a] + 1, layer_of[b]):
+                dummy = next_id
+                next_id += 1
+                dummy_layer[dummy] = layer
+                succ[previous].append(dummy)
+                pred[dummy].append(previous)
+                chain.append(dummy)
+                previous = dummy
+            succ[previous].append(b)
+            pred[b].append(previous)
+            chain.append(b)
+            chains.append(chain)
+
+        depth = max(layer_of) + 1
+        layers = [[] for _ in range(depth)]
+        for node in range(count):
+            layers[layer_of[node]].append(node)
+        for dummy, layer in dummy_layer.items():
+            layers[layer].append(dummy)
+        self._dummy_layer = dummy_layer
+        return layers, succ, pred, chains
+
+    def _reduce_crossings(self, layers, succ, pred) -> List[List[int]]:
+        """Barycenter heuristic, alternating downward and upward sweeps"""
+        order = [list(layer) for layer in layers]
+        position = {}
+        for layer in order:
+            for i, node in enumerate(layer):
+                position[node] = i
+
+        def sort_layer(layer, neighbours):
+            def key(node):
+                linked = neighbours[node]
+                if not linked:
+                    return position[node]
+                return sum(position[n] for n in linked) / len(linked)
+            layer.sort(key=key)
+            for i, node in enumerate(layer):
+                position[node] = i
+
+        for sweep in range(self.config.sweeps):
+            if sweep % 2 == 0:
+                for layer in order[1:]:
+                    sort_layer(layer, pred)
+            else:
+                for layer in reversed(order[:-1]):
+                    sort_layer(layer, succ)
+        return order
+
+    def _assign_coordinates(self, order, succ, pred) -> Dict[int, float]:
+        """Place nodes at barycenters of neighbours while keeping spacing"""
+        spacing = self.config.node_spacing
+        coords = {}
+        for layer in order:
+            offset = (len(layer) - 1) * spacing / 2
+            for i, node in enumerate(layer):
+                coords[node] = i * spacing - offset
+
+        for _ in range(self.config.align_passes):
+            for layers, neighbours in ((order[1:], pred), (list(reversed(order[:-1])), succ)):
+                for layer in layers:
+                    desired = []
+                    for node in layer:
+                        linked = neighbours[node]
+                        if linked:
+                            desired.append(sum(coords[n] for n in linked) / len(linked))
+                        else:
+                            desired.append(coords[node])
+                    self._pack(layer, desired, coords, spacing)
+        return coords
+
+    @staticmethod
+    def _pack(layer, desired, coords, spacing):
+        """Assign desired coordinates in order, enforcing minimum separation"""
+        if not layer:
+            return
+        placed = list(desired)
+        for i in range(1, len(placed)):
+            placed[i] = max(placed[i], placed[i - 1] + spacing)
+        # Shift so the layer keeps the same mean as the desired positions
+        shift = (sum(desired) - sum(placed)) / len(placed)
+        for node, value in zip(layer, placed):
+            coords[node] = value + shift
+
+    def _layer(self, node, layer_of):
+        if node < len(layer_of):
+            return layer_of[node]
+        return self._dummy_layer[node]
+
+    def _to_xy(self, coordinate: float, layer: int) -> Tuple[float, float]:
+        depth = -layer * self.config.layer_spacing
+        flip = -1.0 if self.config.y_down else 1.0
+        if self.config.direction == 'LR':
+            return (-depth, -coordinate * flip)
+        return (coordinate, depth * flip)
+
+
+@dataclass
+class ForceLayoutConfig:
+    """Configuration for force-directed (Fruchterman-Reingold) layout"""
+    ideal_distance: float = 1.5  # Preferred edge length k
+    iterations: int = 300
+    theta: float = 0.8  # Barnes-Hut opening criterion (0 = exact)
+    leaf_size: int = 8  # Cells with this many points are summed exactly
+    max_depth: int = 12
+    initial_temperature: float = 0.1  # Max step as a fraction of the layout extent
+    cooling: float = 0.97
+    tolerance: float = 1e-3  # Relative energy change for early stopping
+    record_every: int = 0  # Keep a position snapshot every N iterations (0 = off)
+    seed: int = 0
+
+class ForceDirectedLayout:
+    """Force-directed layout with Barnes-Hut repulsion in NumPy.
+
+    Repulsion is approximated on a Morton-ordered quadtree (octree for 3D
+    positions) that is traversed level by level for all points at once, so
+    one iteration costs O(n log n) array work instead of O(n^2).
+    """
+    def __init__(self, config: Optional[ForceLayoutConfig] = None):
+        self.config = config or ForceLayoutConfig()
+        self.snapshots: List[Dict[Hashable, Tuple[float, ...]]] = []
+        self.iterations_run = 0
+
+    def compute(self, nodes: Iterable[Hashable],
+                edges: Iterable[Tuple[Hashable, Hashable]],
+                initial: Optional[Dict[Hashable, Tuple[float, ...]]] = None,
+                dimensions: int = 2) -> Dict[Hashable, Tuple[float, ...]]:
+        """Return positions for every node, warm-starting from ``initial``"""
+        cfg = self.config
+        nodes = list(dict.fromkeys(nodes))
+        index = {node: i for i, node in enumerate(nodes)}
+        pairs = [(index[a], index[b]) for a, b in edges
+                 if a in index and b in index and a != b]
+        self.snapshots = []
+        self.iterations_run = 0
+        if not nodes:
+            return {}
+
+        count = len(nodes)
+        k = cfg.ideal_distance
+        rng = np.random.default_rng(cfg.seed)
+        spread = k * max(1.0, math.sqrt(count))
+        pos = rng.uniform(-spread / 2, spread / 2, (count, dimensions))
+        if initial:
+            for node, value in initial.items():
+                if node in index:
+                    pos[index[node]] = value[:dimensions]
+            # Separate coincident warm-start positions
+            pos += rng.normal(0, k * 1e-3, pos.shape)
+
+        edge_array = np.array(pairs, dtype=np.int64).reshape(-1, 2)
+        temperature = cfg.initial_temperature * spread
+        previous_energy = None
+
+        for iteration in range(cfg.iterations):
+            force = self._repulsion(pos, k * k)
+            if len(edge_array):
+                delta = pos[edge_array[:, 1]] - pos[edge_array[:, 0]]
+                dist = np.linalg.norm(delta, axis=1, keepdims=True)
+                pull = delta * (dist / k)
+                np.add.at(force, edge_array[:, 0], pull)
+                np.subtract.at(force, edge_array[:, 1], pull)
+
+            magnitude = np.linalg.norm(force, axis=1, keepdims=True)
+            step = force / np.maximum(magnitude, 1e-9) * np.minimum(magnitude, temperature)
+            pos += step
+            temperature *= cfg.cooling
+
+            self.iterations_run = iteration + 1
+            if cfg.record_every and iteration % cfg.record_every == 0:
+                self.snapshots.append(self._as_dict(nodes, pos))
+
+            energy = float(np.sum(magnitude * magnitude))
+            if previous_energy is not None and previous_energy > 0:
+                if abs(previous_energy - energy) / previous_energy < cfg.tolerance:
+                    break
+            previous_energy = energy
+
+        if cfg.record_every:
+            self.snapshots.append(self._as_dict(nodes, pos))
+        return self._as_dict(nodes, pos)
+
+    @staticmethod
+    def _as_dict(nodes, pos):
+        return {node: tuple(float(v) for v in pos[i]) for i, node in enumerate(nodes)}
+
+    def _repulsion(self, pos, k2):
+        """Barnes-Hut approximation of sum_j k^2 (p_i - p_j) / |p_i - p_j|^2"""
+        cfg = self.config
+        count, dims = pos.shape
+        force = np.zeros_like(pos)
+        if count < 2:
+            return force
+
+        # Morton order points inside the bounding cube
+        low = pos.min(axis=0)
+        extent = float((pos.max(axis=0) - low).max()) * (1 + 1e-9) or 1.0
+        depth = cfg.max_depth
+        cells = np.minimum(((pos - low) / extent * (1 << depth)).astype(np.int64), (1 << depth) - 1)
+        codes = np.zeros(count, dtype=np.int64)
+        for bit in range(depth):
+            for axis in range(dims):
+                codes |= ((cells[:, axis] >> bit) & 1) << (bit * dims + axis)
+        order = np.argsort(codes, kind='stable')
+        codes = codes[order]
+        sorted_pos = pos[order]
+        prefix = np.vstack([np.zeros((1, dims)), np.cumsum(sorted_pos, axis=0)])
+
+        # Per level: cell keys, point ranges, centers of mass and child ranges
+        levels = []
+        for level in range(depth + 1):
+            keys = codes >> (dims * (depth - level))
+            starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+            ends = np.r_[starts[1:], count]
+            mass = (ends - starts).astype(float)
+            com = (prefix[ends] - prefix[starts]) / mass[:, None]
+            levels.append({'keys': keys[starts], 'starts': starts, 'ends': ends,
+                           'mass': mass, 'com': com, 'size': extent / (1 << level)})
+        for level in range(depth):
+            parent, child = levels[level], levels[level + 1]
+            child_parent = child['keys'] >> dims
+            parent['child_start'] = np.searchsorted(child_parent, parent['keys'], side='left')
+            parent['child_end'] = np.searchsorted(child_parent, parent['keys'], side='right')
+
+        # Traverse all (point, cell) pairs one level at a time
+        point_keys = codes
+        points = np.arange(count)
+        cell_ids = np.zeros(count, dtype=np.int64)
+        sorted_force = np.zeros_like(sorted_pos)
+        theta = cfg.theta
+
+        for level in range(depth + 1):
+            if not len(points):
+                break
+            info = levels[level]
+            delta = sorted_pos[points] - info['com'][cell_ids]
+            dist2 = np.einsum('ij,ij->i', delta, delta)
+            own_cell = (point_keys[points] >> (dims * (depth - level))) == info['keys'][cell_ids]
+            far = ~own_cell & (info['size'] * info['size'] < theta * theta * dist2)
+
+            if far.any():
+                contribution = delta[far] * (k2 * info['mass'][cell_ids[far]] / np.maximum(dist2[far], 1e-9))[:, None]
+                np.add.at(sorted_force, points[far], contribution)
+
+            near = ~far
+            points, cell_ids = points[near], cell_ids[near]
+            small = info['mass'][cell_ids] <= cfg.leaf_size
+            if level == depth:
+                small[:] = True
+
+            if small.any():
+                leaf_points, leaf_cells = points[small], cell_ids[small]
+                lengths = info['ends'][leaf_cells] - info['starts'][leaf_cells]
+                owners = np.repeat(leaf_points, lengths)
+                offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+                others = np.repeat(info['starts'][leaf_cells], lengths) + offsets
+                keep = owners != others
+                owners, others = owners[keep], others[keep]
+                delta = sorted_pos[owners] - sorted_pos[others]
+                dist2 = np.maximum(np.einsum('ij,ij->i', delta, delta), 1e-9)
+                np.add.at(sorted_force, owners, delta * (k2 / dist2)[:, None])
+
+            points, cell_ids = points[~small], cell_ids[~small]
+            if level < depth and len(points):
+                first = info['child_start'][cell_ids]
+                lengths = info['child_end'][cell_ids] - first
+                offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+                cell_ids = np.repeat(first, lengths) + offsets
+                points = np.repeat(points, lengths)
+
+        force[order] = sorted_force
+        return force
@@ -1,6 +1,7 @@
 # SceneX/src/scene/layout.py
 
 import bpy
+import math
 from enum import Enum
 from typing import List, Tuple, Optional
 from mathutils import Vector
@@ -28,48 +29,77 @@ class Layout:
         if not objects:
             return
 
+        placements = self.positions([obj.dimensions for obj in objects], layout_type,
+                                    spacing, center, padding, columns)
+        for obj, (location, angle) in zip(objects, placements):
+            obj.location = location
+            if angle is not None:
+                obj.rotation_euler.z = angle
+
+    def positions(self, sizes: List[Tuple[float, ...]],
+                  layout_type: LayoutType,
+                  spacing: float = 1.0,
+                  center: Vector = Vector((0, 0, 0)),
+                  padding: float = 0.5,
+                  columns: int = 3) -> List[Tuple[Vector, Optional[float]]]:
+        """(location, z rotation or None) per item from its (width, height[, depth]).
+
+        Works on measured sizes alone, e.g. ``Text.measure()``, so labels can
+        be laid out before any object exists.
+        """
+        if not sizes:
+            return []
+        sizes = [Vector((tuple(size) + (0.0, 0.0))[:3]) for size in sizes]
+
         if layout_type == LayoutType.HORIZONTAL:
-            self._arrange_horizontal(objects, spacing, center, padding)
+            return self._arrange_horizontal(sizes, spacing, center, padding)
         elif layout_type == LayoutType.VERTICAL:
-            self._arrange_vertical(objects, spacing, center, padding)
+            return self._arrange_vertical(sizes, spacing, center, padding)
         elif layout_type == LayoutType.GRID:
-            self._arrange_grid(objects, spacing, center, padding, columns)
+            return self._arrange_grid(sizes, spacing, center, padding, columns)
         elif layout_type == LayoutType.CIRCULAR:
-            self._arrange_circular(objects, spacing, center, padding)
+            return self._arrange_circular(sizes, spacing, center, padding)
         elif layout_type == LayoutType.SPIRAL:
-            self._arrange_spiral(objects, spacing, center, padding)
+            return self._arrange_spiral(sizes, spacing, center, padding)
+        return []
 
-    def _arrange_horizontal(self, objects, spacing, center, padding):
-        total_width = sum(obj.dimensions.x for obj in objects) + spacing * (len(objects) - 1)
-        start_x = center.x - total_width/2 + objects[0].dimensions.x/2
+    def _arrange_horizontal(self, sizes, spacing, center, padding):
+        total_width = sum(size.x for size in sizes) + spacing * (len(sizes) - 1)
+        start_x = center.x - total_width/2 + sizes[0].x/2
         
+        placements = []
         current_x = start_x
-        for obj in objects:
-            obj.location = Vector((current_x, center.y, center.z))
-            current_x += obj.dimensions.x + spacing
+        for i, size in enumerate(sizes):
+            placements.append((Vector((current_x, center.y, center.z)), None))
+            if i + 1 < len(sizes):
+                current_x += (size.x + sizes[i + 1].x) / 2 + spacing
+        return placements
 
-    def _arrange_vertical(self, objects, spacing, center, padding):
-        total_height = sum(obj.dimensions.y for obj in objects) + spacing * (len(objects) - 1)
-        start_y = center.y + total_height/2 - objects[0].dimensions.y/2
+    def _arrange_vertical(self, sizes, spacing, center, padding):
+        total_height = sum(size.y for size in sizes) + spacing * (len(sizes) - 1)
+        start_y = center.y + total_height/2 - sizes[0].y/2
         
+        placements = []
         current_y = start_y
-        for obj in objects:
-            obj.location = Vector((center.x, current_y, center.z))
-            current_y -= obj.dimensions.y + spacing
+        for i, size in enumerate(sizes):
+            placements.append((Vector((center.x, current_y, center.z)), None))
+            if i + 1 < len(sizes):
+                current_y -= (size.y + sizes[i + 1].y) / 2 + spacing
+        return placements
 
-    def _arrange_grid(self, objects, spacing, center, padding, columns):
-        rows = (len(objects) + columns - 1) // columns
+    def _arrange_grid(self, sizes, spacing, center, padding, columns):
+        rows = (len(sizes) + columns - 1) // columns
         row_heights = []
         col_widths = []
         
         for i in range(rows):
-            row_objects = objects[i*columns:min((i+1)*columns, len(objects))]
-            row_heights.append(max(obj.dimensions.y for obj in row_objects))
+            row_sizes = sizes[i*columns:min((i+1)*columns, len(sizes))]
+            row_heights.append(max(size.y for size in row_sizes))
         
         for i in range(columns):
-            col_objects = [obj for j, obj in enumerate(objects) if j % columns == i]
-            if col_objects:
-                col_widths.append(max(obj.dimensions.x for obj in col_objects))
+            col_sizes = [size for j, size in enumerate(sizes) if j % columns == i]
+            if col_sizes:
+                col_widths.append(max(size.x for size in col_sizes))
         
         total_width = sum(col_widths) + spacing * (columns - 1)
         total_height = sum(row_heights) + spacing * (rows - 1)
@@ -77,36 +107,40 @@ class Layout:
         start_x = center.x - total_width/2
         start_y = center.y + total_height/2
         
-        for i, obj in enumerate(objects):
+        placements = []
+        for i in range(len(sizes)):
             row = i // columns
             col = i % columns
             
             x = start_x + sum(col_widths[:col]) + spacing * col + col_widths[col]/2
             y = start_y - (sum(row_heights[:row]) + spacing * row + row_heights[row]/2)
             
-            obj.location = Vector((x, y, center.z))
+            placements.append((Vector((x, y, center.z)), None))
+        return placements
 
-    def _arrange_circular(self, objects, spacing, center, padding):
-        count = len(objects)
-        radius = max(obj.dimensions.length/2 for obj in objects) + spacing
+    def _arrange_circular(self, sizes, spacing, center, padding):
+        count = len(sizes)
+        radius = max(size.length/2 for size in sizes) + spacing
         angle_step = 2 * 3.14159 / count
         
-        for i, obj in enumerate(objects):
+        placements = []
+        for i in range(count):
             angle = i * angle_step
             x = center.x + radius * math.cos(angle)
             y = center.y + radius * math.sin(angle)
-            obj.location = Vector((x, y, center.z))
-            obj.rotation_euler.z = angle + 3.14159/2
+            placements.append((Vector((x, y, center.z)), angle + 3.14159/2))
+        return placements
 
-    def _arrange_spiral(self, objects, spacing, center, padding):
-        count = len(objects)
-        base_radius = max(obj.dimensions.length/2 for obj in objects) + spacing
+    def _arrange_spiral(self, sizes, spacing, center, padding):
+        count = len(sizes)
+        base_radius = max(size.length/2 for size in sizes) + spacing
         angle_step = 2 * 3.14159 / 8  # More gradual spiral
         
-        for i, obj in enumerate(objects):
+        placements = []
+        for i in range(count):
             angle = i * angle_step
             radius = base_radius * (1 + i/count)
             x = center.x + radius * math.cos(angle)
             y = center.y + radius * math.sin(angle)
-            obj.location = Vector((x, y, center.z))
-            obj.rotation_euler.z = angle + 3.14159/2
\ No newline at end of file
+            placements.append((Vector((x, y, center.z)), angle + 3.14159/2))
+        return placements
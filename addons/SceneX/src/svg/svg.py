@@ -3,13 +3,32 @@ import bpy
 import os
 from pathlib import Path
 import mathutils
-from utils.logger import SceneXLogger
+from ..utils.logger import SceneXLogger
+from .svg_cache import get_svg_cache, import_svg_objects
+from .svg_fill import get_fill_cache
 
 # Initialize logger
 logger = SceneXLogger("SVG")
 
-def import_svg(svg_filename, scale=5.0, location=(0, 0, 0)):
-    """Import an SVG and return the parent container (Empty)."""
+def prepare_curve(obj):
+    """Flat, filled curve at the container origin"""
+    obj.data.dimensions = '2D'
+    obj.data.fill_mode = 'BOTH'
+    obj.location = (0, 0, 0)
+
+def prepare_mesh(obj):
+    """Filled curve replaced by its cached triangulated mesh"""
+    prepare_curve(obj)
+    get_fill_cache().convert(obj)
+
+def import_svg(svg_filename, scale=5.0, location=(0, 0, 0), use_cache=False, mesh_fill=False):
+    """Import an SVG and return the parent container (Empty).
+
+    By default the curves are imported and parented as editable objects.
+    With use_cache they come from the SVG asset cache and the container
+    is an Empty instancing them (no child curves to edit).
+    With mesh_fill the fills become triangulated meshes instead of curves.
+    """
     logger.info(f"Starting SVG import process for {svg_filename}")
     
     svg_path = Path(os.path.join(os.path.dirname(__file__), svg_filename))
@@ -19,43 +38,41 @@ def import_svg(svg_filename, scale=5.0, location=(0, 0, 0)):
         logger.error(f"SVG file not found at: {svg_path}")
         raise FileNotFoundError(f"SVG file not found at: {svg_path}")
 
-    # Store initial state
-    initial_objects = set(bpy.data.objects)
-    logger.debug(f"Number of objects before import: {len(initial_objects)}")
+    options = {"dimensions": "2D", "fill_mode": "MESH" if mesh_fill else "BOTH"}
+    prepare = prepare_mesh if mesh_fill else prepare_curve
+    if use_cache:
+        cache = get_svg_cache()
+        collection = cache.get_collection(svg_path, options, prepare=prepare)
+        if collection is None:
+            logger.error("No curve objects were imported from the SVG.")
+            return None
+        parent = cache.instance(collection, name="Logo_Container")
+        logger.debug(f"Instanced cached SVG collection: {collection.name}")
+    else:
+        try:
+            logger.debug("Attempting to import SVG file...")
+            imported_objects = [obj for obj in import_svg_objects(svg_path) if obj.type == 'CURVE']
+            logger.debug("SVG import operation completed")
+        except Exception as e:
+            logger.error(f"Error during SVG import: {str(e)}")
+            return None
+        logger.debug(f"Number of curve objects found: {len(imported_objects)}")
 
-    try:
-        logger.debug("Attempting to import SVG file...")
-        bpy.ops.import_curve.svg(filepath=str(svg_path))
-        logger.debug("SVG import operation completed")
-    except Exception as e:
-        logger.error(f"Error during SVG import: {str(e)}")
-        return None
-    
-    # Get new objects
-    new_objects = set(bpy.data.objects) - initial_objects
-    logger.debug(f"New objects created: {len(new_objects)}")
-    
-    imported_objects = [obj for obj in new_objects if obj.type == 'CURVE']
-    logger.debug(f"Number of curve objects found: {len(imported_objects)}")
-    
-    if not imported_objects:
-        logger.error("No curve objects were imported from the SVG.")
-        return None
+        if not imported_objects:
+            logger.error("No curve objects were imported from the SVG.")
+            return None
 
-    # Create Parent Empty
-    logger.debug("Creating parent empty object...")
-    bpy.ops.object.empty_add(type='PLAIN_AXES', align='WORLD', location=(0, 0, 0))
-    parent = bpy.context.active_object
-    parent.name = "Logo_Container"
+        # Create Parent Empty
+        logger.debug("Creating parent empty object...")
+        parent = bpy.data.objects.new("Logo_Container", None)
+        bpy.context.scene.collection.objects.link(parent)
 
-    # Parent imported objects
-    logger.debug("Parenting imported objects...")
-    for obj in imported_objects:
-        logger.debug(f"Processing object: {obj.name}")
-        obj.data.dimensions = '2D'
-        obj.data.fill_mode = 'BOTH'
-        obj.parent = parent
-        obj.location = (0, 0, 0)
+        # Parent imported objects
+        logger.debug("Parenting imported objects...")
+        for obj in imported_objects:
+            logger.debug(f"Processing object: {obj.name}")
+            obj.parent = parent
+            prepare(obj)
     
     # Scale and position
     logger.info("Scaling and positioning logo container...")
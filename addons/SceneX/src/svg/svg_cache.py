@@ -0,0 +1,129 @@
+# src/svg/svg_cache.py
+import bpy
+import hashlib
+import json
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from ..utils.cache import user_cache_dir
+from ..utils.logger import SceneXLogger
+
+class SVGAssetCache:
+    """Content-addressed cache of imported SVG curves.
+
+    Imports are keyed by the SVG file's content hash plus the import options.
+    The first import runs Blender's SVG importer, moves the resulting curves
+    into a collection kept outside the scene and saves it to a library
+    .blend named after the key. Later imports, in this session or a new
+    one, only add an Empty instancing that collection.
+    """
+    def __init__(self, cache_dir: Optional[str] = None):
+        if cache_dir is None:
+            cache_dir = user_cache_dir('svg')
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.collections: Dict[str, bpy.types.Collection] = {}
+        self.logger = SceneXLogger("SVGAssetCache")
+
+    def key(self, svg_path: Path, options: dict) -> str:
+        """Hash of file content, import options and Blender version"""
+        digest = hashlib.sha256()
+        with open(svg_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        digest.update(json.dumps(options, sort_keys=True).encode())
+        digest.update(bpy.app.version_string.encode())
+        return digest.hexdigest()
+
+    def get_collection(self, svg_path: Path, options: dict,
+                       prepare: Optional[Callable[[bpy.types.Object], None]] = None) -> Optional[bpy.types.Collection]:
+        """Return the cached collection for this SVG, importing it on a miss"""
+        key = self.key(svg_path, options)
+        name = f"SVG_{key[:16]}"
+
+        collection = self.collections.get(key)
+        if collection is not None and collection.name in bpy.data.collections:
+            self.logger.debug(f"SVG cache hit (session): {svg_path.name}")
+            return collection
+
+        library_path = self.cache_dir / f"{key}.blend"
+        if library_path.exists():
+            collection = self._link_library(library_path, name)
+            if collection is not None:
+                self.logger.debug(f"SVG cache hit (library): {svg_path.name}")
+                self.collections[key] = collection
+                return collection
+
+        collection = self._import(svg_path, name, prepare)
+        if collection is None:
+            return None
+        bpy.data.libraries.write(str(library_path), {collection}, fake_user=True)
+        self.logger.info(f"SVG cached: {svg_path.name} -> {library_path.name}")
+        self.collections[key] = collection
+        return collection
+
+    def instance(self, collection: bpy.types.Collection, name: str = "SVG_Container") -> bpy.types.Object:
+        """Create an Empty in the active scene instancing the cached collection"""
+        container = bpy.data.objects.new(name, None)
+        container.instance_type = 'COLLECTION'
+        container.instance_collection = collection
+        bpy.context.scene.collection.objects.link(container)
+        return container
+
+    def _import(self, svg_path: Path, name: str,
+                prepare: Optional[Callable[[bpy.types.Object], None]]) -> Optional[bpy.types.Collection]:
+        imported = import_svg_objects(svg_path)
+        curves = [obj for obj in imported if obj.type == 'CURVE']
+        if not curves:
+            self.logger.error(f"No curve objects imported from {svg_path}")
+            return None
+
+        collection = bpy.data.collections.new(name)
+        for obj in curves:
+            for users in list(obj.users_collection):
+                users.objects.unlink(obj)
+            collection.objects.link(obj)
+            if prepare:
+                prepare(obj)
+        collection.use_fake_user = True
+        return collection
+
+    def _link_library(self, library_path: Path, name: str) -> Optional[bpy.types.Collection]:
+        try:
+            with bpy.data.libraries.load(str(library_path), link=True) as (data_from, data_to):
+                if name in data_from.collections:
+                    data_to.collections = [name]
+            return data_to.collections[0] if data_to.collections else None
+        except Exception as e:
+            self.logger.warning(f"Could not load cached SVG library {library_path}: {str(e)}")
+            return None
+
+def import_svg_objects(svg_path: Path) -> List[bpy.types.Object]:
+    """Run Blender's SVG importer and return exactly the objects it created.
+
+    The importer puts everything into one new child collection of the scene
+    collection; that collection is read back and removed from the scene
+    instead of diffing ``bpy.data.objects`` before and after the import.
+    """
+    scene_collection = bpy.context.scene.collection
+    existing = set(scene_collection.children)
+    bpy.ops.import_curve.svg(filepath=str(svg_path))
+
+    objects = []
+    for child in list(scene_collection.children):
+        if child in existing:
+            continue
+        objects.extend(child.all_objects)
+        scene_collection.children.unlink(child)
+        for obj in child.all_objects:
+            scene_collection.objects.link(obj)
+        bpy.data.collections.remove(child)
+    return objects
+
+_default_cache: Optional[SVGAssetCache] = None
+
+def get_svg_cache() -> SVGAssetCache:
+    """Shared cache instance used by the SVG import helpers"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SVGAssetCache()
+    return _default_cache
@@ -0,0 +1,132 @@
+# src/svg/svg_fill.py
+import bpy
+import hashlib
+import numpy as np
+from typing import Dict, List, Optional
+from ..geometry.triangulate import triangulate_outlines
+from ..utils.logger import SceneXLogger
+
+class SVGFillCache:
+    """Triangulated meshes for filled SVG curves.
+
+    A filled 2D curve is re-tessellated by Blender on every depsgraph
+    evaluation. Converting it once to a mesh removes that cost; meshes are
+    keyed by a hash of the flattened outlines, so identical shapes share one
+    mesh datablock across objects and imports. Each object carries its own
+    fill material in an object-linked slot.
+    """
+    def __init__(self):
+        self.meshes: Dict[str, bpy.types.Mesh] = {}
+        self.logger = SceneXLogger("SVGFillCache")
+
+    def convert(self, obj: bpy.types.Object) -> Optional[bpy.types.Object]:
+        """Replace a filled curve object by a mesh object in the same collections"""
+        mesh = self.mesh_for(obj.data)
+        if mesh is None:
+            return None
+
+        mesh_obj = bpy.data.objects.new(obj.name, mesh)
+        material = next((m for m in obj.data.materials if m is not None), None)
+        if material is not None:
+            slot = mesh_obj.material_slots[0]
+            slot.link = 'OBJECT'
+            slot.material = material
+        mesh_obj.parent = obj.parent
+        mesh_obj.matrix_parent_inverse = obj.matrix_parent_inverse.copy()
+        mesh_obj.matrix_basis = obj.matrix_basis.copy()
+        for collection in obj.users_collection:
+            collection.objects.link(mesh_obj)
+        curve = obj.data
+        bpy.data.objects.remove(obj)
+        if curve.users == 0:
+            bpy.data.curves.remove(curve)
+        return mesh_obj
+
+    def mesh_for(self, curve: bpy.types.Curve) -> Optional[bpy.types.Mesh]:
+        """Cached fill mesh for a curve, triangulating on a miss"""
+        outlines = curve_outlines(curve)
+        if not outlines:
+            return None
+
+        digest = hashlib.sha1()
+        for outline in outlines:
+            digest.update(np.int64(len(outline)).tobytes())
+            digest.update(outline.tobytes())
+        key = digest.hexdigest()
+        name = f"SVGFill_{key[:16]}"
+
+        mesh = self.meshes.get(key)
+        if mesh is None or mesh.name not in bpy.data.meshes:
+            # Meshes saved with a cached SVG library keep their name
+            mesh = bpy.data.meshes.get(name)
+        if mesh is None:
+            vertices, triangles = triangulate_outlines(outlines)
+            if not len(triangles):
+                return None
+            mesh = build_triangle_mesh(name, vertices, triangles)
+            self.logger.debug(f"Triangulated {curve.name}: {len(triangles)} triangles")
+        if not len(mesh.materials):
+            mesh.materials.append(None)  # Slot for the per-object material
+        self.meshes[key] = mesh
+        return mesh
+
+def build_triangle_mesh(name: str, vertices: np.ndarray, triangles: np.ndarray) -> bpy.types.Mesh:
+    """Mesh in the z = 0 plane from (n, 2) vertices and (m, 3) triangles, filled with foreach_set"""
+    count = len(triangles)
+    co = np.zeros((len(vertices), 3), dtype=np.float32)
+    co[:, :2] = vertices
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(vertices))
+    mesh.loops.add(count * 3)
+    mesh.polygons.add(count)
+    mesh.vertices.foreach_set("co", co.ravel())
+    mesh.loops.foreach_set("vertex_index", np.asarray(triangles, dtype=np.int32).ravel())
+    mesh.polygons.foreach_set("loop_start", np.arange(0, count * 3, 3, dtype=np.int32))
+    try:
+        mesh.polygons.foreach_set("loop_total", np.full(count, 3, dtype=np.int32))
+    except (AttributeError, TypeError):
+        pass  # Read-only since Blender 4.0, derived from loop_start
+    mesh.update(calc_edges=True)
+    return mesh
+
+def curve_outlines(curve: bpy.types.Curve) -> List[np.ndarray]:
+    """Closed splines of a curve flattened to (n, 2) float64 outlines.
+
+    Bezier segments are sampled ``resolution_u`` times, as Blender does when
+    filling the curve itself.
+    """
+    steps = max(curve.resolution_u, 1)
+    t = np.arange(steps) / steps
+    weights = np.stack([(1 - t) ** 3, 3 * t * (1 - t) ** 2, 3 * t ** 2 * (1 - t), t ** 3], axis=1)
+
+    outlines = []
+    for spline in curve.splines:
+        if not spline.use_cyclic_u:
+            continue
+        if spline.type == 'BEZIER':
+            count = len(spline.bezier_points)
+            co, left, right = (np.empty(count * 3, dtype=np.float32) for _ in range(3))
+            spline.bezier_points.foreach_get("co", co)
+            spline.bezier_points.foreach_get("handle_left", left)
+            spline.bezier_points.foreach_get("handle_right", right)
+            co, left, right = (a.reshape(-1, 3)[:, :2].astype(np.float64) for a in (co, left, right))
+            # Segment i runs from point i to point i + 1 (wrapping)
+            controls = np.stack([co, right, np.roll(left, -1, axis=0), np.roll(co, -1, axis=0)], axis=1)
+            outline = np.einsum('tk,skd->std', weights, controls).reshape(-1, 2)
+        else:
+            count = len(spline.points)
+            co = np.empty(count * 4, dtype=np.float32)
+            spline.points.foreach_get("co", co)
+            outline = co.reshape(-1, 4)[:, :2].astype(np.float64)
+        if len(outline) >= 3:
+            outlines.append(outline)
+    return outlines
+
+_default_cache: Optional[SVGFillCache] = None
+
+def get_fill_cache() -> SVGFillCache:
+    """Shared fill cache used by the SVG import helpers"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SVGFillCache()
+    return _default_cache
@@ -3,15 +3,27 @@
 import bpy
 import os
 from pathlib import Path
+from typing import Optional
 from ..utils.logger import SceneXLogger
+from .svg import prepare_curve, prepare_mesh
+from .svg_cache import SVGAssetCache, get_svg_cache, import_svg_objects
 
 class SVGHandler:
     """Handle SVG import and manipulation"""
-    def __init__(self):
+    def __init__(self, cache: Optional[SVGAssetCache] = None):
         self.logger = SceneXLogger("SVGHandler")
+        self.cache = cache or get_svg_cache()
         
-    def import_svg(self, svg_filename: str, scale: float = 1.0, location=(0, 0, 0)):
-        """Import SVG and return parent container"""
+    def import_svg(self, svg_filename: str, scale: float = 1.0, location=(0, 0, 0),
+                   use_cache: bool = False, mesh_fill: bool = False):
+        """Import SVG and return parent container.
+
+        By default the curves are imported as editable child objects. With
+        use_cache the result is an Empty instancing the shared cached SVG
+        collection instead, which is much faster for repeated imports.
+        With mesh_fill, filled shapes are triangulated once into (shared)
+        meshes instead of curves Blender re-fills on every evaluation.
+        """
         self.logger.info(f"Starting SVG import for {svg_filename}")
         
         # Get SVG path
@@ -22,35 +34,39 @@ class SVGHandler:
             self.logger.error(f"SVG file not found at: {svg_path}")
             raise FileNotFoundError(f"SVG file not found at: {svg_path}")
 
-        # Store initial state
-        initial_objects = set(bpy.data.objects)
-
         try:
-            # Import SVG
-            self.logger.debug("Importing SVG file...")
-            bpy.ops.import_curve.svg(filepath=str(svg_path))
-            
-            # Get new objects
-            new_objects = [obj for obj in bpy.data.objects 
-                         if obj not in initial_objects and obj.type in ['CURVE', 'GPENCIL']]
-            
-            if not new_objects:
-                self.logger.error("No curve objects imported from SVG")
-                return None
+            if use_cache:
+                prepare = prepare_mesh if mesh_fill else prepare_curve
+                options = {"dimensions": "2D", "fill_mode": "MESH" if mesh_fill else "BOTH"}
+                collection = self.cache.get_collection(svg_path, options, prepare=prepare)
+                if collection is None:
+                    self.logger.error("No curve objects imported from SVG")
+                    return None
+                parent = self.cache.instance(collection)
+            else:
+                # Import SVG
+                self.logger.debug("Importing SVG file...")
+                new_objects = [obj for obj in import_svg_objects(svg_path)
+                               if obj.type in ['CURVE', 'GPENCIL']]
+                
+                if not new_objects:
+                    self.logger.error("No curve objects imported from SVG")
+                    return None
 
-            # Create parent empty
-            bpy.ops.object.empty_add(type='PLAIN_AXES', location=(0, 0, 0))
-            parent = bpy.context.active_object
-            parent.name = "SVG_Container"
+                # Create parent empty
+                parent = bpy.data.objects.new("SVG_Container", None)
+                bpy.context.scene.collection.objects.link(parent)
 
-            # Process imported objects
-            for obj in new_objects:
-                self.logger.debug(f"Processing {obj.name}")
-                if obj.type == 'CURVE':
-                    obj.data.dimensions = '2D'
-                    obj.data.fill_mode = 'BOTH'
-                obj.parent = parent
-                obj.location = (0, 0, 0)
+                # Process imported objects
+                for obj in new_objects:
+                    self.logger.debug(f"Processing {obj.name}")
+                    obj.parent = parent
+                    obj.location = (0, 0, 0)
+                    if obj.type == 'CURVE':
+                        if mesh_fill:
+                            prepare_mesh(obj)
+                        else:
+                            prepare_curve(obj)
 
             # Apply scale and position
             parent.scale = (scale, scale, scale)
@@ -86,12 +102,17 @@ class SVGHandler:
         if not svg_container:
             return (0, 0, 0)
             
-        # Calculate bounds from all child objects
+        # Calculate bounds from all child (or instanced) objects
         min_x = min_y = min_z = float('inf')
         max_x = max_y = max_z = float('-inf')
+
+        if svg_container.instance_type == 'COLLECTION' and svg_container.instance_collection:
+            parts = svg_container.instance_collection.all_objects
+        else:
+            parts = svg_container.children
         
-        for obj in svg_container.children:
-            if obj.type == 'CURVE':
+        for obj in parts:
+            if obj.type in ('CURVE', 'MESH'):
                 for point in obj.bound_box:
                     x, y, z = point
                     min_x = min(min_x, x)
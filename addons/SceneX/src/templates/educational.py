@@ -1,5 +1,15 @@
 # SceneX/src/templates/educational.py
 
+import bpy
+from mathutils import Vector
+from ..core.scene import Scene
+from ..scene.groups import Group
+from ..scene.layout import Layout, LayoutType
+from ..text.text_support import Text
+from ..animation.base import AnimationConfig
+from ..animation.commonly_used_animations import FadeInFrom
+from ..animation.transform import FadeOut
+
 class PresentationScene(Scene):
     """Base class for educational presentations"""
     def __init__(self, title: str = "Presentation"):
@@ -16,17 +26,22 @@ class PresentationScene(Scene):
         self.coordinate_system.place_object(title_text, Vector((0, 3, 0)))
         slide_group.add(title_text)
         
-        # Add content
+        # Add content: text lines are measured and laid out before any is created
         layout = Layout()
-        y_pos = 2
+        lines = [Text(item, size=0.6) for item in content if isinstance(item, str)]
+        placements = layout.positions([line.measure() for line in lines], LayoutType.VERTICAL,
+                                      spacing=0.3)
+        if placements:
+            offset = Vector((0, 2, 0)) - placements[0][0]  # First line at y = 2
+        lines = iter(zip(lines, placements))
         for item in content:
             if isinstance(item, str):
-                text = Text(item, size=0.6).create()
-                self.coordinate_system.place_object(text, Vector((0, y_pos, 0)))
+                line, (location, _) = next(lines)
+                text = line.create()
+                self.coordinate_system.place_object(text, location + offset)
                 slide_group.add(text)
             else:
                 slide_group.add(item)
-            y_pos -= 1
             
         self.slides.append(slide_group)
         return slide_group
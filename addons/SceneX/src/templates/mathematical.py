@@ -1,5 +1,16 @@
 # SceneX/src/templates/mathematical.py
 
+import bpy
+from typing import List, Optional, Sequence, Tuple
+from mathutils import Vector
+from ..core.scene import Scene
+from ..geometry.base import Geometry
+from ..graphics.graphs import FunctionGraph, ImplicitCurve, ParametricCurve
+from ..graphics.surfaces import HeightField, Surface
+from ..text.text_support import LaTeXText
+from ..animation.commonly_used_animations import Write
+from ..animation.base import AnimationConfig
+
 class MathematicalScene(Scene):
     """Base class for mathematical animations"""
     def __init__(self):
@@ -14,9 +25,68 @@ class MathematicalScene(Scene):
         self.equations.append(equation)
         return equation
 
-    def add_graph(self, func, x_range=(-5, 5), position: Vector = Vector((0, 0, 0))):
-        """Add mathematical graph"""
-        pass  # Implement graphing functionality
+    def add_equations(self, equations: Sequence[Tuple[str, Vector]],
+                      workers: Optional[int] = None) -> List[bpy.types.Object]:
+        """Add many LaTeX equations, rendering them in a worker pool first.
+
+        ``equations`` holds (tex, position) pairs, e.g. every equation of a
+        scene collected before construction.
+        """
+        objects = LaTeXText.create_many([tex for tex, _ in equations], size=0.8, workers=workers)
+        for equation, (_, position) in zip(objects, equations):
+            if equation is not None:  # Failed equations are logged and skipped
+                self.coordinate_system.place_object(equation, position)
+                self.equations.append(equation)
+        return objects
+
+    def add_graph(self, func, x_range=(-5, 5), position: Vector = Vector((0, 0, 0)),
+                  y_range: Optional[Tuple[float, float]] = None, samples: int = 1000,
+                  color=(1, 1, 1, 1), stroke_width: float = 0.03):
+        """Add the graph of y = func(x); ``func`` takes and returns NumPy arrays"""
+        graph = FunctionGraph(func, x_range, y_range, samples, color=color,
+                              stroke_width=stroke_width / self.coordinate_system.scale)
+        return self._add_plot(graph, position)
+
+    def add_parametric_curve(self, func, t_range=(0, 1), position: Vector = Vector((0, 0, 0)),
+                             samples: int = 1000, color=(1, 1, 1, 1), stroke_width: float = 0.03):
+        """Add the curve (x(t), y(t)[, z(t)]); ``func`` returns a tuple of arrays"""
+        curve = ParametricCurve(func, t_range, samples, color=color,
+                                stroke_width=stroke_width / self.coordinate_system.scale)
+        return self._add_plot(curve, position)
+
+    def add_implicit_curve(self, func, x_range=(-5, 5), y_range=(-5, 5),
+                           position: Vector = Vector((0, 0, 0)), resolution: int = 200,
+                           color=(1, 1, 1, 1), stroke_width: float = 0.03):
+        """Add the curve func(x, y) = 0, e.g. ``lambda x, y: x**2 + y**2 - 4``"""
+        curve = ImplicitCurve(func, x_range, y_range, resolution, color=color,
+                              stroke_width=stroke_width / self.coordinate_system.scale)
+        return self._add_plot(curve, position)
+
+    def add_surface(self, func, u_range=(0, 1), v_range=(0, 1), resolution=(100, 100),
+                    position: Vector = Vector((0, 0, 0)), color=(1, 1, 1, 1)):
+        """Add the parametric surface func(u, v[, t]) -> (x, y, z) arrays.
+
+        Returns the Surface (its ``object`` is in the scene) so it can be animated.
+        """
+        surface = Surface(func, u_range, v_range, resolution, color=color)
+        self._add_plot(surface, position)
+        return surface
+
+    def add_heightfield(self, func, x_range=(-5, 5), y_range=(-5, 5), resolution=(100, 100),
+                        position: Vector = Vector((0, 0, 0)), color=(1, 1, 1, 1)):
+        """Add the surface z = func(x, y[, t]); returns the HeightField like add_surface"""
+        surface = HeightField(func, x_range, y_range, resolution, color=color)
+        self._add_plot(surface, position)
+        return surface
+
+    def _add_plot(self, plot: Geometry, position: Vector):
+        obj = plot.create()
+        if obj is None:
+            return None
+        # Points are in math units; the coordinate system maps them to the scene
+        self.coordinate_system.place_object(obj, position, apply_scale=True)
+        self.graphs.append(obj)
+        return obj
 
     def animate_derivation(self):
         """Animate mathematical derivation"""
@@ -2,13 +2,16 @@
 
 import bpy
 import math
+from typing import Optional
 from mathutils import Vector
 from ..core.scene import Scene
-from ..geometry.shapes import Circle, Square, Arrow
+from ..geometry.shapes import Circle, Square, Line
+from ..geometry.complex_shapes import Arrow
 from ..text.text_support import Text
 from ..animation.commonly_used_animations import FadeInFrom, Write
 from ..animation.base import AnimationConfig
 from ..scene.layout import Layout, LayoutType
+from ..scene.graph_layout import LayeredLayout, LayeredLayoutConfig
 
 class TechnicalDiagramScene(Scene):
     """Base class for technical diagram animations"""
@@ -18,38 +21,63 @@ class TechnicalDiagramScene(Scene):
         self.components = []
         self.connections = []
         self.labels = []
+        self.component_labels = {}
+        self.edges = []
 
-    def add_component(self, shape_type: str, position: Vector, label: str = ""):
-        """Add a component to the diagram"""
+    def add_component(self, shape_type: str, position: Optional[Vector] = None, label: str = ""):
+        """Add a component to the diagram (position None defers to auto_layout)"""
         if shape_type == "circle":
             shape = Circle(radius=0.5).create()
         elif shape_type == "square":
             shape = Square(size=1.0).create()
-        
+
+        if position is None:
+            position = Vector((0, 0, 0))
         self.coordinate_system.place_object(shape, position)
         
         if label:
             text = Text(label, size=0.3).create()
             self.coordinate_system.place_object(text, position + Vector((0, -0.7, 0)))
             self.labels.append(text)
+            self.component_labels[shape.name] = text
             
         self.components.append(shape)
         return shape
 
     def connect_components(self, start_obj, end_obj, arrow: bool = True):
         """Create connection between components"""
-        start_pos = start_obj.location
-        end_pos = end_obj.location
-        
-        if arrow:
-            connection = Arrow(start=start_pos, end=end_pos).create()
-        else:
-            # Create line
-            pass
-            
+        connection = self._create_connection(start_obj.location, end_obj.location, arrow)
+        self.edges.append((start_obj, end_obj, arrow))
         self.connections.append(connection)
         return connection
 
+    def _create_connection(self, start_pos: Vector, end_pos: Vector, arrow: bool = True):
+        if arrow:
+            return Arrow(start=start_pos, end=end_pos).create()
+        return Line(start=start_pos, end=end_pos).create()
+
+    def auto_layout(self, config: Optional[LayeredLayoutConfig] = None,
+                    origin: Vector = Vector((0, 0, 0))):
+        """Place components with a layered layout of the connection graph"""
+        layout = LayeredLayout(config)
+        names = [component.name for component in self.components]
+        positions = layout.compute(names, [(a.name, b.name) for a, b, _ in self.edges])
+
+        for component in self.components:
+            x, y = positions[component.name]
+            position = origin + Vector((x, y, 0))
+            self.coordinate_system.place_object(component, position)
+            label = self.component_labels.get(component.name)
+            if label:
+                self.coordinate_system.place_object(label, position + Vector((0, -0.7, 0)))
+
+        # Rebuild connections between the new locations
+        for connection in self.connections:
+            bpy.data.objects.remove(connection, do_unlink=True)
+        self.connections = [self._create_connection(a.location, b.location, arrow)
+                            for a, b, arrow in self.edges]
+        return positions
+
     def animate_diagram(self):
         """Animate the diagram components"""
         config = AnimationConfig(duration=30)
@@ -0,0 +1,168 @@
+import bpy
+import hashlib
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+from PIL import Image
+from src.utils.logger import SceneXLogger
+
+
+def skyline_pack(sizes: Sequence[Tuple[int, int]], width: int,
+                 height: int) -> Tuple[List[Tuple[int, int, int]], List[int]]:
+    """Bottom-left skyline packing of rectangles into pages of width x height.
+
+    Rectangles are placed tallest first, each at the skyline position with
+    the lowest resulting top edge; a new page is opened when none fits.
+    Returns (page, x, y) per rectangle, y measured from the bottom, and
+    the used height of every page.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    placements: List[Tuple[int, int, int]] = [(0, 0, 0)] * len(sizes)
+    skylines: List[List[List[int]]] = []  # Per page: [x, y, width] segments from left to right
+    for i in order:
+        w, h = sizes[i]
+        if w > width or h > height:
+            raise ValueError(f"Image of {w}x{h} does not fit an atlas page of {width}x{height}")
+        for page, skyline in enumerate(skylines):
+            spot = _skyline_fit(skyline, w, h, width, height)
+            if spot is not None:
+                break
+        else:
+            skylines.append([[0, 0, width]])
+            page, skyline = len(skylines) - 1, skylines[-1]
+            spot = _skyline_fit(skyline, w, h, width, height)
+        index, x, y = spot
+        _skyline_add(skyline, index, x, y + h, w)
+        placements[i] = (page, x, y)
+    return placements, [max(y for _, y, _ in skyline) for skyline in skylines]
+
+
+def _skyline_fit(skyline: List[List[int]], w: int, h: int, width: int, height: int):
+    """Best (segment index, x, y) for a w x h rectangle, or None"""
+    best = None
+    for i, (x, _, _) in enumerate(skyline):
+        if x + w > width:
+            break
+        # Resting height is the highest segment under the rectangle's span
+        y, j, covered = 0, i, 0
+        while covered < w:
+            y = max(y, skyline[j][1])
+            covered += skyline[j][2]
+            j += 1
+        if y + h <= height and (best is None or (y + h, x) < (best[2] + h, best[1])):
+            best = (i, x, y)
+    return best
+
+
+def _skyline_add(skyline: List[List[int]], index: int, x: int, top: int, w: int):
+    skyline.insert(index, [x, top, w])
+    right = x + w
+    i = index + 1
+    while i < len(skyline) and skyline[i][0] < right:
+        seg_x, seg_y, seg_w = skyline[i]
+        if seg_x + seg_w <= right:
+            del skyline[i]
+            continue
+        skyline[i] = [right, seg_y, seg_x + seg_w - right]
+        break
+    # Merge neighbours at equal height
+    i = 0
+    while i < len(skyline) - 1:
+        if skyline[i][1] == skyline[i + 1][1]:
+            skyline[i][2] += skyline[i + 1][2]
+            del skyline[i + 1]
+        else:
+            i += 1
+
+
+@dataclass(frozen=True)
+class AtlasRegion:
+    """Pixel rectangle of one packed image; x, y from the page's bottom-left corner"""
+    image: bpy.types.Image
+    x: int
+    y: int
+    width: int
+    height: int
+
+    @property
+    def uv_rect(self) -> Tuple[float, float, float, float]:
+        """(u0, v0, u1, v1) of the region within its page"""
+        page_w, page_h = self.image.size
+        return (self.x / page_w, self.y / page_h,
+                (self.x + self.width) / page_w, (self.y + self.height) / page_h)
+
+
+class ImageAtlas:
+    """Packs many small images (rendered equations, labels) into few large textures.
+
+    Pages are composed once and written next to the source images as
+    ``atlas_<key>_<page>.png``; the key hashes the image contents and
+    packing options, so later sessions load the pages instead of packing
+    again. Pages count towards the LaTeX cache size; eviction skips pages
+    loaded in ``bpy.data.images`` and rebuilds are cheap. ``stats`` reports texture memory and material counts compared
+    with one texture per image.
+    """
+    def __init__(self, cache_dir, page_size: int = 4096, padding: int = 2):
+        self.cache_dir = Path(cache_dir)
+        self.page_size = page_size
+        self.padding = padding  # Transparent border against filtering bleed
+        self.stats: Dict[str, float] = {}
+        self.logger = SceneXLogger("ImageAtlas")
+
+    def build(self, paths: Sequence[Path]) -> List[AtlasRegion]:
+        """Atlas region for every path, in order; repeated paths share a region"""
+        unique = list(dict.fromkeys(Path(p) for p in paths))
+        digest = hashlib.sha256(f"{self.page_size}:{self.padding}".encode())
+        sizes = []
+        for path in unique:
+            digest.update(path.read_bytes())
+            with Image.open(path) as img:
+                sizes.append(img.size)
+        key = digest.hexdigest()[:16]
+
+        pad = 2 * self.padding
+        placements, heights = skyline_pack([(w + pad, h + pad) for w, h in sizes],
+                                           self.page_size, self.page_size)
+        pages = [self._page(key, page, height, unique, sizes, placements)
+                 for page, height in enumerate(heights)]
+
+        regions = {}
+        for path, (w, h), (page, x, y) in zip(unique, sizes, placements):
+            regions[path] = AtlasRegion(pages[page], x + self.padding, y + self.padding, w, h)
+
+        before = sum(w * h * 4 for w, h in sizes)
+        after = sum(page.size[0] * page.size[1] * 4 for page in pages)
+        self.stats = {'images': len(unique), 'pages': len(pages),
+                      'texture_bytes_before': before, 'texture_bytes_after': after,
+                      'materials_before': len(unique), 'materials_after': len(pages)}
+        self.logger.info(f"Packed {len(unique)} images into {len(pages)} atlas pages: "
+                         f"{before / 1e6:.1f} MB -> {after / 1e6:.1f} MB of RGBA8 texture, "
+                         f"{len(unique)} -> {len(pages)} materials")
+        return [regions[Path(p)] for p in paths]
+
+    def _page(self, key: str, page: int, height: int, paths, sizes, placements) -> bpy.types.Image:
+        name = f"atlas_{key}_{page}"
+        path = self.cache_dir / f"{name}.png"
+        if path.exists():
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        else:
+            canvas = Image.new("RGBA", (self.page_size, height), (0, 0, 0, 0))
+            for source, (w, h), (p, x, y) in zip(paths, sizes, placements):
+                if p != page:
+                    continue
+                with Image.open(source) as img:
+                    # PIL rows run top-down, atlas y bottom-up
+                    canvas.paste(img.convert("RGBA"), (x + self.padding, height - y - self.padding - h))
+            partial = path.with_suffix(f".{os.getpid()}.tmp")
+            canvas.save(partial, format="PNG")
+            os.replace(partial, path)
+
+        image = bpy.data.images.get(name)
+        if image is None:
+            image = bpy.data.images.load(str(path))
+            image.name = name
+        return image
@@ -0,0 +1,107 @@
+import bpy
+import os
+from typing import Dict, Optional, Tuple
+from matplotlib.font_manager import FontProperties, findfont
+from matplotlib.ft2font import FT2Font
+from src.utils.logger import SceneXLogger
+
+try:
+    from matplotlib.ft2font import Kerning, LoadFlags
+    _NO_SCALE, _UNSCALED = LoadFlags.NO_SCALE, Kerning.UNSCALED
+except ImportError:  # matplotlib < 3.10
+    from matplotlib.ft2font import KERNING_UNSCALED as _UNSCALED, LOAD_NO_SCALE as _NO_SCALE
+
+
+class GlyphMetrics:
+    """Advance widths and kerning of one font file, read with FreeType.
+
+    Values are cached per character (pair) in em units, so measuring a
+    string never touches bpy. Sizes follow Blender text objects: ``size``
+    is the height of one em.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.face = FT2Font(path)
+        self.units_per_em = float(self.face.units_per_EM)
+        self.ascender = self.face.ascender / self.units_per_em
+        self.descender = self.face.descender / self.units_per_em  # Negative below the baseline
+        self.advances: Dict[str, float] = {}
+        self.kerning: Dict[Tuple[str, str], float] = {}
+
+    def advance(self, char: str) -> float:
+        advance = self.advances.get(char)
+        if advance is None:
+            glyph = self.face.load_char(ord(char), flags=_NO_SCALE)
+            advance = self.advances[char] = glyph.horiAdvance / self.units_per_em
+        return advance
+
+    def kern(self, left: str, right: str) -> float:
+        pair = (left, right)
+        value = self.kerning.get(pair)
+        if value is None:
+            value = self.face.get_kerning(self.face.get_char_index(ord(left)),
+                                          self.face.get_char_index(ord(right)), _UNSCALED)
+            value = self.kerning[pair] = value / self.units_per_em
+        return value
+
+    def line_width(self, line: str) -> float:
+        """Advance width of a single line in em, kerning included"""
+        width = sum(self.advance(char) for char in line)
+        width += sum(self.kern(a, b) for a, b in zip(line, line[1:]))
+        return width
+
+    def measure(self, text: str, size: float = 1.0, line_spacing: float = 1.0) -> Tuple[float, float]:
+        """(width, height) of ``text`` in Blender units; lines split on newlines"""
+        lines = text.split("\n")
+        width = max(self.line_width(line) for line in lines)
+        line_height = self.ascender - self.descender
+        height = line_height + (len(lines) - 1) * line_height * line_spacing
+        return width * size, height * size
+
+
+class FontCache:
+    """Font datablocks and glyph metrics shared by all Text objects, keyed by file path.
+
+    ``None`` stands for Blender's built-in font; its metrics are
+    approximated with matplotlib's default font (DejaVu Sans).
+    """
+    def __init__(self):
+        self.fonts: Dict[str, bpy.types.VectorFont] = {}
+        self.metrics: Dict[Optional[str], GlyphMetrics] = {}
+        self.logger = SceneXLogger("FontCache")
+
+    @staticmethod
+    def _key(path: Optional[str]) -> Optional[str]:
+        return os.path.realpath(path) if path else None
+
+    def font(self, path: Optional[str]) -> Optional[bpy.types.VectorFont]:
+        """Loaded font for a file, or None for the built-in font"""
+        key = self._key(path)
+        if key is None:
+            return None
+        font = self.fonts.get(key)
+        if font is None or font.name not in bpy.data.fonts:
+            font = self.fonts[key] = bpy.data.fonts.load(key, check_existing=True)
+            self.logger.debug(f"Loaded font {key}")
+        return font
+
+    def glyph_metrics(self, path: Optional[str] = None) -> GlyphMetrics:
+        key = self._key(path)
+        metrics = self.metrics.get(key)
+        if metrics is None:
+            metrics = self.metrics[key] = GlyphMetrics(key or findfont(FontProperties()))
+        return metrics
+
+    def measure(self, text: str, size: float = 1.0, path: Optional[str] = None) -> Tuple[float, float]:
+        return self.glyph_metrics(path).measure(text, size)
+
+
+_default_cache: Optional[FontCache] = None
+
+
+def get_font_cache() -> FontCache:
+    """Shared cache used by Text"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = FontCache()
+    return _default_cache
@@ -0,0 +1,190 @@
+import bpy
+import hashlib
+import json
+import os
+import time
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.text.latex_render import LaTeXRenderSettings, font_settings, render_job
+from src.utils.cache import user_cache_dir
+from src.utils.logger import SceneXLogger
+from src.utils.process_pool import map_in_workers
+
+
+class LaTeXRenderCache:
+    """Persistent, size-bounded cache of rendered equation images.
+
+    Images are stored as ``<key>.png`` where the key hashes the TeX source,
+    color, render settings and font configuration. File modification times
+    serve as the LRU clock: hits touch the file and eviction removes the
+    least recently used files once the directory exceeds ``max_bytes``.
+    Already loaded ``bpy.data.images`` are reused instead of loading again.
+    """
+    STALE_AGE = 3600  # Seconds before an unfinished render file counts as abandoned
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = 256 * 1024 * 1024):
+        if cache_dir is None:
+            cache_dir = user_cache_dir('latex')
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.renders = 0
+        self.hits = 0
+        self.failed: Dict[str, str] = {}  # Key -> error of equations that do not render
+        self.logger = SceneXLogger("LaTeXCache")
+        self.clean_stale_files()
+
+    def key(self, tex: str, color, settings: LaTeXRenderSettings) -> str:
+        payload = {
+            'tex': tex,
+            'color': [round(float(c), 6) for c in color],
+            'settings': asdict(settings),
+            'fonts': font_settings(),
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.png"
+
+    def get_path(self, tex: str, color=(1, 1, 1, 1),
+                 settings: LaTeXRenderSettings = LaTeXRenderSettings()) -> Path:
+        """Image file of an equation, rendering it only on a cache miss"""
+        key = self.key(tex, color, settings)
+        if key in self.failed:
+            raise ValueError(f"LaTeX render failed: {self.failed[key]}")
+        path = self.path_for(key)
+        if path.exists():
+            self.hits += 1
+            self._touch(path)
+        else:
+            self.store(path, tex, color, settings)
+        return path
+
+    def get_image(self, tex: str, color=(1, 1, 1, 1),
+                  settings: LaTeXRenderSettings = LaTeXRenderSettings()) -> bpy.types.Image:
+        """Loaded image for an equation, rendering it only on a cache miss"""
+        path = self.get_path(tex, color, settings)
+        name = f"latex_{path.stem[:16]}"
+
+        image = bpy.data.images.get(name)
+        if image is None:
+            image = bpy.data.images.load(str(path))
+            image.name = name
+        return image
+
+    def store(self, path: Path, tex: str, color, settings: LaTeXRenderSettings):
+        """Render into the cache; the rename keeps readers from seeing partial files"""
+        partial = path.with_suffix(f".{os.getpid()}.tmp")
+        error = render_job((tex, color, settings, str(partial)))
+        if error is not None:
+            self.failed[path.stem] = error
+            raise ValueError(f"LaTeX render failed: {error}")
+        os.replace(partial, path)
+        self.renders += 1
+        self.evict()
+
+    def prefetch(self, equations: Iterable[Tuple[str, tuple, LaTeXRenderSettings]],
+                 workers: Optional[int] = None) -> Dict[str, float]:
+        """Render all missing equations up front, in a process pool when workers > 1.
+
+        ``equations`` holds (tex, color, settings) triples; duplicates and
+        cached entries are skipped. An equation that fails to render is
+        logged and remembered, and does not stop the others. Returns counts
+        and stage timings.
+        """
+        start = time.perf_counter()
+        jobs: List[tuple] = []
+        targets: List[Path] = []
+        seen = set()
+        for tex, color, settings in equations:
+            key = self.key(tex, color, settings)
+            path = self.path_for(key)
+            if key in seen or key in self.failed or path.exists():
+                continue
+            seen.add(key)
+            jobs.append((tex, tuple(color), settings, str(path.with_suffix(f".{os.getpid()}.tmp"))))
+            targets.append(path)
+        lookup = time.perf_counter() - start
+
+        start = time.perf_counter()
+        workers = workers or os.cpu_count() or 1
+        errors: Optional[List[Optional[str]]] = None
+        if workers > 1 and len(jobs) > 1:
+            # Workers get plain values: settings travel as their fields
+            plain = [(tex, color, asdict(settings), path) for tex, color, settings, path in jobs]
+            try:
+                errors = map_in_workers("render_latex", plain, workers=workers, initializer="warm_latex",
+                                        chunksize=max(1, len(jobs) // (workers * 8)))
+            except (BrokenProcessPool, OSError) as e:
+                self.logger.warning(f"Process pool unavailable, rendering on main thread: {str(e)}")
+        if errors is None:
+            errors = [render_job(job) for job in jobs]
+        failed = 0
+        for job, path, error in zip(jobs, targets, errors):
+            if error is None:
+                os.replace(job[3], path)
+            else:
+                failed += 1
+                self.failed[path.stem] = error
+                self.logger.error(f"Error rendering LaTeX {job[0]!r}: {error}")
+        render = time.perf_counter() - start
+
+        self.renders += len(jobs) - failed
+        self.evict()
+        stats = {'rendered': len(jobs) - failed, 'failed': failed, 'workers': workers,
+                 'lookup': lookup, 'render': render}
+        self.logger.info(f"Prefetched {len(jobs)} LaTeX renders on {workers} workers in {render:.2f}s")
+        return stats
+
+    def evict(self):
+        """Delete least recently used images until the cache fits ``max_bytes``"""
+        entries = []
+        for path in self.cache_dir.glob("*.png"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+
+        loaded = {bpy.path.abspath(image.filepath) for image in bpy.data.images if image.filepath}
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if str(path) in loaded:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+        self.logger.debug(f"LaTeX cache evicted down to {total / 1e6:.1f} MB")
+
+    def clean_stale_files(self):
+        """Remove partial renders left behind by interrupted sessions"""
+        cutoff = time.time() - self.STALE_AGE
+        for path in self.cache_dir.glob("*.tmp"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except FileNotFoundError:
+                continue
+
+    @staticmethod
+    def _touch(path: Path):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+
+_default_cache: Optional[LaTeXRenderCache] = None
+
+
+def get_latex_cache() -> LaTeXRenderCache:
+    """Shared cache used by LaTeXText"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = LaTeXRenderCache()
+    return _default_cache
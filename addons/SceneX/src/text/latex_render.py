@@ -0,0 +1,68 @@
+# SceneX/src/text/latex_render.py
+"""
+Rendering of LaTeX equations to PNG with matplotlib mathtext.
+Free of bpy and SceneX imports so prefetch workers can load it on their own.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Optional, Tuple
+import matplotlib
+matplotlib.use('Agg')  # Use non-GUI backend for headless rendering
+import matplotlib.pyplot as plt
+
+
+@dataclass(frozen=True)
+class LaTeXRenderSettings:
+    """Matplotlib settings that affect a rendered equation image"""
+    dpi: int = 300
+    fontsize: float = 30
+    figsize: Tuple[float, float] = (5, 1)
+    pad_inches: float = 0.1
+
+
+def font_settings() -> dict:
+    """Current matplotlib font configuration, part of every cache key"""
+    return {
+        'mathtext.fontset': plt.rcParams['mathtext.fontset'],
+        'font.family': list(plt.rcParams['font.family']),
+        'matplotlib': matplotlib.__version__,
+    }
+
+
+def render_latex_png(tex: str, color, settings: LaTeXRenderSettings, path: str):
+    """Render ``$tex$`` with matplotlib mathtext into a transparent PNG"""
+    fig, ax = plt.subplots(figsize=settings.figsize, dpi=settings.dpi)
+    try:
+        ax.axis('off')
+        fig.patch.set_alpha(0.0)  # Transparent background
+        ax.text(0.5, 0.5, f"${tex}$",
+                horizontalalignment='center',
+                verticalalignment='center',
+                fontsize=settings.fontsize,
+                color=tuple(color[:3]),  # RGB for matplotlib
+                transform=ax.transAxes)
+        plt.tight_layout(pad=0)
+        fig.savefig(path, format='png', transparent=True, bbox_inches='tight',
+                    pad_inches=settings.pad_inches)
+    finally:
+        plt.close(fig)
+
+
+def warm_worker():
+    """Pool initializer: build the mathtext parser and font caches once per worker"""
+    render_latex_png("x", (1, 1, 1), LaTeXRenderSettings(dpi=10), os.devnull)
+
+
+def render_job(job) -> Optional[str]:
+    """Render one prefetch job; returns the error message if the equation fails"""
+    tex, color, settings, path = job
+    try:
+        render_latex_png(tex, color, settings, path)
+        return None
+    except Exception as e:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return str(e) or type(e).__name__
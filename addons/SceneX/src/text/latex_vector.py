@@ -0,0 +1,179 @@
+import bpy
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from matplotlib.font_manager import FontProperties
+from matplotlib.path import Path as MplPath
+from matplotlib.textpath import TextToPath
+from src.geometry.base import Geometry
+from src.geometry.triangulate import triangulate_outlines
+from src.utils.logger import SceneXLogger
+
+
+class GlyphCache:
+    """Glyph outlines as shared datablocks, one per font and glyph id.
+
+    Equations are laid out with matplotlib's mathtext parser, which reports
+    every glyph as (glyph id, x, y, scale) plus filled rectangles for rules
+    such as fraction bars. Each glyph id is converted to a mesh (triangulated
+    fill) or a filled 2D curve only once; every occurrence afterwards is an
+    object reusing that datablock.
+    """
+    def __init__(self, glyph_type: str = 'MESH'):
+        self.glyph_type = glyph_type  # MESH or CURVE
+        self.text_to_path = TextToPath()
+        self.font = FontProperties()
+        self.datablocks: Dict[str, Optional[bpy.types.ID]] = {}
+        self.bounds: Dict[str, Optional[np.ndarray]] = {}  # glyph id -> [[xmin, ymin], [xmax, ymax]]
+        self.materials: Dict[tuple, bpy.types.Material] = {}
+        self.logger = SceneXLogger("GlyphCache")
+
+    @property
+    def em(self) -> float:
+        """Layout units per em"""
+        return self.text_to_path.FONT_SCALE
+
+    def layout(self, tex: str):
+        """Glyph instances and rule rectangles of ``$tex$`` in layout units"""
+        # Only outlines of glyphs not seen before are extracted
+        glyphs, new_glyphs, rects = self.text_to_path.get_glyphs_mathtext(
+            self.font, f"${tex}$", glyph_map=self.datablocks, return_new_glyphs_only=True)
+        for glyph_id, (verts, codes) in new_glyphs.items():
+            self.datablocks[glyph_id] = self._build(glyph_id, np.asarray(verts), np.asarray(codes))
+        boxes = []
+        for verts, _ in rects:
+            verts = np.asarray(verts, dtype=np.float64)[:-1]  # Last vertex belongs to CLOSEPOLY
+            boxes.append((verts.min(axis=0), verts.max(axis=0)))
+        return glyphs, boxes
+
+    def glyph(self, glyph_id: str) -> Optional[bpy.types.ID]:
+        return self.datablocks.get(glyph_id)
+
+    def rule(self) -> bpy.types.Mesh:
+        """Unit square (0..1) scaled into fraction bars and radical overlines"""
+        mesh = bpy.data.meshes.get("latex_rule")
+        if mesh is None:
+            mesh = bpy.data.meshes.new("latex_rule")
+            mesh.from_pydata([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)], [], [(0, 1, 2, 3)])
+            mesh.materials.append(None)
+        return mesh
+
+    def material(self, color) -> bpy.types.Material:
+        key = tuple(round(float(c), 4) for c in color)
+        mat = self.materials.get(key)
+        if mat is None:
+            mat = bpy.data.materials.new(name="latex_glyph_material")
+            mat.use_nodes = True
+            principled = mat.node_tree.nodes["Principled BSDF"]
+            principled.inputs["Base Color"].default_value = key
+            self.materials[key] = mat
+        return mat
+
+    def _build(self, glyph_id: str, verts: np.ndarray, codes: np.ndarray) -> Optional[bpy.types.ID]:
+        name = f"glyph_{glyph_id}_{self.glyph_type.lower()}"
+        outlines = []
+        for polygon in MplPath(verts, codes).to_polygons(closed_only=True):
+            if len(polygon) > 1 and np.array_equal(polygon[0], polygon[-1]):
+                polygon = polygon[:-1]
+            if len(polygon) >= 3:
+                outlines.append(polygon)
+        if not outlines:
+            self.bounds[glyph_id] = None
+            return None  # Spaces and other blank glyphs
+
+        stacked = np.vstack(outlines)
+        self.bounds[glyph_id] = np.array([stacked.min(axis=0), stacked.max(axis=0)])
+
+        existing = bpy.data.meshes.get(name) if self.glyph_type == 'MESH' else bpy.data.curves.get(name)
+        if existing is not None:
+            return existing
+
+        if self.glyph_type == 'MESH':
+            vertices, triangles = triangulate_outlines(outlines)
+            data = bpy.data.meshes.new(name)
+            data.from_pydata(np.column_stack([vertices, np.zeros(len(vertices))]).tolist(), [],
+                             triangles.tolist())
+        else:
+            data = bpy.data.curves.new(name, 'CURVE')
+            data.dimensions = '2D'
+            data.fill_mode = 'BOTH'
+            for outline in outlines:
+                spline = data.splines.new('POLY')
+                spline.points.add(len(outline) - 1)
+                co = np.zeros((len(outline), 4), dtype=np.float32)
+                co[:, :2] = outline
+                co[:, 3] = 1.0
+                spline.points.foreach_set("co", co.ravel())
+                spline.use_cyclic_u = True
+        data.materials.append(None)  # Slot for the per-object color material
+        self.logger.debug(f"Cached glyph {glyph_id}")
+        return data
+
+
+_glyph_caches: Dict[str, GlyphCache] = {}
+
+
+def get_glyph_cache(glyph_type: str = 'MESH') -> GlyphCache:
+    """Shared glyph cache per datablock type"""
+    if glyph_type not in _glyph_caches:
+        _glyph_caches[glyph_type] = GlyphCache(glyph_type)
+    return _glyph_caches[glyph_type]
+
+
+class LaTeXVector(Geometry):
+    """Resolution independent LaTeX: an Empty parenting instanced glyphs.
+
+    ``size`` is the height of one em in Blender units. Memory grows with
+    the number of distinct glyphs, not with the number of equations.
+    """
+    def __init__(self, tex: str, size: float = 1.0, color=(1, 1, 1, 1),
+                 glyph_type: str = 'MESH', **kwargs):
+        super().__init__(**kwargs)
+        self.tex = tex
+        self.size = size
+        self.color = color
+        self.glyph_type = glyph_type
+        self.logger = SceneXLogger("LaTeXVector")
+
+    def create(self) -> bpy.types.Object:
+        try:
+            cache = get_glyph_cache(self.glyph_type)
+            glyphs, rules = cache.layout(self.tex)
+            unit = self.size / cache.em
+            material = cache.material(self.color)
+
+            placed: List[Tuple[bpy.types.ID, float, float, float, float]] = []  # data, x, y, sx, sy
+            corners = []
+            for glyph_id, x, y, scale in glyphs:
+                data = cache.glyph(glyph_id)
+                if data is None:
+                    continue
+                placed.append((data, x, y, scale, scale))
+                corners.append(cache.bounds[glyph_id] * scale + (x, y))
+            for low, high in rules:
+                placed.append((cache.rule(), low[0], low[1], high[0] - low[0], high[1] - low[1]))
+                corners.append(np.array([low, high]))
+            if not placed:
+                self.logger.warning(f"Nothing to draw for {self.tex!r}")
+                return None
+
+            # Center the equation on its parent
+            corners = np.vstack(corners)
+            cx, cy = (corners.min(axis=0) + corners.max(axis=0)) / 2
+
+            self.object = bpy.data.objects.new("latex_vector", None)
+            collection = bpy.context.scene.collection
+            collection.objects.link(self.object)
+            for data, x, y, sx, sy in placed:
+                obj = bpy.data.objects.new(data.name, data)
+                obj.location = ((x - cx) * unit, (y - cy) * unit, 0)
+                obj.scale = (sx * unit, sy * unit, 1)
+                slot = obj.material_slots[0]
+                slot.link = 'OBJECT'
+                slot.material = material
+                obj.parent = self.object
+                collection.objects.link(obj)
+            return self.object
+
+        except Exception as e:
+            self.logger.error(f"Error creating vector LaTeX: {str(e)}")
+            return None
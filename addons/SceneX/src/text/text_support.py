@@ -1,21 +1,65 @@
 import bpy
-import matplotlib
-matplotlib.use('Agg')  # Use non-GUI backend for headless rendering
-import matplotlib.pyplot as plt
+import os
 import numpy as np
-import tempfile
 from PIL import Image
 from pathlib import Path
 from src.geometry.base import Geometry
+from typing import List, Optional, Sequence, Tuple
+from src.text.atlas import AtlasRegion, ImageAtlas
+from src.text.font_metrics import get_font_cache
+from src.text.latex_cache import LaTeXRenderCache, LaTeXRenderSettings, get_latex_cache
 from src.utils.logger import SceneXLogger
 
 
+class Text(Geometry):
+    def __init__(self, text: str, size: float = 1.0,
+                 font_path: str = None, alignment: str = 'CENTER', **kwargs):
+        super().__init__(**kwargs)
+        self.text = text
+        self.size = size
+        self.font_path = font_path
+        self.alignment = alignment
+        self.logger = SceneXLogger("Text")
+
+    def measure(self) -> Tuple[float, float]:
+        """(width, height) from cached glyph metrics, without creating any datablock"""
+        return get_font_cache().measure(self.text, self.size, self._font_file())
+
+    def create(self) -> bpy.types.Object:
+        curve = bpy.data.curves.new("Text", 'FONT')
+        curve.body = self.text
+
+        # Fonts are loaded once per path and shared
+        font = get_font_cache().font(self._font_file())
+        if font is not None:
+            curve.font = font
+
+        # Set text properties
+        curve.size = self.size
+        curve.align_x = self.alignment
+
+        self.object = bpy.data.objects.new("Text", curve)
+        bpy.context.collection.objects.link(self.object)
+
+        # Set up material
+        self._setup_material()
+
+        return self.object
+
+    def _font_file(self) -> Optional[str]:
+        if self.font_path and os.path.exists(self.font_path):
+            return self.font_path
+        return None
+
+
 class LaTeXText(Geometry):
-    def __init__(self, tex: str, size: float = 1.0, color=(1, 1, 1, 1), **kwargs):
+    def __init__(self, tex: str, size: float = 1.0, color=(1, 1, 1, 1),
+                 settings: LaTeXRenderSettings = LaTeXRenderSettings(), **kwargs):
         super().__init__(**kwargs)
         self.tex = tex
         self.size = size
         self.color = color
+        self.settings = settings
         self.logger = SceneXLogger("LaTeX")
 
 
@@ -37,55 +81,119 @@ class LaTeXText(Geometry):
 
     def create(self) -> bpy.types.Object:
         try:
-            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-                # Create LaTeX-rendered image with matplotlib
-                fig, ax = plt.subplots(figsize=(5, 1), dpi=300)
-                ax.axis('off')
-                fig.patch.set_alpha(0.0)  # Transparent background
-
-                ax.text(0.5, 0.5, f"${self.tex}$",
-                        horizontalalignment='center',
-                        verticalalignment='center',
-                        fontsize=30,
-                        color=self.color[:3],  # RGB for matplotlib
-                        transform=ax.transAxes)
-
-   
-                
-                plt.tight_layout(pad=0)
-                plt.savefig(tmp.name, transparent=True, bbox_inches='tight', pad_inches=0.1)
-                plt.close(fig)
-
-                # Load image into Blender
-                img = bpy.data.images.load(tmp.name)
-
-                # Create plane for texture
-                bpy.ops.mesh.primitive_plane_add(size=self.size)
-                self.object = bpy.context.active_object
-
-                # Create and assign material
-                mat = bpy.data.materials.new(name="latex_material")
-                mat.use_nodes = True
-                mat.blend_method = 'BLEND'
+            # Rendered once per (tex, color, settings) and reused from the cache
+            img = get_latex_cache().get_image(self.tex, self.color, self.settings)
 
-                nodes = mat.node_tree.nodes
-                links = mat.node_tree.links
-                nodes.clear()
-
-                tex_image = nodes.new('ShaderNodeTexImage')
-                tex_image.image = img
-
-                principled = nodes.new('ShaderNodeBsdfPrincipled')
-                output = nodes.new('ShaderNodeOutputMaterial')
-
-                links.new(tex_image.outputs['Color'], principled.inputs['Base Color'])
-                links.new(tex_image.outputs['Alpha'], principled.inputs['Alpha'])
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                self.object.data.materials.append(mat)
-
-                return self.object
+            # Create plane for texture
+            bpy.ops.mesh.primitive_plane_add(size=self.size)
+            self.object = bpy.context.active_object
+            self.object.data.materials.append(self._material(img))
+            return self.object
 
         except Exception as e:
             self.logger.error(f"Error creating LaTeX: {str(e)}")
             return None
+
+    @classmethod
+    def create_many(cls, texs: Sequence[str], size: float = 1.0, color=(1, 1, 1, 1),
+                    settings: LaTeXRenderSettings = LaTeXRenderSettings(),
+                    workers: Optional[int] = None,
+                    cache: Optional[LaTeXRenderCache] = None,
+                    atlas: bool = False, page_size: int = 4096) -> List[bpy.types.Object]:
+        """Create planes for many equations at once.
+
+        Missing images are rendered concurrently by the cache's worker
+        pool first; the planes are then built in one pass as linked
+        duplicates of a shared plane mesh, each with its equation material
+        on an object slot. With ``atlas`` the images are packed into shared
+        atlas pages instead, one material per page, and each plane maps its
+        region through its UVs. Equations that fail to render are logged
+        and give None in the returned list, as ``create`` does.
+        """
+        cache = cache or get_latex_cache()
+        cache.prefetch(((tex, color, settings) for tex in texs), workers=workers)
+
+        collection = bpy.context.scene.collection
+        logger = SceneXLogger("LaTeX")
+        objects: List[Optional[bpy.types.Object]] = [None] * len(texs)
+        paths = {}
+        for i, tex in enumerate(texs):
+            try:
+                paths[i] = cache.get_path(tex, color, settings)
+            except Exception as e:
+                logger.error(f"Error creating LaTeX {tex!r}: {str(e)}")
+
+        if atlas:
+            packer = ImageAtlas(cache.cache_dir, page_size=page_size)
+            regions = packer.build(list(paths.values()))
+            for i, region in zip(paths, regions):
+                obj = bpy.data.objects.new("latex", cls._atlas_plane_mesh(size, region))
+                collection.objects.link(obj)
+                objects[i] = obj
+            return objects
+
+        mesh = cls._plane_mesh(size)
+        for i in paths:
+            img = cache.get_image(texs[i], color, settings)
+            obj = bpy.data.objects.new("latex", mesh)
+            slot = obj.material_slots[0]
+            slot.link = 'OBJECT'
+            slot.material = cls._material(img)
+            collection.objects.link(obj)
+            objects[i] = obj
+        return objects
+
+    @staticmethod
+    def _plane_mesh(size: float) -> bpy.types.Mesh:
+        """Square plane (as primitive_plane_add) with UVs, shared by batch-created equations"""
+        name = f"latex_plane_{size:g}"
+        mesh = bpy.data.meshes.get(name)
+        if mesh is None:
+            h = size / 2
+            mesh = bpy.data.meshes.new(name)
+            mesh.from_pydata([(-h, -h, 0), (h, -h, 0), (h, h, 0), (-h, h, 0)], [], [(0, 1, 2, 3)])
+            uv_layer = mesh.uv_layers.new(name="UVMap")
+            uv_layer.data.foreach_set("uv", [0, 0, 1, 0, 1, 1, 0, 1])
+            mesh.materials.append(None)  # Slot for the per-object equation material
+        return mesh
+
+    @classmethod
+    def _atlas_plane_mesh(cls, size: float, region: AtlasRegion) -> bpy.types.Mesh:
+        """Plane whose UVs cover one atlas region, with the page material"""
+        name = f"latex_plane_{size:g}_{region.image.name}_{region.x}_{region.y}"
+        mesh = bpy.data.meshes.get(name)
+        if mesh is None:
+            h = size / 2
+            u0, v0, u1, v1 = region.uv_rect
+            mesh = bpy.data.meshes.new(name)
+            mesh.from_pydata([(-h, -h, 0), (h, -h, 0), (h, h, 0), (-h, h, 0)], [], [(0, 1, 2, 3)])
+            uv_layer = mesh.uv_layers.new(name="UVMap")
+            uv_layer.data.foreach_set("uv", [u0, v0, u1, v0, u1, v1, u0, v1])
+            mesh.materials.append(cls._material(region.image))
+        return mesh
+
+    @staticmethod
+    def _material(img: bpy.types.Image) -> bpy.types.Material:
+        """Material showing the equation (or atlas page) image, shared by its users"""
+        mat = bpy.data.materials.get(f"{img.name}_material")
+        if mat is not None:
+            return mat
+
+        mat = bpy.data.materials.new(name=f"{img.name}_material")
+        mat.use_nodes = True
+        mat.blend_method = 'BLEND'
+
+        nodes = mat.node_tree.nodes
+        links = mat.node_tree.links
+        nodes.clear()
+
+        tex_image = nodes.new('ShaderNodeTexImage')
+        tex_image.image = img
+
+        principled = nodes.new('ShaderNodeBsdfPrincipled')
+        output = nodes.new('ShaderNodeOutputMaterial')
+
+        links.new(tex_image.outputs['Color'], principled.inputs['Base Color'])
+        links.new(tex_image.outputs['Alpha'], principled.inputs['Alpha'])
+        links.new(principled.outputs['BSDF'], output.inputs['Surface'])
+        return mat
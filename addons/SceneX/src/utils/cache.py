@@ -0,0 +1,20 @@
+# SceneX/src/utils/cache.py
+import os
+import tempfile
+import bpy
+
+def user_cache_dir(name: str) -> str:
+    """Writable per-user directory for cache ``name``, outside the addon tree.
+
+    The installed addon may be read-only, so caches live under Blender's
+    user data files (``scenex_cache/<name>``), or the system temp directory
+    when that cannot be created.
+    """
+    try:
+        path = bpy.utils.user_resource('DATAFILES', path=os.path.join("scenex_cache", name), create=True)
+    except (OSError, TypeError, ValueError):
+        path = ""
+    if not path:
+        path = os.path.join(tempfile.gettempdir(), "scenex_cache", name)
+        os.makedirs(path, exist_ok=True)
+    return path
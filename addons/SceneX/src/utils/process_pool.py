@@ -0,0 +1,46 @@
+# SceneX/src/utils/process_pool.py
+"""
+Process pools for bpy-free work such as SVG parsing and LaTeX rendering.
+Forking Blender copies a multithreaded process holding GPU, Python and
+depsgraph state, so workers are spawned fresh. They run functions of
+``src/workers/scenex_workers.py``, which is imported as a top-level module:
+spawned processes look functions up by module name, and anything under
+``src`` would import the addon package and bpy there.
+"""
+
+import importlib
+import multiprocessing
+import os
+import sys
+import types
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, List, Optional
+
+WORKER_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'workers')
+
+def worker_module() -> types.ModuleType:
+    """``scenex_workers``, importable by name in this and spawned processes"""
+    if WORKER_DIR not in sys.path:
+        sys.path.append(WORKER_DIR)  # Spawned workers inherit sys.path
+    return importlib.import_module("scenex_workers")
+
+def map_in_workers(function: str, *iterables: Iterable, workers: int,
+                   initializer: Optional[str] = None, chunksize: int = 1) -> List:
+    """``scenex_workers.<function>`` mapped over ``iterables`` in spawned processes.
+
+    Arguments and results must be plain picklable values. Pool failures
+    (``BrokenProcessPool``, ``OSError``) propagate so callers can fall
+    back to running on the main thread.
+    """
+    module = worker_module()
+    warm: Optional[Callable] = getattr(module, initializer) if initializer else None
+    # Spawned workers import the parent's __main__; in Blender that is the running scene script
+    main = sys.modules.get('__main__')
+    sys.modules['__main__'] = types.ModuleType('__main__')
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=warm) as executor:
+            return list(executor.map(getattr(module, function), *iterables, chunksize=chunksize))
+    finally:
+        if main is not None:
+            sys.modules['__main__'] = main
@@ -0,0 +1,44 @@
+# SceneX/src/workers/scenex_workers.py
+"""
+Entry points of SceneX worker processes (see ``src.utils.process_pool``).
+Imported as a top-level module, without the ``src`` package and bpy; the
+bpy-free modules doing the work are loaded from their files. Arguments
+and results are plain values so nothing refers back to ``src``.
+"""
+
+import importlib.util
+import os
+import sys
+from dataclasses import fields
+from typing import Optional
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _load(name: str, *parts: str):
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, os.path.join(SRC_DIR, *parts))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module  # Dataclasses resolve their module by name
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        del sys.modules[name]
+        raise
+    return module
+
+def parse_svg_file(path: str, transform) -> dict:
+    """Fields of ``svg_path.parse_svg_file(path, transform)``, for ``SVGCurveBuffers(**fields)``"""
+    svg_path = _load("scenex_svg_path", "geometry", "svg_path.py")
+    buffers = svg_path.parse_svg_file(path, transform)
+    return {f.name: getattr(buffers, f.name) for f in fields(buffers)}
+
+def render_latex(job) -> Optional[str]:
+    """``latex_render.render_job`` for a (tex, color, settings fields, path) job"""
+    latex_render = _load("scenex_latex_render", "text", "latex_render.py")
+    tex, color, settings, path = job
+    return latex_render.render_job((tex, color, latex_render.LaTeXRenderSettings(**settings), path))
+
+def warm_latex():
+    """Pool initializer for ``render_latex``"""
+    _load("scenex_latex_render", "text", "latex_render.py").warm_worker()
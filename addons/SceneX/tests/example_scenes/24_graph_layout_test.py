@@ -0,0 +1,56 @@
+# SceneX/tests/example_scenes/24_graph_layout_test.py
+
+import bpy
+import os
+import sys
+import random
+import time
+from mathutils import Vector
+
+# Add parent directory to path to find SceneX package
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(os.path.dirname(script_dir))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from src.templates.technical import TechnicalDiagramScene
+from src.scene.graph_layout import LayeredLayout, LayeredLayoutConfig
+
+class AutoLayoutDiagram(TechnicalDiagramScene):
+    def construct(self):
+        # Components are added without positions and placed by auto_layout
+        gateway = self.add_component("square", label="Gateway")
+        auth = self.add_component("circle", label="Auth")
+        api = self.add_component("square", label="API")
+        cache = self.add_component("circle", label="Cache")
+        db = self.add_component("square", label="Database")
+
+        self.connect_components(gateway, auth)
+        self.connect_components(gateway, api)
+        self.connect_components(auth, api)
+        self.connect_components(api, cache)
+        self.connect_components(api, db)
+        self.connect_components(cache, db)
+
+        self.auto_layout(LayeredLayoutConfig(layer_spacing=2.0, node_spacing=2.0))
+
+def benchmark_layout(node_count=2000, edge_factor=1.5):
+    """Layout a random architecture-sized graph without touching Blender data"""
+    random.seed(0)
+    nodes = list(range(node_count))
+    edges = [(random.randrange(node_count), random.randrange(node_count))
+             for _ in range(int(node_count * edge_factor))]
+
+    start = time.perf_counter()
+    positions = LayeredLayout().compute(nodes, edges)
+    elapsed = time.perf_counter() - start
+    print(f"Layered layout of {len(positions)} nodes / {len(edges)} edges: {elapsed:.2f}s")
+
+if __name__ == "__main__":
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+
+    scene = AutoLayoutDiagram()
+    scene.construct()
+
+    benchmark_layout()
@@ -0,0 +1,83 @@
+# SceneX/tests/example_scenes/25_svg_streaming_test.py
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Add parent directory to path to find SceneX package
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(os.path.dirname(script_dir))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from src.geometry.svg_path import iter_svg_paths, parse_path, tokenize_path
+
+PATH_SAMPLES = [
+    "M10-5L20,30l.5.5h10v-10z",
+    "m0 0c1.5 0 3 1 3 3s-1.5 3-3 3-3-1-3-3 1.5-3 3-3z",
+    "M0 0Q5 10 10 0T20 0t10 0",
+    "M0,0a25,25 -30 0,1 50,-25 a1 1 0 0010 10",
+]
+
+def check_grammar():
+    """Compact and relative forms must tokenize and parse"""
+    assert list(tokenize_path("M10-5L20,30"))[1] == ('L', [20.0, 30.0])
+    assert list(tokenize_path("a1 1 0 0010 10"))[0][1] == [1, 1, 0, 0, 0, 10, 10]
+    for path_data in PATH_SAMPLES:
+        subpaths = parse_path(path_data)
+        assert subpaths and all(subpath.segments for subpath in subpaths), path_data
+    # Malformed data keeps the segments before the error
+    assert len(parse_path("M 0 0 L 5 5 L")[0].segments) == 1
+    assert len(parse_path("M0 0 L4 4 a1 1 0 2 0 10 10")[0].segments) == 1
+    print("Path grammar checks passed")
+
+def write_large_svg(path, target_mb=50):
+    """Write a synthetic map-like SVG of roughly target_mb megabytes"""
+    chunk = "".join(
+        f'<g transform="translate({i % 100} {i // 100})"><path d="{PATH_SAMPLES[i % len(PATH_SAMPLES)]}"/></g>\n'
+        for i in range(1000)
+    )
+    repeats = max(1, int(target_mb * 1024 * 1024 / len(chunk)))
+    with open(path, "w") as f:
+        f.write('<svg xmlns="http://www.w3.org/2000/svg">\n')
+        for _ in range(repeats):
+            f.write(chunk)
+        f.write('</svg>\n')
+
+def stream(path):
+    """Parse every shape of the file; returns (shapes, segments)"""
+    shapes = segments = 0
+    for path_data, transform, _ in iter_svg_paths(path):
+        for subpath in parse_path(path_data, transform):
+            segments += len(subpath.segments)
+        shapes += 1
+    return shapes, segments
+
+def benchmark_streaming(target_mb=50):
+    """Parse a large SVG and report throughput and peak Python memory.
+
+    tracemalloc slows Python down by an order of magnitude, so throughput
+    and peak memory are measured in separate runs.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "large.svg")
+        write_large_svg(path, target_mb)
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+
+        start = time.perf_counter()
+        shapes, segments = stream(path)
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        stream(path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    print(f"Streamed {size_mb:.1f} MB: {shapes} shapes, {segments} segments "
+          f"in {elapsed:.1f}s ({size_mb / elapsed:.1f} MB/s), peak memory {peak / 1024 / 1024:.1f} MB")
+
+if __name__ == "__main__":
+    check_grammar()
+    benchmark_streaming()
@@ -0,0 +1,68 @@
+# SceneX/tests/example_scenes/26_svg_curve_builder_test.py
+
+import bpy
+import math
+import os
+import sys
+import tempfile
+import time
+
+# Add parent directory to path to find SceneX package
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(os.path.dirname(script_dir))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from src.geometry.svg_handler import SVGHandler
+from src.geometry.svg_path import bezier_arrays, iter_svg_paths, parse_path
+
+def write_map_svg(path, regions=200, points_per_region=2000):
+    """Detailed coastline-like outlines: many long closed paths"""
+    with open(path, "w") as f:
+        f.write('<svg xmlns="http://www.w3.org/2000/svg">\n')
+        for region in range(regions):
+            cx, cy = (region % 20) * 100, (region // 20) * 100
+            coords = []
+            for i in range(points_per_region):
+                angle = 2 * math.pi * i / points_per_region
+                radius = 40 + 5 * math.sin(angle * 37 + region)
+                coords.append(f"{cx + radius * math.cos(angle):.2f},{cy + radius * math.sin(angle):.2f}")
+            f.write(f'<path id="region_{region}" d="M{" L".join(coords)}Z"/>\n')
+        f.write('</svg>\n')
+
+def build_per_point(filepath):
+    """Reference builder: one bezier_points.add(1) and attribute write per anchor"""
+    for path_data, transform, _ in iter_svg_paths(filepath):
+        curve_data = bpy.data.curves.new("per_point", 'CURVE')
+        for subpath in parse_path(path_data):
+            co, left, right = bezier_arrays(subpath, transform)
+            spline = curve_data.splines.new('BEZIER')
+            for i in range(len(co)):
+                if i:
+                    spline.bezier_points.add(1)
+                point = spline.bezier_points[-1]
+                point.co = co[i]
+                point.handle_left = left[i]
+                point.handle_right = right[i]
+        bpy.data.curves.remove(curve_data)
+
+def benchmark_builder():
+    with tempfile.TemporaryDirectory() as tmp:
+        filepath = os.path.join(tmp, "map.svg")
+        write_map_svg(filepath)
+
+        start = time.perf_counter()
+        build_per_point(filepath)
+        per_point = time.perf_counter() - start
+
+        start = time.perf_counter()
+        collection = SVGHandler().import_svg(filepath)
+        vectorized = time.perf_counter() - start
+
+    print(f"Per-point builder: {per_point:.2f}s, foreach_set builder: {vectorized:.2f}s "
+          f"({per_point / vectorized:.1f}x) for {len(collection.objects)} curves")
+
+if __name__ == "__main__":
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+    benchmark_builder()
@@ -0,0 +1,35 @@
+# SceneX/tests/example_scenes/27_svg_cache_test.py
+
+import bpy
+import os
+import sys
+import time
+
+# Add parent directory to path to find SceneX package
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(os.path.dirname(script_dir))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from src.svg.svg_handler import SVGHandler
+
+def benchmark_cache(scene_count=200):
+    """Import the same logo into many scenes, with and without the asset cache"""
+    handler = SVGHandler()
+    timings = {}
+    for use_cache in (False, True):
+        start = time.perf_counter()
+        for i in range(scene_count):
+            scene = bpy.data.scenes.new(f"svg_cache_{use_cache}_{i}")
+            bpy.context.window.scene = scene
+            handler.import_svg("SceneX_logo.svg", scale=5.0, use_cache=use_cache)
+        timings[use_cache] = time.perf_counter() - start
+
+    print(f"SVG import into {scene_count} scenes: uncached {timings[False]:.2f}s, "
+          f"cached {timings[True]:.2f}s ({timings[False] / timings[True]:.1f}x), "
+          f"{len(bpy.data.curves)} curve datablocks")
+
+if __name__ == "__main__":
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+    benchmark_cache()
@@ -0,0 +1,51 @@
+# SceneX/tests/example_scenes/28_svg_batch_import_test.py
+
+import bpy
+import os
+import sys
+import tempfile
+import time
+
+# Add parent directory to path to find SceneX package
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(os.path.dirname(script_dir))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from src.geometry.svg_handler import SVGHandler
+
+def write_icon_pack(directory, icons=400, shapes_per_icon=40):
+    """Icon-pack sized files: many small documents with mixed path commands"""
+    paths = []
+    for icon in range(icons):
+        path = os.path.join(directory, f"icon_{icon:03d}.svg")
+        with open(path, "w") as f:
+            f.write('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24">\n')
+            f.write(f'<g transform="translate({icon % 20 * 30},{icon // 20 * 30})">\n')
+            for shape in range(shapes_per_icon):
+                f.write(f'<path id="s{shape}" d="M{shape % 8} 2c1 2 3 4 5 6s1 1 2 2'
+                        f'q1 1 2 0a3 3 0 0 1 6 0l3 4h2v-3z"/>\n')
+            f.write('<circle cx="12" cy="12" r="4"/>\n</g>\n</svg>\n')
+        paths.append(path)
+    return paths
+
+def benchmark_batch_import():
+    handler = SVGHandler()
+    cores = os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as tmp:
+        files = write_icon_pack(tmp)
+        walls = {}
+        for workers in sorted({1, min(4, cores), cores}):
+            start = time.perf_counter()
+            handler.import_svg_files(files, workers=workers)
+            walls[workers] = time.perf_counter() - start
+            timings = handler.last_timings
+            print(f"{workers} workers: parse {timings['parse']:.2f}s, pack {timings['pack']:.2f}s, "
+                  f"parallel stage {timings['parallel_wall']:.2f}s, build {timings['build']:.2f}s, "
+                  f"total {walls[workers]:.2f}s ({walls[1] / walls[workers]:.1f}x vs 1 worker, "
+                  f"{cores} cores)")
+
+if __name__ == "__main__":
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+    benchmark_batch_import()
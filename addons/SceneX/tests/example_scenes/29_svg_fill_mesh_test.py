@@ -0,0 +1,49 @@
+# SceneX/tests/example_scenes/29_svg_fill_mesh_test.py
+
+import bpy
+import os
+import sys
+import time
+
+# Add parent directory to path to find SceneX package
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(os.path.dirname(script_dir))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from src.svg.svg_handler import SVGHandler
+
+def build_logo_wall(mesh_fill, count=100):
+    """Grid of animated logos; no asset cache so every logo has its own curves"""
+    handler = SVGHandler()
+    for i in range(count):
+        container = handler.import_svg("SceneX_logo.svg", scale=2.0,
+                                       location=(i % 10 * 3, i // 10 * 3, 0),
+                                       use_cache=False, mesh_fill=mesh_fill)
+        container.rotation_euler.z = 0
+        container.keyframe_insert(data_path="rotation_euler", frame=1)
+        container.rotation_euler.z = 3.1416
+        container.keyframe_insert(data_path="rotation_euler", frame=60)
+
+def time_frames(frames=60):
+    scene = bpy.context.scene
+    start = time.perf_counter()
+    for frame in range(1, frames + 1):
+        scene.frame_set(frame)
+    return (time.perf_counter() - start) / frames
+
+def benchmark_fill():
+    timings = {}
+    for mesh_fill in (False, True):
+        bpy.ops.object.select_all(action='SELECT')
+        bpy.ops.object.delete()
+        start = time.perf_counter()
+        build_logo_wall(mesh_fill)
+        setup = time.perf_counter() - start
+        timings[mesh_fill] = time_frames()
+        print(f"{'mesh' if mesh_fill else 'curve'} fill: setup {setup:.2f}s, "
+              f"{timings[mesh_fill] * 1000:.1f} ms per frame, {len(bpy.data.meshes)} meshes")
+    print(f"Per-frame speedup with mesh fill: {timings[False] / timings[True]:.1f}x")
+
+if __name__ == "__main__":
+    benchmark_fill()
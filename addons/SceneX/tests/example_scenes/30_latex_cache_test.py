@@ -0,0 +1,38 @@
+# SceneX/tests/example_scenes/30_latex_cache_test.py
+
+import bpy
+import os
+import sys
+import time
+
+# Add parent directory to path to find SceneX package
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(os.path.dirname(script_dir))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from src.text.latex_cache import get_latex_cache
+from src.text.text_support import LaTeXText
+
+FORMULAS = [r"E = mc^2", r"\int_0^1 x^2\,dx = \frac{1}{3}", r"\nabla \cdot \vec{E} = \frac{\rho}{\epsilon_0}",
+            r"e^{i\pi} + 1 = 0", r"\sum_{n=1}^{\infty} \frac{1}{n^2} = \frac{\pi^2}{6}"]
+
+def build_lecture(equation_count=300):
+    """A lecture scene: a handful of formulas repeated across many slides"""
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+    for i in range(equation_count):
+        obj = LaTeXText(FORMULAS[i % len(FORMULAS)], size=1.0).create()
+        obj.location = (i % 20 * 2.5, i // 20 * 1.5, 0)
+
+def benchmark_rebuild():
+    cache = get_latex_cache()
+    for attempt in ("first build", "rebuild"):
+        renders = cache.renders
+        start = time.perf_counter()
+        build_lecture()
+        print(f"{attempt}: {time.perf_counter() - start:.2f}s, "
+              f"{cache.renders - renders} renders, {len(bpy.data.images)} images")
+
+if __name__ == "__main__":
+    benchmark_rebuild()
@@ -0,0 +1,40 @@
+# SceneX/tests/example_scenes/31_latex_batch_test.py
+
+import bpy
+import os
+import sys
+import tempfile
+import time
+
+# Add parent directory to path to find SceneX package
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(os.path.dirname(script_dir))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from src.text.latex_cache import LaTeXRenderCache
+from src.text.text_support import LaTeXText
+
+def unique_equations(count=500):
+    return [rf"\sum_{{k=1}}^{{{n}}} k^2 = \frac{{{n}({n}+1)(2{n}+1)}}{{6}}" for n in range(1, count + 1)]
+
+def benchmark_batch(count=500, worker_counts=(1, 4, 8)):
+    texs = unique_equations(count)
+    for workers in worker_counts:
+        bpy.ops.object.select_all(action='SELECT')
+        bpy.ops.object.delete()
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = LaTeXRenderCache(cache_dir=tmp)
+            start = time.perf_counter()
+            stats = cache.prefetch(((tex, (1, 1, 1, 1), LaTeXText(tex).settings) for tex in texs),
+                                   workers=workers)
+            render = time.perf_counter() - start
+
+            start = time.perf_counter()
+            LaTeXText.create_many(texs, size=0.8, workers=workers, cache=cache)
+            build = time.perf_counter() - start
+        print(f"{workers} workers: rendered {stats['rendered']} equations in {render:.2f}s, "
+              f"planes/materials in {build:.2f}s")
+
+if __name__ == "__main__":
+    benchmark_batch()
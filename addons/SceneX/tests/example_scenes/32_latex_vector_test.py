@@ -0,0 +1,37 @@
+# SceneX/tests/example_scenes/32_latex_vector_test.py
+
+import bpy
+import os
+import sys
+import time
+
+# Add parent directory to path to find SceneX package
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(os.path.dirname(script_dir))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from src.text.latex_vector import LaTeXVector, get_glyph_cache
+
+def build_equations(count=1000, glyph_type='MESH'):
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+
+    start = time.perf_counter()
+    for n in range(count):
+        eq = LaTeXVector(rf"\int_0^{{{n}}} x^2\,dx = \frac{{{n}^3}}{{3}}", size=0.4,
+                         glyph_type=glyph_type)
+        obj = eq.create()
+        if obj:
+            obj.location = ((n % 25) * 3.0, -(n // 25) * 0.8, 0)
+    elapsed = time.perf_counter() - start
+
+    cache = get_glyph_cache(glyph_type)
+    glyphs = sum(1 for data in cache.datablocks.values() if data is not None)
+    print(f"{glyph_type}: {count} equations in {elapsed:.2f}s, "
+          f"{len(bpy.data.objects)} objects sharing {glyphs} glyph datablocks "
+          f"({len(bpy.data.meshes)} meshes, {len(bpy.data.curves)} curves)")
+
+if __name__ == "__main__":
+    build_equations(glyph_type='MESH')
+    build_equations(glyph_type='CURVE')
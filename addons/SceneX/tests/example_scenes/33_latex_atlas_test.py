@@ -0,0 +1,37 @@
+# SceneX/tests/example_scenes/33_latex_atlas_test.py
+
+import bpy
+import os
+import sys
+import time
+
+# Add parent directory to path to find SceneX package
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(os.path.dirname(script_dir))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from src.text.text_support import LaTeXText
+
+def texture_bytes():
+    return sum(image.size[0] * image.size[1] * 4 for image in bpy.data.images)
+
+def build(texs, atlas):
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+    for datablocks in (bpy.data.meshes, bpy.data.materials, bpy.data.images):
+        for block in list(datablocks):
+            datablocks.remove(block)
+
+    start = time.perf_counter()
+    objects = LaTeXText.create_many(texs, size=0.8, atlas=atlas)
+    elapsed = time.perf_counter() - start
+    for i, obj in enumerate(objects):
+        obj.location = (i % 20 * 1.0, -(i // 20) * 1.0, 0)
+    print(f"atlas={atlas}: {len(objects)} planes in {elapsed:.2f}s, {len(bpy.data.images)} images, "
+          f"{texture_bytes() / 1e6:.1f} MB texture, {len(bpy.data.materials)} materials")
+
+if __name__ == "__main__":
+    equations = [rf"x_{{{n}}} = \sqrt{{{n}}}" for n in range(400)]
+    build(equations, atlas=False)
+    build(equations, atlas=True)
@@ -0,0 +1,46 @@
+# SceneX/tests/example_scenes/35_vmobject_test.py
+
+import bpy
+import math
+import os
+import sys
+import time
+import numpy as np
+
+# Add parent directory to path to find SceneX package
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(os.path.dirname(script_dir))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from src.core.mobject import Mobject, VMobject
+
+def build_spiral(count=100000):
+    t = np.linspace(0, 200 * math.pi, count)
+    anchors = np.column_stack([t * np.cos(t), t * np.sin(t), np.zeros(count)]) / 100
+    return VMobject(stroke_width=0.005).set_points_smoothly(anchors)
+
+def benchmark_transforms():
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+
+    spiral = build_spiral()
+    square = VMobject().set_points_as_corners([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)], closed=True)
+    group = Mobject().add(spiral, square)
+    spiral.create()
+    square.create()
+
+    start = time.perf_counter()
+    group.shift((1, 0, 0)).scale(0.5).rotate(math.pi / 6)
+    group.apply_function(lambda points: points + np.column_stack([np.zeros((len(points), 2)),
+                                                                   0.1 * np.sin(points[:, 0])]))
+    transform = time.perf_counter() - start
+
+    start = time.perf_counter()
+    written = group.sync()
+    sync = time.perf_counter() - start
+    print(f"{len(spiral.anchors)} anchors: transforms {transform * 1000:.1f}ms, "
+          f"sync of {written} mobjects {sync * 1000:.1f}ms, second sync writes {group.sync()}")
+
+if __name__ == "__main__":
+    benchmark_transforms()
@@ -0,0 +1,64 @@
+# SceneX/tests/example_scenes/36_updaters_test.py
+
+import bpy
+import math
+import os
+import sys
+import time
+
+# Add parent directory to path to find SceneX package
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(os.path.dirname(script_dir))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from src.animation.updaters import UpdaterGraph, ValueTracker
+
+def build_orbiters(count=5000):
+    """A leader follows a tracked angle; every follower trails its predecessor"""
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+
+    graph = UpdaterGraph()
+    angle = ValueTracker(0.0).animate_to(4 * math.pi, start_frame=1, end_frame=250)
+    mesh = bpy.data.meshes.new("orbiter")
+    mesh.from_pydata([(0, 0, 0)], [], [])
+
+    def lead(obj, frame):
+        theta = angle.get_value()
+        obj.location = (4 * math.cos(theta), 4 * math.sin(theta), 0)
+
+    def follow(leader):
+        def update(obj, frame):
+            obj.location = leader.location * 0.999
+        return update
+
+    previous = None
+    for i in range(count):
+        obj = bpy.data.objects.new(f"orbiter_{i}", mesh)
+        bpy.context.scene.collection.objects.link(obj)
+        if previous is None:
+            graph.add_updater(obj, lead, depends_on=[angle])
+        else:
+            graph.add_updater(obj, follow(previous), depends_on=[previous])
+        previous = obj
+    return graph
+
+def benchmark_dispatch():
+    graph = build_orbiters()
+    graph.install()
+    timings = []
+    for frame in range(1, 61):
+        start = time.perf_counter()
+        bpy.context.scene.frame_set(frame)
+        timings.append((time.perf_counter() - start, graph.last_dispatch))
+    frame_set = sum(t for t, _ in timings) / len(timings)
+    dispatch = sum(d for _, d in timings) / len(timings)
+    print(f"{len(graph.updaters)} updaters: {dispatch * 1000:.2f}ms in updaters per frame, "
+          f"{frame_set * 1000:.2f}ms per frame_set")
+
+    keys = graph.bake(1, 60, data_paths=("location",))
+    print(f"Baked {keys} keyframes; handler removed")
+
+if __name__ == "__main__":
+    benchmark_dispatch()
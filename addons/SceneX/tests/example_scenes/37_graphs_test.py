@@ -0,0 +1,39 @@
+# SceneX/tests/example_scenes/37_graphs_test.py
+
+import bpy
+import os
+import sys
+import time
+import numpy as np
+from mathutils import Vector
+
+# Add parent directory to path to find SceneX package
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(os.path.dirname(script_dir))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from src.templates.mathematical import MathematicalScene
+
+def build_graphs():
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+    scene = MathematicalScene()
+
+    # Discontinuities: asymptotes of tan and the steps of floor
+    scene.add_graph(np.tan, x_range=(-5, 5), y_range=(-4, 4), color=(1, 0.4, 0.2, 1))
+    scene.add_graph(np.floor, x_range=(-5, 5), color=(0.3, 0.8, 1, 1))
+    scene.add_parametric_curve(lambda t: (2 * np.cos(3 * t), 2 * np.sin(2 * t)), t_range=(0, 2 * np.pi),
+                               color=(0.9, 0.9, 0.2, 1))
+    scene.add_implicit_curve(lambda x, y: y ** 2 - x ** 3 + x, x_range=(-3, 3), y_range=(-3, 3),
+                             color=(0.6, 1, 0.4, 1))
+
+    start = time.perf_counter()
+    graph = scene.add_graph(lambda x: np.sin(x) * np.exp(-x * x / 50), x_range=(-20, 20),
+                            samples=1_000_000, position=Vector((0, -3, 0)))
+    elapsed = time.perf_counter() - start
+    points = sum(len(spline.points) for spline in graph.data.splines)
+    print(f"Plotted {points} samples in {elapsed:.2f}s; {len(scene.graphs)} graphs in the scene")
+
+if __name__ == "__main__":
+    build_graphs()
@@ -0,0 +1,45 @@
+# SceneX/tests/example_scenes/38_surface_test.py
+
+import bpy
+import os
+import sys
+import time
+import numpy as np
+from mathutils import Vector
+
+# Add parent directory to path to find SceneX package
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(os.path.dirname(script_dir))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from src.templates.mathematical import MathematicalScene
+
+def ripple(x, y, t):
+    r = np.hypot(x, y)
+    return 0.5 * np.sin(3 * r - 4 * t) / (1 + r)
+
+def torus(u, v):
+    return ((2 + 0.6 * np.cos(v)) * np.cos(u), (2 + 0.6 * np.cos(v)) * np.sin(u), 0.6 * np.sin(v))
+
+def build_surfaces():
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+    scene = MathematicalScene()
+
+    start = time.perf_counter()
+    field = scene.add_heightfield(ripple, resolution=(1000, 1000), color=(0.2, 0.6, 1, 1))
+    elapsed = time.perf_counter() - start
+    print(f"1000x1000 heightfield: {len(field.object.data.vertices)} vertices, "
+          f"{len(field.object.data.polygons)} faces in {elapsed:.2f}s")
+
+    start = time.perf_counter()
+    field.update(0.5)
+    print(f"In-place update: {(time.perf_counter() - start) * 1000:.0f}ms")
+
+    field.animate(1, 120, t_range=(0, 2 * np.pi), shape_keys=12)
+    scene.add_surface(torus, u_range=(0, 2 * np.pi), v_range=(0, 2 * np.pi), resolution=(64, 128),
+                      position=Vector((8, 0, 0)), color=(1, 0.5, 0.2, 1))
+
+if __name__ == "__main__":
+    build_surfaces()
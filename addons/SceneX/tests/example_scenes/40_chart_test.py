@@ -0,0 +1,49 @@
+# SceneX/tests/example_scenes/40_chart_test.py
+
+import bpy
+import csv
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+
+# Add parent directory to path to find SceneX package
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(os.path.dirname(script_dir))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from src.graphics.charts import Chart
+
+def build_charts(rows=50000):
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+
+    # Line chart from NumPy arrays
+    x = np.linspace(0, 100, rows)
+    y = np.cumsum(np.random.default_rng(0).normal(size=rows))
+    start = time.perf_counter()
+    line = Chart((x, y), kind='line', origin=(-10, 0, 0))
+    line.create(show_axes=False)
+    line.animate_growth(1, 60)
+    print(f"{rows}-row line chart in {time.perf_counter() - start:.2f}s")
+
+    # Bar chart from a CSV file, grown with one shape key
+    path = os.path.join(tempfile.gettempdir(), "scenex_chart.csv")
+    with open(path, "w", newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["month", "sales"])
+        for month, sales in zip(["Jan", "Feb", "Mar", "Apr", "May", "Jun"], [12, 19, 7, 25, 16, 21]):
+            writer.writerow([month, sales])
+    bars = Chart(path, x="month", y="sales", kind='bar')
+    bars.create()
+    bars.animate_growth(1, 40)
+
+    scatter = Chart((np.arange(200), np.random.default_rng(1).random(200) * 50), kind='scatter',
+                    origin=(0, -6, 0))
+    scatter.create(show_axes=False)
+    scatter.animate_growth(1, 40)
+
+if __name__ == "__main__":
+    build_charts()
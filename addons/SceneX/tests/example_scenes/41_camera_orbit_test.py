@@ -0,0 +1,47 @@
+# SceneX/tests/example_scenes/41_camera_orbit_test.py
+
+import bpy
+import math
+import os
+import sys
+import time
+
+# Add parent directory to path to find SceneX package
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(os.path.dirname(script_dir))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from src.camera.camera import CameraSystem
+from src.camera.movements import CameraMovement
+
+def build_orbit(minutes=10, fps=30):
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+    bpy.ops.mesh.primitive_monkey_add()
+
+    scene = bpy.context.scene
+    scene.render.fps = fps
+    scene.frame_start = scene.frame_current = 1
+    duration = minutes * 60 * fps
+
+    camera = CameraSystem()
+    moves = CameraMovement(camera)
+    moves.dolly(2, duration=60)
+    moves.orbit(2 * math.pi * minutes, duration=duration)  # One turn per minute
+    moves.fly_to((0, -4, 2), duration=60)
+
+    keyframes = sum(len(fc.keyframe_points)
+                    for obj in (camera.camera, camera.target) if obj.animation_data
+                    for fc in obj.animation_data.action.fcurves)
+    print(f"{duration}-frame orbit, timeline ends at {scene.frame_end}: {keyframes} keyframes")
+
+    # Playback speed of the camera rig alone
+    frames = range(scene.frame_start, scene.frame_start + 600)
+    start = time.perf_counter()
+    for frame in frames:
+        scene.frame_set(frame)
+    print(f"Playback: {len(frames) / (time.perf_counter() - start):.0f} fps")
+
+if __name__ == "__main__":
+    build_orbit()
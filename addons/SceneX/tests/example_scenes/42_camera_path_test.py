@@ -0,0 +1,42 @@
+# SceneX/tests/example_scenes/42_camera_path_test.py
+
+import bpy
+import os
+import sys
+import time
+
+# Add parent directory to path to find SceneX package
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(os.path.dirname(script_dir))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from src.animation.rate_functions import RateFunc
+from src.camera.camera import CameraSystem
+from src.camera.movements import CameraMovement
+from src.camera.paths import CameraPath
+
+WAYPOINTS = [(8, -8, 4), (10, 2, 3), (2, 10, 6), (-8, 6, 2), (-6, -8, 5)]
+LOOK_AT = [(0, 0, 0), (1, 1, 0), (0, 2, 1), (-1, 0, 0), (0, 0, 0)]
+
+def build_path():
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+    bpy.ops.mesh.primitive_monkey_add()
+    bpy.context.scene.frame_current = 1
+
+    camera = CameraSystem()
+    moves = CameraMovement(camera)
+
+    start = time.perf_counter()
+    path = CameraPath(WAYPOINTS, LOOK_AT)
+    positions, _ = path.sample(10000, RateFunc.ease_in_out)
+    print(f"Path length {path.length:.2f}, 10000 samples in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    # Eased fly-through keyed sparsely, then a constant-speed follow-path rig
+    moves.fly_through(WAYPOINTS, LOOK_AT, duration=240, rate_func=RateFunc.ease_in_out)
+    second = CameraSystem()
+    CameraPath(WAYPOINTS[::-1]).follow_path(second, 1, 240)
+
+if __name__ == "__main__":
+    build_path()
@@ -0,0 +1,60 @@
+# SceneX/tests/example_scenes/43_auto_framing_test.py
+
+import bpy
+import os
+import sys
+import time
+import numpy as np
+
+# Add parent directory to path to find SceneX package
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(os.path.dirname(script_dir))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from src.camera.camera import CameraSystem
+from src.camera.movements import CameraMovement
+
+def build_scene(count=10000, animated=50):
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+    scene = bpy.context.scene
+    scene.frame_start, scene.frame_end = 1, 600
+
+    # Objects share one mesh; a few fly outwards at staggered times
+    mesh = bpy.data.meshes.new("cell")
+    mesh.from_pydata([(-.1, -.1, 0), (.1, -.1, 0), (.1, .1, 0), (-.1, .1, 0)], [], [(0, 1, 2, 3)])
+    rng = np.random.default_rng(0)
+    for i, position in enumerate(rng.uniform(-5, 5, size=(count, 3)) * (1, 1, 0.1)):
+        obj = bpy.data.objects.new(f"cell_{i}", mesh)
+        obj.location = position
+        scene.collection.objects.link(obj)
+        if i < animated:
+            start = int(rng.integers(1, 400))
+            obj.keyframe_insert(data_path="location", frame=start)
+            obj.location = position * 3
+            obj.keyframe_insert(data_path="location", frame=start + 120)
+
+    # A moon on a spinning pivot is back where it started at both keys
+    pivot = bpy.data.objects.new("pivot", None)
+    scene.collection.objects.link(pivot)
+    pivot.keyframe_insert(data_path="rotation_euler", frame=1)
+    pivot.rotation_euler.z = 2 * np.pi
+    pivot.keyframe_insert(data_path="rotation_euler", frame=600)
+    moon = bpy.data.objects.new("moon", mesh)
+    moon.location = (12, 0, 0)
+    moon.parent = pivot
+    scene.collection.objects.link(moon)
+
+def frame_scene():
+    build_scene()
+    camera = CameraSystem()
+    camera.camera.data.type = 'ORTHO'
+    moves = CameraMovement(camera)
+
+    start = time.perf_counter()
+    keys = moves.frame_all()
+    print(f"Framed 10000 objects in {time.perf_counter() - start:.2f}s with {keys} keyframes")
+
+if __name__ == "__main__":
+    frame_scene()
@@ -0,0 +1,55 @@
+# SceneX/tests/example_scenes/44_frustum_culling_test.py
+
+import bpy
+import os
+import sys
+import tempfile
+import time
+from mathutils import Vector
+
+# Add parent directory to path to find SceneX package
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(os.path.dirname(script_dir))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from src.camera.culling import FrustumCuller
+from src.camera.movements import CameraMovement
+from src.templates.educational import PresentationScene
+
+class CulledPresentation(PresentationScene):
+    def construct(self, slides=12, spacing=20.0):
+        bpy.ops.object.select_all(action='SELECT')
+        bpy.ops.object.delete()
+        self.camera.setup()
+        scene = bpy.context.scene
+        scene.frame_current = 1
+
+        # Slides side by side; the camera pans from one to the next
+        for i in range(slides):
+            slide = self.add_slide(f"Slide {i + 1}", [f"Point {j + 1} of slide {i + 1}" for j in range(6)])
+            for obj in slide.get_all_objects():
+                obj.location.x += i * spacing
+        moves = CameraMovement(self.camera)
+        for i in range(1, slides):
+            moves.fly_to(Vector((i * spacing, -10, 8)), Vector((i * spacing, 0, 0)), duration=20)
+            moves.wait(40)  # Hold on the slide
+
+    def render_time(self, frames):
+        scene = bpy.context.scene
+        scene.render.filepath = os.path.join(tempfile.gettempdir(), "scenex_cull_")
+        start = time.perf_counter()
+        for frame in frames:
+            scene.frame_set(frame)
+            bpy.ops.render.render(write_still=False)
+        return time.perf_counter() - start
+
+if __name__ == "__main__":
+    presentation = CulledPresentation()
+    presentation.construct()
+    frames = range(1, bpy.context.scene.frame_end + 1, 60)
+    before = presentation.render_time(frames)
+    stats = FrustumCuller().run()
+    after = presentation.render_time(frames)
+    print(f"Culled {stats['culled_object_frames']} of {stats['object_frames']} object-frames "
+          f"({stats['culled_fraction']:.0%}); render {before:.2f}s -> {after:.2f}s")
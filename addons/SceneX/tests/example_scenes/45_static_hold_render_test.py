@@ -0,0 +1,67 @@
+# SceneX/tests/example_scenes/45_static_hold_render_test.py
+
+import bpy
+import os
+import sys
+import tempfile
+import numpy as np
+from mathutils import Vector
+
+# Add parent directory to path to find SceneX package
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(os.path.dirname(script_dir))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from src.camera.movements import CameraMovement
+from src.render.holds import HoldRenderer, hold_runs
+from src.templates.educational import PresentationScene
+from src.templates.mathematical import MathematicalScene
+
+def clear():
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+    bpy.context.scene.frame_current = 1
+
+def presentation():
+    """Slides with camera pans between 60-frame holds"""
+    clear()
+    scene = PresentationScene()
+    scene.camera.setup()
+    for i in range(4):
+        slide = scene.add_slide(f"Slide {i + 1}", [f"Point {j + 1}" for j in range(3)])
+        for obj in slide.get_all_objects():
+            obj.location.x += i * 20
+    moves = CameraMovement(scene.camera)
+    for i in range(1, 4):
+        moves.wait(60)
+        moves.fly_to(Vector((i * 20, -10, 8)), Vector((i * 20, 0, 0)), duration=20)
+    moves.wait(60)
+
+def surface():
+    """A surface animated for 60 frames, then held"""
+    clear()
+    scene = MathematicalScene()
+    plot = scene.add_heightfield(lambda x, y, t: np.sin(x + t) * np.cos(y), resolution=(60, 60))
+    plot.animate(1, 60, t_range=(0, 3), shape_keys=8)
+    bpy.context.scene.frame_end = 240
+
+def report(name):
+    scene = bpy.context.scene
+    renderer = HoldRenderer()
+    runs = hold_runs(renderer.signatures(scene.frame_start, scene.frame_end))
+    frames = scene.frame_end - scene.frame_start + 1
+    print(f"{name}: {frames} frames, {len(runs)} distinct, {(frames - len(runs)) / frames:.0%} skippable")
+
+if __name__ == "__main__":
+    presentation()
+    report("PresentationScene")
+    surface()
+    report("MathematicalScene")
+
+    # Render the held tail of the surface scene, encoded from the concat list
+    bpy.context.scene.render.resolution_percentage = 25
+    output = os.path.join(tempfile.gettempdir(), "scenex_holds", "frame_####")
+    stats = HoldRenderer(output, mode='concat').render(50, 120)
+    print(f"Rendered {stats['rendered']} of {stats['frames']} frames; "
+          f"ffmpeg -f concat -i {stats['concat_list']} -vsync vfr out.mp4")